@@ -0,0 +1,44 @@
+from __future__ import print_function
+import time
+import pyxb
+import tmstvd
+
+# Compare the time to convert the sample document to bindings and back with
+# full validation, with validation disabled, and with trusted content.  Run
+# genbindings.sh first to obtain the bindings and the sample document.
+
+xml_file = 'tmsdatadirect_sample.xml'
+num_reps = 3
+
+xmld = open(xml_file, 'rb').read()
+vc = pyxb.GlobalValidationConfig
+
+modes = (
+    ('validating', True, False),
+    ('unvalidated', False, False),
+    ('trusted', True, True),
+)
+
+documents = {}
+for (name, validate, trusted) in modes:
+    vc._setForBinding(validate)
+    vc._setForDocument(validate)
+    vc._setTrustedContent(trusted)
+    best_parse = best_gen = None
+    for _ in range(num_reps):
+        t0 = time.time()
+        instance = tmstvd.CreateFromDocument(xmld)
+        t1 = time.time()
+        documents[name] = instance.toxml('utf-8')
+        t2 = time.time()
+        if (best_parse is None) or ((t1 - t0) < best_parse):
+            best_parse = t1 - t0
+        if (best_gen is None) or ((t2 - t1) < best_gen):
+            best_gen = t2 - t1
+    print('%-12s parse %f, generate %f' % (name, best_parse, best_gen))
+vc._setForBinding(True)
+vc._setForDocument(True)
+vc._setTrustedContent(False)
+
+for (name, _, _) in modes[1:]:
+    print('%s output matches validating output: %s' % (name, documents[name] == documents['validating']))
@@ -122,12 +122,21 @@ XMLStyle_saxdom.  However, since the pyxb.xmlschema.structures classes require
 a DOM model, XMLStyle_saxdom will be used for pyxb.utils.domutils.StringToDOM
 if this style is selected."""
 
+XMLStyle_expat = 3
+"""As with XMLStyle_saxer, but the SAX events are delivered to the content
+handler directly from pyexpat by L{pyxb.utils.saxutils.ExpatParser} rather than
+through xml.sax.expatreader.  This is the fastest style that produces binding
+instances with location information.  L{pyxb.utils.saxutils.make_parser} uses
+the same parser for pyxb.utils.domutils.StringToDOM when this style is
+selected."""
+
 _XMLStyle = XMLStyle_saxer
 """The current XML processing style."""
 
 _XMLStyleMap = { 'minidom' : XMLStyle_minidom,
                  'saxdom' : XMLStyle_saxdom,
-                 'saxer' : XMLStyle_saxer }
+                 'saxer' : XMLStyle_saxer,
+                 'expat' : XMLStyle_expat }
 _XMLStyleMapReverse = dict([ (_v, _k) for (_k, _v) in six.iteritems(_XMLStyleMap) ])
 
 _XMLStyle_envvar = 'PYXB_XML_STYLE'
@@ -137,10 +146,11 @@ def _SetXMLStyle (style=None):
 
     This can be invoked within code.  The system default of L{XMLStyle_saxer}
     can also be overridden at runtime by setting the environment variable
-    C{PYXB_XML_STYLE} to one of C{minidom}, C{saxdom}, or C{saxer}.
+    C{PYXB_XML_STYLE} to one of C{minidom}, C{saxdom}, C{saxer}, or C{expat}.
 
     @param style: One of L{XMLStyle_minidom}, L{XMLStyle_saxdom},
-    L{XMLStyle_saxer}.  If not provided, the system default is used.
+    L{XMLStyle_saxer}, L{XMLStyle_expat}.  If not provided, the system default
+    is used.
     """
     global _XMLStyle
     if style is None:
@@ -197,6 +207,9 @@ class ValidationConfig (object):
     L{invalidElementInContent} control how
     L{pyxb.binding.basis.complexTypeDefinition.orderedContent} affects
     generated documents.
+
+    L{trustedContent} bypasses the content model for content known to be
+    valid.
     """
 
     __forBinding = True
@@ -302,6 +315,37 @@ class ValidationConfig (object):
         self.__invalidElementInContent = value
     invalidElementInContent = property(__getInvalidElementInContent)
 
+    __trustedContent = False
+    def __getTrustedContent (self):
+        """C{True} iff element content is trusted to be valid.
+
+        When trusted, element content converted from a document, as from a
+        producer known to generate valid documents, is stored without
+        consulting the content model.  Content appended from Python is still
+        placed by the content model.  Each
+        element is still recorded with its declaration in
+        L{orderedContent<pyxb.binding.basis.complexTypeDefinition.orderedContent>},
+        and documents are generated from that list, so a document converted
+        to bindings and back retains its element order.  If element values
+        are subsequently changed, documents are generated from the element
+        values as when content is not trusted.  Unlike disabling
+        L{forBinding}, values are still converted to the types of their
+        elements.
+
+        No error is detected if the content does not satisfy the content
+        model.  L{validateBinding<pyxb.binding.basis._TypeBinding_mixin.validateBinding>}
+        may be used to check it explicitly.
+
+        The default is C{False}."""
+        return self.__trustedContent
+    def _setTrustedContent (self, value):
+        """Set the value of L{trustedContent}."""
+        if not isinstance(value, bool):
+            raise TypeError(value)
+        self.__trustedContent = value
+        return value
+    trustedContent = property(__getTrustedContent)
+
     def copy (self):
         """Make a copy of this instance.
 
@@ -383,6 +427,35 @@ def PreserveInputTimeZone (value=None):
     _PreserveInputTimeZone = value
     return _PreserveInputTimeZone
 
+_TrackParseLocations = True
+def TrackParseLocations (value=None):
+    """Control whether parsing records the document location of each node.
+
+    By default every element and text event processed by the SAX handlers
+    is associated with a L{pyxb.utils.utility.Location}, and binding
+    instances retain the location of the element from which they were
+    created.  Locations are rarely used except when diagnosing a validation
+    failure, so this option allows them to be discarded to save time and
+    memory.  When disabled, a validation error raised while parsing still
+    carries the line number at which it was detected.
+
+    The setting may be overridden for a single parse using the
+    C{track_locations} keyword of L{pyxb.utils.saxutils.make_parser} and the
+    generated C{CreateFromDocument} functions.
+
+    @keyword value: If absent or C{None}, no change is made; otherwise,
+    this enables (C{True}) or disables (C{False}) location tracking.
+    @type value: C{bool}
+
+    @return: C{True} iff locations are recorded during parsing."""
+    global _TrackParseLocations
+    if value is None:
+        return _TrackParseLocations
+    if not isinstance(value, bool):
+        raise TypeError(value)
+    _TrackParseLocations = value
+    return _TrackParseLocations
+
 _OutputEncoding = 'utf-8'
 """Default unicode encoding to use when creating output.
 
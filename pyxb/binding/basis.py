@@ -671,6 +671,10 @@ class _DynamicCreate_mixin (pyxb.cscRoot):
             cls.__dict__.pop(cls.__SupersedingClassAttribute(), None)
         else:
             setattr(cls, cls.__SupersedingClassAttribute(), superseding)
+        # Cached element dispatch information records the superseded class
+        element._ResetDispatchMaps()
+        simpleTypeDefinition._ResetLexicalConstructors()
+        simpleTypeDefinition._ResetInternedValues()
         return superseding
 
     @classmethod
@@ -683,6 +687,8 @@ class _DynamicCreate_mixin (pyxb.cscRoot):
             # ends up converting it from a function to an unbound method,
             # which is not what we want.
             setattr(cls, attr, (alternative_constructor,))
+        simpleTypeDefinition._ResetLexicalConstructors()
+        simpleTypeDefinition._ResetInternedValues()
         assert cls._AlternativeConstructor() == alternative_constructor
         return alternative_constructor
 
@@ -733,7 +739,7 @@ class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin
     _ReservedSymbols = _TypeBinding_mixin._ReservedSymbols.union(set([ 'XsdLiteral', 'xsdLiteral',
                             'XsdSuperType', 'XsdPythonType', 'XsdConstraintsOK',
                             'xsdConstraintsOK', 'XsdValueLength', 'xsdValueLength',
-                            'PythonLiteral', 'pythonLiteral',
+                            'PythonLiteral', 'pythonLiteral', 'PrepareConstraints',
                             'SimpleTypeDefinition' ]))
     """Symbols that remain the responsibility of this class.  Any
     public symbols in generated binding subclasses are deconflicted
@@ -960,6 +966,91 @@ class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin
         if validate_constraints and not kw.pop('_nil', False):
             self.xsdConstraintsOK(location)
 
+    # Classes other than simpleTypeDefinition that may appear in the
+    # hierarchy of a class constructed by _FromLexical without affecting how
+    # instances are created.
+    __LexicalNeutralClasses = frozenset([ _TypeBinding_mixin, utility.Locatable_mixin, _DynamicCreate_mixin, pyxb.cscRoot, object ])
+
+    # Python types from which _FromLexical can construct instances directly.
+    __LexicalBaseTypes = frozenset(six.integer_types + (float, six.text_type, six.binary_type))
+
+    # Methods that, if overridden, require the general construction path.
+    __LexicalConstructionMethods = ( '__new__', '__init__', 'Factory', '_DynamicCreate',
+                                     '_PreFactory_vx', '_postFactory_vx', '_ConvertArguments' )
+
+    # Map from class to the class instantiated by _FromLexical, or to None if
+    # the class must be constructed through Factory.
+    __LexicalConstructor = { }
+
+    @classmethod
+    def _ResetLexicalConstructors (cls):
+        """Discard the cached results of L{_FromLexical} eligibility.
+
+        This is invoked when a superseding class or alternative constructor
+        changes."""
+        cls.__LexicalConstructor.clear()
+
+    @classmethod
+    def __FindLexicalConstructor (cls):
+        if cls._AlternativeConstructor() is not None:
+            return None
+        used_cls = cls._SupersedingClass()
+        base_type = None
+        for clazz in used_cls.__mro__:
+            if (clazz is simpleTypeDefinition) or (clazz in cls.__LexicalNeutralClasses):
+                continue
+            if clazz in cls.__LexicalBaseTypes:
+                if base_type is None:
+                    base_type = clazz
+                continue
+            for m in cls.__LexicalConstructionMethods:
+                if m in clazz.__dict__:
+                    return None
+        if base_type is None:
+            return None
+        return used_cls
+
+    @classmethod
+    def _FromLexical (cls, text, element=None, location=None):
+        """Create an instance of this type from its lexical representation.
+
+        This produces the same instance as C{cls.Factory(text,
+        _from_xml=True, _element=element)}, but where the class permits it
+        the whitespace facet, argument conversion, and constraint validation
+        are each applied once, without the keyword processing performed by
+        the general constructors.  Classes with customized construction,
+        such as unions, lists, and types with their own C{__new__}, use
+        L{Factory}.
+
+        @param text: the text content of an element or attribute
+        @keyword element: the L{element} with which the instance is
+        associated, if any
+        @keyword location: the location of C{text}, used in validation errors
+        @raise pyxb.SimpleTypeValueError: if C{text} is not a valid
+        representation of a value of this type
+        """
+        used_cls = cls.__LexicalConstructor.get(cls, False)
+        if used_cls is False:
+            used_cls = cls.__FindLexicalConstructor()
+            cls.__LexicalConstructor[cls] = used_cls
+        if used_cls is None:
+            kw = { '_from_xml' : True, '_location' : location }
+            if element is not None:
+                kw['_element'] = element
+            return cls.Factory(text, **kw)
+        cf_whitespace = getattr(used_cls, '_CF_whiteSpace', None)
+        if cf_whitespace is not None:
+            text = six.text_type(cf_whitespace.normalizeString(text))
+        try:
+            args = used_cls._ConvertArguments_vx((text,), { '_from_xml' : True })
+            rv = super(simpleTypeDefinition, used_cls).__new__(used_cls, *args)
+        except (ValueError, OverflowError, TypeError):
+            raise pyxb.SimpleTypeValueError(used_cls, (text,), location)
+        super(simpleTypeDefinition, rv).__init__(*args, _element=element)
+        if rv._validationConfig_.forBinding:
+            rv.xsdConstraintsOK(location)
+        return rv
+
     # The class attribute name used to store the reference to the STD
     # component instance must be unique to the class, not to this base class.
     # Otherwise we mistakenly believe we've already associated a STD instance
@@ -1039,47 +1130,174 @@ class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin
         super_fn = getattr(super(simpleTypeDefinition, cls), '_XsdConstraintsPreCheck_vb', lambda *a,**kw: value)
         return super_fn(value)
 
-    # Cache of pre-computed sequences of class facets in the order required
-    # for constraint validation
-    __ClassFacetSequence = { }
+    # Cache of functions that check values against the class facets, compiled
+    # from the facets in the order required for constraint validation
+    __ClassConstraintChecker = { }
+
+    # Shared instances of enumeration values, keyed by class and then by the
+    # lexical representation of the value
+    __ClassInternedValues = { }
+
+    @classmethod
+    def _ResetConstraintCheckers (cls, classes=None):
+        """Discard compiled constraint checkers and interned enumeration
+        values.
+
+        This must be invoked when a facet that may already have been used to
+        validate a value is changed.
+
+        @param classes: the classes whose cached state is discarded.  By
+        default the state of all classes is discarded."""
+        if classes is None:
+            cls.__ClassConstraintChecker.clear()
+            cls.__ClassInternedValues.clear()
+            return
+        for clazz in classes:
+            cls.__ClassConstraintChecker.pop(clazz, None)
+            cls.__ClassInternedValues.pop(clazz, None)
+
+    @classmethod
+    def _ResetInternedValues (cls):
+        """Discard the interned enumeration values of all classes.
+
+        This is invoked when a superseding class or alternative constructor
+        changes, since the interned values are instances of the class that
+        was in use when they were collected."""
+        cls.__ClassInternedValues.clear()
+
+    @classmethod
+    def _InternedValue (cls, text):
+        """Return the shared instance of an enumeration value of this class.
+
+        The instances are those held by the L{enumeration
+        facet<pyxb.binding.facets.CF_enumeration>} of the class, and are
+        identical to the enumeration constants of the binding module.  Only
+        values that are instances of this class (not a subclass or member
+        type), that are immutable, and that satisfy all its constraints are
+        shared.  Values of list types are therefore never shared.
+
+        Because the instance is shared, it must not be given per-occurrence
+        state such as an element or location.  It is used for attribute
+        values, which carry no such state.
+
+        @param text: the lexical representation of the value, prior to
+        whitespace normalization
+        @return: the shared instance, or C{None} if C{text} is not the
+        lexical representation of an enumeration value of this class
+        """
+        table = cls.__ClassInternedValues.get(cls)
+        if table is None:
+            from pyxb.binding import facets
+            try:
+                enumeration = cls._FacetMap().get(facets.CF_enumeration)
+            except AttributeError:
+                # Facets not yet initialized; do not cache
+                return None
+            table = { }
+            used_cls = cls._SupersedingClass()
+            if enumeration is not None:
+                enumeration._addDependentClass(cls)
+                for ee in six.iteritems(enumeration):
+                    value = ee.value()
+                    if type(value) is not used_cls:
+                        continue
+                    # Mutable values, such as those of list types, cannot be
+                    # shared
+                    try:
+                        hash(value)
+                    except TypeError:
+                        continue
+                    try:
+                        cls.XsdConstraintsOK(value)
+                    except pyxb.SimpleTypeValueError:
+                        continue
+                    table[ee.unicodeValue()] = value
+            cls.__ClassInternedValues[cls] = table
+        return table.get(text)
+
+    @classmethod
+    def _ConstraintChecker (cls):
+        """Return the compiled constraint checker for this class.
+
+        @return: the function created by
+        L{pyxb.binding.facets.CompileConstraintChecker}, or C{None} if the
+        facets of the class or an ancestor have not yet been initialized
+        """
+        checker = cls.__ClassConstraintChecker.get(cls)
+        if checker is not None:
+            return checker
+        # Constraints for simple type definitions are inherited.  Check them
+        # from least derived to most derived.
+        classes = [ _x for _x in cls.mro() if issubclass(_x, simpleTypeDefinition) ]
+        classes.reverse()
+        facet_values = []
+        for clazz in classes:
+            # When setting up the datatypes, if we attempt to validate
+            # something before the facets have been initialized (e.g., a
+            # nonNegativeInteger used as a length facet for the parent
+            # integer datatype), there is nothing to compile yet.
+            try:
+                clazz_facets = list(six.itervalues(clazz._FacetMap()))
+            except AttributeError:
+                return None
+            for v in clazz_facets:
+                if not (v in facet_values):
+                    facet_values.append(v)
+        from pyxb.binding import facets
+        checker = facets.CompileConstraintChecker(facet_values)
+        for v in facet_values:
+            if isinstance(v, facets._CollectionFacet_mixin):
+                v._addDependentClass(cls)
+        cls.__ClassConstraintChecker[cls] = checker
+        return checker
+
+    @classmethod
+    def PrepareConstraints (cls):
+        """Compile the constraints of this class ahead of first use.
+
+        This is done automatically the first time a value is validated.
+        Applications that want to avoid that cost during processing, for
+        example because a pattern facet would have to be compiled, may invoke
+        this for each type of interest during startup.
+
+        @return: C{True} if the constraints were compiled, C{False} if the
+        class facets have not yet been initialized
+        """
+        return cls._ConstraintChecker() is not None
 
     @classmethod
     def XsdConstraintsOK (cls, value, location=None):
         """Validate the given value against the constraints on this class.
 
+        On first use the facets of the class, including inherited facets,
+        are compiled into a single checker by
+        L{pyxb.binding.facets.CompileConstraintChecker}.
+
         @raise pyxb.SimpleTypeValueError: if any constraint is violated.
         """
 
         value = cls._XsdConstraintsPreCheck_vb(value)
 
-        facet_values = cls.__ClassFacetSequence.get(cls)
-        if facet_values is None:
-            # Constraints for simple type definitions are inherited.  Check them
-            # from least derived to most derived.
-            classes = [ _x for _x in cls.mro() if issubclass(_x, simpleTypeDefinition) ]
-            classes.reverse()
-            cache_result = True
-            facet_values = []
-            for clazz in classes:
-                # When setting up the datatypes, if we attempt to validate
-                # something before the facets have been initialized (e.g., a
-                # nonNegativeInteger used as a length facet for the parent
-                # integer datatype), just ignore that for now.  Don't cache
-                # the value, though, since a subsequent check after
-                # initialization should succceed.
-                try:
-                    clazz_facets = list(six.itervalues(clazz._FacetMap()))
-                except AttributeError:
-                    cache_result = False
-                    clazz_facets = []
-                for v in clazz_facets:
-                    if not (v in facet_values):
-                        facet_values.append(v)
-            if cache_result:
-                cls.__ClassFacetSequence[cls] = facet_values
-        for f in facet_values:
-            if not f.validateConstraint(value):
-                raise pyxb.SimpleFacetValueError(cls, value, f, location)
+        checker = cls.__ClassConstraintChecker.get(cls)
+        if checker is None:
+            checker = cls._ConstraintChecker()
+            if checker is None:
+                # Facets are still being initialized.  Ignore constraints
+                # that are not yet available, and do not cache the result,
+                # since a subsequent check after initialization should
+                # succeed.
+                for clazz in reversed([ _x for _x in cls.mro() if issubclass(_x, simpleTypeDefinition) ]):
+                    try:
+                        clazz_facets = list(six.itervalues(clazz._FacetMap()))
+                    except AttributeError:
+                        continue
+                    for f in clazz_facets:
+                        if not f.validateConstraint(value):
+                            raise pyxb.SimpleFacetValueError(cls, value, f, location)
+                return value
+        f = checker(value)
+        if f is not None:
+            raise pyxb.SimpleFacetValueError(cls, value, f, location)
         return value
 
     def xsdConstraintsOK (self, location=None):
@@ -1791,6 +2009,58 @@ class element (utility._DeconflictSymbols_mixin, _DynamicCreate_mixin):
             return named_elt
         return None
 
+    # Map from (namespace, local name) to the dispatch tuple for the
+    # corresponding global element.
+    __GlobalDispatchMap = {}
+
+    @classmethod
+    def _DispatchForName (cls, element_name, element_binding, element_decl=None):
+        """Complete the resolution of an element name for L{_GlobalDispatchForName} and
+        L{complexTypeDefinition._ElementDispatchForName}.
+
+        @return: C{( element_binding, element_decl, type_class, is_ctd )}"""
+        if (element_decl is not None) and (element_binding is None):
+            element_binding = element_decl.elementBinding()
+        type_class = None
+        if element_binding is not None:
+            element_binding = element_binding.elementForName(element_name)
+            if element_binding is not None:
+                type_class = element_binding.typeDefinition()
+        is_ctd = (type_class is not None) and issubclass(type_class, complexTypeDefinition)
+        return (element_binding, element_decl, type_class, is_ctd)
+
+    @classmethod
+    def _GlobalDispatchForName (cls, element_name):
+        """Determine what the given name means as a top-level element.
+
+        This is used when parsing documents.  Successful resolutions are
+        cached, so subsequent lookups require a single dictionary access.
+
+        @param element_name: A L{pyxb.namespace.ExpandedName}
+        @return: C{( element_binding, element_decl, type_class, is_ctd )}
+        where C{element_decl} is always C{None}, C{element_binding} is
+        C{None} if the name does not identify a known element, C{type_class}
+        is the binding class for the element content, and C{is_ctd} is
+        C{True} iff C{type_class} is a subclass of
+        L{complexTypeDefinition}."""
+        key = (element_name.namespace(), element_name.localName())
+        rv = cls.__GlobalDispatchMap.get(key)
+        if rv is None:
+            rv = cls._DispatchForName(element_name, element_name.elementBinding())
+            # Do not cache failures: a module defining the element may be
+            # loaded later.
+            if rv[0] is not None:
+                cls.__GlobalDispatchMap[key] = rv
+        return rv
+
+    @classmethod
+    def _ResetDispatchMaps (cls):
+        """Discard cached element name resolutions.
+
+        This is invoked when the class used for a binding changes."""
+        cls.__GlobalDispatchMap.clear()
+        complexTypeDefinition._ResetElementDispatchMaps()
+
     def createFromDOM (self, node, fallback_namespace=None, **kw):
         """Create an instance of this element using a DOM node as the source
         of its content.
@@ -2186,6 +2456,38 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
             order.append(ElementContent(value, ed))
         return order
 
+    def __orderedContentMatchesElements (self):
+        """Determine whether the ordered content holds exactly the element
+        values of this instance.
+
+        This holds for content stored while L{trusted
+        content<pyxb.ValidationConfig.trustedContent>} is enabled, but not
+        once element values have been assigned or modified directly.
+        """
+        ordered = { }
+        for content in self.__content:
+            if isinstance(content, NonElementContent):
+                continue
+            ordered.setdefault(content.elementDeclaration, []).append(content.value)
+        expected = [ (None, self.__wildcardElements or []) ]
+        for ed in six.itervalues(self._ElementMap):
+            value = ed.value(self)
+            if value is None:
+                value = []
+            elif ed.isPlural():
+                value = list(value)
+            else:
+                value = [ value ]
+            expected.append((ed, value))
+        for (ed, values) in expected:
+            found = ordered.pop(ed, [])
+            if len(found) != len(values):
+                return False
+            for (v1, v2) in zip(found, values):
+                if v1 is not v2:
+                    return False
+        return 0 == len(ordered)
+
     def _validatedChildren (self):
         """Provide the child elements and non-element content in an order
         consistent with the content model.
@@ -2199,12 +2501,55 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
         If the content of the instance does not validate against the content
         model, an exception is raised.
 
+        The result is retained and reused until the content of the instance
+        changes.
+
         @return: C{None} or a list as described above.
         """
         if self._ContentTypeTag in (self._CT_EMPTY, self._CT_SIMPLE):
             return []
+        (state, members) = self.__contentSignature()
+        cached = self.__validatedChildren
+        if (cached is not None) and (cached[0] == state) and (len(cached[1]) == len(members)):
+            if all(_m1 is _m2 for (_m1, _m2) in zip(cached[1], members)):
+                return cached[2]
+        self.__validatedChildren = None
         self._resetAutomaton()
-        return self.__automatonConfiguration.sequencedChildren()
+        order = self.__automatonConfiguration.sequencedChildren()
+        self.__validatedChildren = (state, members, order)
+        return order
+
+    # A triple holding the signature of the content for which
+    # _validatedChildren was last calculated, and its result.
+    __validatedChildren = None
+
+    def __contentSignature (self):
+        # Capture everything that _validatedChildren depends on.  The
+        # members are the ordered content, wildcard elements, and element
+        # values, which are compared by identity and are kept alive by the
+        # signature.  The state holds the relevant validation configuration
+        # and the lengths and mutation counts of the lists, which are
+        # compared by value.  Plural element values that are plain lists
+        # rather than content._PluralBinding instances have no mutation count
+        # so their members are included.
+        vc = self._validationConfig
+        state = [ vc.contentInfluencesGeneration, vc.orphanElementInContent, vc.invalidElementInContent, len(self.__content) ]
+        members = self.__content[:]
+        wce = self.__wildcardElements
+        if wce is not None:
+            state.append(len(wce))
+            members.extend(wce)
+        for eu in six.itervalues(self._ElementMap):
+            value = eu.value(self)
+            members.append(value)
+            if isinstance(value, list):
+                state.append(len(value))
+                members.extend(value)
+                continue
+            mutation_count = getattr(value, '_mutationCount', None)
+            if mutation_count is not None:
+                state.append(mutation_count())
+        return (state, members)
 
     def _symbolSet (self):
         """Return a map from L{content.ElementDeclaration} instances to a list of
@@ -2393,6 +2738,22 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
             nv = []
         return self.__setContent(nv)
 
+    # True if element content was stored without stepping the content model
+    # automaton, as is done for trusted content.
+    __unsteppedContent = False
+
+    def __stepStoredContent (self, location):
+        # Bring the automaton to the state reached by the stored content,
+        # without storing it again, so further content can be placed by the
+        # content model.
+        cfg = self._resetAutomaton()
+        for content in self.__content:
+            if isinstance(content, NonElementContent):
+                continue
+            if 0 == cfg.step(content.value, content.elementDeclaration, detach=True):
+                raise pyxb.UnrecognizedContentError(self, cfg, content.value, location)
+        self.__unsteppedContent = False
+
     __automatonConfiguration = None
     def _resetAutomaton (self):
         if self._Automaton is not None:
@@ -2422,6 +2783,7 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
         for au in six.itervalues(self._AttributeMap):
             au.reset(self)
         self._resetAutomaton()
+        self.__unsteppedContent = False
         return self
 
     @classmethod
@@ -2463,6 +2825,45 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
             element_binding = element_decl.elementBinding()
         return (element_binding, element_decl)
 
+    # Map from complexTypeDefinition subclasses to a map from (namespace,
+    # local name) to the dispatch tuple for the corresponding child element.
+    __ElementDispatchMaps = {}
+
+    @classmethod
+    def _ElementDispatchForName (cls, element_name):
+        """Determine what the given name means as a child element in this type.
+
+        This extends L{_ElementBindingDeclForName} with the additional
+        information required when parsing documents.  Successful resolutions
+        are cached per class, so subsequent lookups require a single
+        dictionary access.
+
+        @param element_name: A L{pyxb.namespace.ExpandedName}
+        @return: C{( element_binding, element_decl, type_class, is_ctd )}
+        where C{element_binding} and C{element_decl} are as with
+        L{_ElementBindingDeclForName} except that the binding has been
+        resolved through L{element.elementForName}, C{type_class} is the
+        binding class for the element content, and C{is_ctd} is C{True} iff
+        C{type_class} is a subclass of L{complexTypeDefinition}."""
+        dmap = cls.__ElementDispatchMaps.get(cls)
+        if dmap is None:
+            dmap = cls.__ElementDispatchMaps[cls] = {}
+        key = (element_name.namespace(), element_name.localName())
+        rv = dmap.get(key)
+        if rv is None:
+            (element_binding, element_decl) = cls._ElementBindingDeclForName(element_name)
+            rv = element._DispatchForName(element_name, element_binding, element_decl)
+            # Do not cache failures: a module defining the element may be
+            # loaded later.
+            if rv[0] is not None:
+                dmap[key] = rv
+        return rv
+
+    @classmethod
+    def _ResetElementDispatchMaps (cls):
+        """Discard cached resolutions from L{_ElementDispatchForName}."""
+        cls.__ElementDispatchMaps.clear()
+
     def append (self, value, **kw):
         """Add the value to the instance.
 
@@ -2484,6 +2885,9 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
         fallback_namespace = kw.get('_fallback_namespace', None)
         require_validation = kw.get('_require_validation', self._validationConfig.forBinding)
         from_xml = kw.get('_from_xml', False)
+        # Content that is validated against the content model but not stored,
+        # e.g. elements streamed out of a document by the SAX parser.
+        detach = kw.get('_detach', False)
         element_binding = None
         if element_decl is not None:
             from pyxb.binding import content
@@ -2530,17 +2934,25 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
             if (0 == len(value.strip())) and not self._isNil():
                 return self
         if maybe_element and (self.__automatonConfiguration is not None):
-            # Allows element content.
-            if not require_validation:
+            # Allows element content.  Trusted content is content from a
+            # document, identified by its declaration or its origin.
+            trusted = self._validationConfig.trustedContent and ((element_decl is not None) or from_xml)
+            if (not require_validation) or trusted:
+                if trusted:
+                    self.__unsteppedContent = True
                 if element_decl is not None:
-                    element_decl.setOrAppend(self, value)
+                    if not detach:
+                        element_decl.setOrAppend(self, value)
                     return self
                 if self.__wildcardElements is not None:
-                    self._appendWildcardElement(value)
+                    if not detach:
+                        self._appendWildcardElement(value)
                     return self
                 raise pyxb.StructuralBadDocumentError(container=self, content=value)
+            if self.__unsteppedContent:
+                self.__stepStoredContent(location)
             # Attempt to place the value based on the content model
-            num_cand = self.__automatonConfiguration.step(value, element_decl)
+            num_cand = self.__automatonConfiguration.step(value, element_decl, detach)
             if 1 <= num_cand:
                 # Resolution was successful (possibly non-deterministic)
                 return self
@@ -2642,9 +3054,11 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
     def _postDOMValidate (self):
         # It's probably finalized already, but just in case...
         self._finalizeContentModel()
-        if self._validationConfig.forBinding:
-            # @todo isNil should verify that no content is present.
-            if (not self._isNil()) and (self.__automatonConfiguration is not None):
+        vc = self._validationConfig
+        if vc.forBinding:
+            # @todo isNil should verify that no content is present.  Trusted
+            # content was not presented to the automaton.
+            if (not self._isNil()) and (self.__automatonConfiguration is not None) and not vc.trustedContent:
                 if not self.__automatonConfiguration.isAccepting():
                     if self._IsSimpleTypeContent():
                         raise pyxb.SimpleContentAbsentError(self, self._location())
@@ -2676,7 +3090,9 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
                 raise pyxb.SimpleContentAbsentError(self, self._location())
             dom_support.appendTextChild(self.value(), element)
         else:
-            if pyxb.GlobalValidationConfig.forDocument:
+            if self._validationConfig.trustedContent and self.__orderedContentMatchesElements():
+                order = self.orderedContent()
+            elif pyxb.GlobalValidationConfig.forDocument:
                 order = self._validatedChildren()
             else:
                 order = self.__childrenForDOM()
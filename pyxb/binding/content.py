@@ -275,7 +275,15 @@ class AttributeUse (pyxb.cscRoot):
         if self.__prohibited:
             raise pyxb.ProhibitedAttributeError(type(ctd_instance), self.__name, ctd_instance)
         if (new_value is not None) and (from_xml or not isinstance(new_value, self.__dataType)):
-            new_value = self.__dataType.Factory(new_value, _from_xml=from_xml)
+            if from_xml and isinstance(new_value, six.string_types):
+                # Enumeration values are shared rather than re-created
+                interned = self.__dataType._InternedValue(new_value)
+                if interned is None:
+                    new_value = self.__dataType._FromLexical(new_value)
+                else:
+                    new_value = interned
+            else:
+                new_value = self.__dataType.Factory(new_value, _from_xml=from_xml)
         if self.__fixed and (new_value != self.__defaultValue):
             raise pyxb.AttributeChangeError(type(ctd_instance), self.__name, ctd_instance)
         self.__setValue(ctd_instance, new_value, provided)
@@ -301,6 +309,42 @@ class AttributeUse (pyxb.cscRoot):
             desc.extend(['=', self.__unicodeDefault ])
         return ''.join(desc)
 
+class LazyAutomaton (object):
+    """Descriptor providing the content model automaton of a complex type
+    binding.
+
+    Generated bindings assign an instance to the C{_Automaton} class
+    attribute, so that the automaton is built when the type is first
+    instantiated or its content is otherwise examined, rather than when the
+    binding module is imported."""
+
+    # The function that builds the automaton, until it has been invoked
+    __builder = None
+
+    # The automaton, once it has been built
+    __automaton = None
+
+    def __init__ (self, builder):
+        """@param builder: a function that takes no arguments and returns
+        the L{pyxb.utils.fac.Automaton} for the type"""
+        self.__builder = builder
+
+    def automaton (self):
+        """Return the automaton, building it if necessary."""
+        if self.__automaton is None:
+            self.__automaton = self.__builder()
+            self.__builder = None
+        return self.__automaton
+
+    def isBuilt (self):
+        """C{True} iff the automaton has been built."""
+        return self.__automaton is not None
+
+    def __get__ (self, instance, owner):
+        if self.__automaton is None:
+            return self.automaton()
+        return self.__automaton
+
 class AutomatonConfiguration (object):
     """State for a L{pyxb.utils.fac.Automaton} monitoring content for an
     incrementally constructed complex type binding instance.
@@ -353,7 +397,7 @@ class AutomatonConfiguration (object):
             return 1
         return len(self.__multi)
 
-    def step (self, value, element_decl):
+    def step (self, value, element_decl, detach=False):
         """Attempt a transition from the current state.
 
         @param value: the content to be supplied.  For success the value must
@@ -364,26 +408,51 @@ class AutomatonConfiguration (object):
         L{pyxb.binding.content.ElementDeclaration} that is the preferred
         symbol for the transition.
 
+        @param detach: if C{True} the value is validated against the content
+        model but is not stored in the instance.  This is used when content
+        is delivered elsewhere, as when streaming elements out of a document.
+
         @return: the cardinal number of successful transitions from the
         current configuration based on the parameters."""
 
         sym = (value, element_decl)
 
-        # Start with the current configuration(s), assuming we might see
-        # non-determinism.
-        new_multi = []
         if self.__multi is None:
-            multi = [ (self.__cfg, ()) ]
+            cand = self.__cfg.candidateTransitions(sym)
+            if 0 == len(cand):
+                # No candidate transitions.  Do not change the state.
+                return 0
+            if 1 == len(cand):
+                # Deterministic transition.  Nothing else refers to the
+                # configuration, so update it in place and store the content
+                # immediately.
+                transition = cand[0]
+                self.__cfg = transition.apply(self.__cfg)
+                if not detach:
+                    transition.consumedSymbol().consumingClosure(sym)(self.__instance)
+                return 1
+            multi = [ (self.__cfg, (), cand) ]
         else:
-            multi = self.__multi[:]
+            multi = [ (_cfg, _pending, _cfg.candidateTransitions(sym)) for (_cfg, _pending) in self.__multi ]
+
         # Collect the complete set of reachable configurations along with the
         # closures that will update the instance content based on the path.
-        for (cfg, pending) in multi:
-            cand = cfg.candidateTransitions(sym)
+        # Paths that reach equivalent configurations accept the same
+        # continuations, so only the first (preferred) of them is retained.
+        new_multi = []
+        signatures = set()
+        for (cfg, pending, cand) in multi:
             for transition in cand:
                 clone_map = {}
-                ccfg = cfg.clone(clone_map)
-                new_multi.append( (transition.apply(ccfg, clone_map), pending+(transition.consumedSymbol().consumingClosure(sym),)) )
+                ccfg = transition.apply(cfg.clone(clone_map), clone_map)
+                signature = ccfg.signature()
+                if signature in signatures:
+                    continue
+                signatures.add(signature)
+                if detach:
+                    new_multi.append( (ccfg, pending) )
+                else:
+                    new_multi.append( (ccfg, pending+(transition.consumedSymbol().consumingClosure(sym),)) )
         rv = len(new_multi)
         if 0 == rv:
             # No candidate transitions.  Do not change the state.
@@ -686,6 +755,13 @@ class _FACSymbol (pyxb.utils.fac.SymbolMatch_mixin):
         appropriate slot."""
         raise NotImplementedError('%s._consumingClosure' % (type(self).__name__,))
 
+    @classmethod
+    def SymbolIndexKey (cls, symbol):
+        """Satisfy L{pyxb.utils.fac.SymbolMatch_mixin}.
+
+        The key is the element declaration from C{symbol}, if known."""
+        return symbol[1]
+
     def __init__ (self, xsd_location):
         """@param xsd_location: the L{location<pyxb.utils.utility.Location>} of the element use or wildcard declaration."""
         self.__xsdLocation = xsd_location
@@ -734,6 +810,13 @@ class ElementUse (_FACSymbol):
         # the closure is applied.
         return lambda _inst,_eu=self,_sy=sym: _eu.__elementDeclaration.setOrAppend(_inst, _eu.matchValue(_sy))
 
+    def indexKey (self):
+        """Satisfy L{pyxb.utils.fac.SymbolMatch_mixin}.
+
+        A symbol with a known element declaration matches only if the
+        declaration is the one used here."""
+        return self.__elementDeclaration
+
     def match (self, symbol):
         """Satisfy L{pyxb.utils.fac.SymbolMatch_mixin}.
 
@@ -809,10 +892,12 @@ class _PluralBinding (collections.MutableSequence):
 
     This is an adapter for Python list.  Any operation that can mutate an item
     in the list ensures the stored value is compatible with the element for
-    which the list holds values."""
+    which the list holds values.  Mutations are counted, so that state
+    derived from the list can be recognized as stale."""
 
     __list = None
     __elementBinding = None
+    __mutations = 0
 
     def __init__ (self, *args, **kw):
         element_binding = kw.pop('element_binding', None)
@@ -825,6 +910,10 @@ class _PluralBinding (collections.MutableSequence):
     def __convert (self, v):
         return self.__elementBinding.compatibleValue(v)
 
+    def _mutationCount (self):
+        """The number of times the list has been modified."""
+        return self.__mutations
+
     def __len__ (self):
         return self.__list.__len__()
 
@@ -832,12 +921,14 @@ class _PluralBinding (collections.MutableSequence):
         return self.__list.__getitem__(key)
 
     def __setitem__ (self, key, value):
+        self.__mutations += 1
         if isinstance(key, slice):
             self.__list.__setitem__(key, [ self.__convert(_v) for _v in value])
         else:
             self.__list.__setitem__(key, self.__convert(value))
 
     def __delitem__ (self, key):
+        self.__mutations += 1
         self.__list.__delitem__(key)
 
     def __iter__ (self):
@@ -851,9 +942,11 @@ class _PluralBinding (collections.MutableSequence):
 
     # The mutable sequence type methods
     def append (self, x):
+        self.__mutations += 1
         self.__list.append(self.__convert(x))
 
     def extend (self, x):
+        self.__mutations += 1
         self.__list.extend(map(self.__convert, x))
 
     def count (self, x):
@@ -863,18 +956,23 @@ class _PluralBinding (collections.MutableSequence):
         return self.__list.index(x, i, j)
 
     def insert (self, i, x):
+        self.__mutations += 1
         self.__list.insert(i, self.__convert(x))
 
     def pop (self, i=-1):
+        self.__mutations += 1
         return self.__list.pop(i)
 
     def remove (self, x):
+        self.__mutations += 1
         self.__list.remove(x)
 
     def reverse (self):
+        self.__mutations += 1
         self.__list.reverse()
 
     def sort (self, key=None, reverse=False):
+        self.__mutations += 1
         self.__list.sort(key=key, reverse=reverse)
 
     def __str__ (self):
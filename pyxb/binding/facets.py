@@ -320,6 +320,24 @@ class _CollectionFacet_mixin (pyxb.cscRoot):
         """The members of the collection as an iterator"""
         return iter(self.__items)
 
+    # The classes whose compiled constraint checkers or interned values
+    # depend on the members of the collection
+    __dependentClasses = None
+
+    def _addDependentClass (self, cls):
+        """Record that cached state of the given simple type class was
+        derived from the members of the collection."""
+        if self.__dependentClasses is None:
+            self.__dependentClasses = set()
+        self.__dependentClasses.add(cls)
+
+    def _resetDependentClasses (self):
+        """Discard the cached state derived from the members of the
+        collection, after a member has been added."""
+        if self.__dependentClasses:
+            basis.simpleTypeDefinition._ResetConstraintCheckers(self.__dependentClasses)
+            self.__dependentClasses = None
+
 class CF_length (ConstrainingFacet, _Fixed_mixin):
     """A facet that specifies the length of the lexical representation of a value.
 
@@ -358,6 +376,25 @@ class CF_maxLength (ConstrainingFacet, _Fixed_mixin):
 
 import pyxb.utils.xmlre
 
+# Compiled regular expressions, keyed by the Python expression.  Patterns that
+# appear in several schemas or binding modules are compiled only once.
+_CompiledPatterns = { }
+
+def _CompilePattern (expression):
+    """Return the compiled form of a Python regular expression.
+
+    The result is shared by all callers that request the same expression.
+
+    @param expression: a Python regular expression, normally produced by
+    L{pyxb.utils.xmlre.XMLToPython}
+    @rtype: a compiled regular expression object
+    """
+    rv = _CompiledPatterns.get(expression)
+    if rv is None:
+        rv = re.compile(expression)
+        _CompiledPatterns[expression] = rv
+    return rv
+
 class _PatternElement (utility.PrivateTransient_mixin):
     """This class represents individual patterns that appear within a CF_pattern collection."""
 
@@ -378,6 +415,17 @@ class _PatternElement (utility.PrivateTransient_mixin):
     pattern = None
     annotation = None
     def __init__ (self, pattern=None, value=None, annotation=None, **kw):
+        """Create a pattern element.
+
+        Patterns that come from a schema (via L{CF_pattern} facet keywords)
+        are translated immediately, so invalid patterns are diagnosed while
+        the schema is processed.  Patterns added through
+        L{CF_pattern.addPattern}, as done by generated bindings, are
+        translated when first needed.
+
+        @raise pyxb.utils.xmlre.RegularExpressionError: if the pattern is
+        translated and is not a valid XML regular expression
+        """
         if pattern is None:
             assert value is not None
             pattern = value
@@ -385,14 +433,21 @@ class _PatternElement (utility.PrivateTransient_mixin):
         self.pattern = pattern
         if isinstance(annotation, six.string_types):
             self.annotation = annotation
-        self.__pythonExpression = pyxb.utils.xmlre.XMLToPython(pattern)
+        if kw.get('facet_instance') is not None:
+            self.pythonExpression()
         super(_PatternElement, self).__init__()
 
     def __str__ (self): return self.pattern
 
+    def pythonExpression (self):
+        """The Python regular expression equivalent to L{pattern}."""
+        if self.__pythonExpression is None:
+            self.__pythonExpression = pyxb.utils.xmlre.XMLToPython(self.pattern)
+        return self.__pythonExpression
+
     def matches (self, text):
         if self.__compiledExpression is None:
-            self.__compiledExpression = re.compile(self.__pythonExpression)
+            self.__compiledExpression = _CompilePattern(self.pythonExpression())
         return self.__compiledExpression.match(text)
 
 class CF_pattern (ConstrainingFacet, _CollectionFacet_mixin):
@@ -418,6 +473,9 @@ class CF_pattern (ConstrainingFacet, _CollectionFacet_mixin):
     __patternElements = None
     def patternElements (self): return self.__patternElements
 
+    # The alternation of all pattern elements, as a Python expression.
+    __pythonExpression = None
+
     def __init__ (self, **kw):
         super(CF_pattern, self).__init__(**kw)
         self.__patternElements = []
@@ -425,8 +483,36 @@ class CF_pattern (ConstrainingFacet, _CollectionFacet_mixin):
     def addPattern (self, **kw):
         pattern = self._CollectionFacet_itemType(**kw)
         self.__patternElements.append(pattern)
+        self.__pythonExpression = None
+        self._resetDependentClasses()
         return pattern
 
+    def pythonExpression (self):
+        """A Python regular expression that matches text satisfying any of
+        the patterns of this facet.
+
+        @return: the expression, or C{None} if the facet has no patterns
+        """
+        if (self.__pythonExpression is None) and self.__patternElements:
+            expressions = [ _pe.pythonExpression() for _pe in self.__patternElements ]
+            if 1 == len(expressions):
+                self.__pythonExpression = expressions[0]
+            else:
+                self.__pythonExpression = '|'.join([ '(?:%s)' % (_e,) for _e in expressions ])
+        return self.__pythonExpression
+
+    def compiledExpression (self):
+        """The compiled form of L{pythonExpression}.
+
+        Facets with identical patterns share the compiled expression.
+
+        @return: a compiled regular expression, or C{None} if the facet has
+        no patterns"""
+        expression = self.pythonExpression()
+        if expression is None:
+            return None
+        return _CompilePattern(expression)
+
     def _validateConstraint_vx (self, value):
         # If validation is inhibited, or if the facet hasn't had any
         # restrictions applied yet, return True.
@@ -436,10 +522,7 @@ class CF_pattern (ConstrainingFacet, _CollectionFacet_mixin):
             # Ignore pattern constraint when value space and lexical
             # space differ.
             return True
-        for pe in self.__patternElements:
-            if pe.matches(value):
-                return True
-        return False
+        return self.compiledExpression().match(value) is not None
 
 @six.python_2_unicode_compatible
 class _EnumerationElement (object):
@@ -577,6 +660,7 @@ class CF_enumeration (ConstrainingFacet, _CollectionFacet_mixin, _LateDatatype_m
             value = ' '.join([ _v.xsdLiteral() for _v in value ])
         self.__valueToElement[value] = ee
         self._items().append(ee)
+        self._resetDependentClasses()
         return value
 
     def elementForValue (self, value):
@@ -750,6 +834,91 @@ class CF_fractionDigits (ConstrainingFacet, _Fixed_mixin):
             scale *= 10
         return False
 
+def CompileConstraintChecker (facets):
+    """Create a function that checks values against a sequence of facets.
+
+    Range, length, and enumeration constraints are evaluated by comparisons
+    generated inline in the function, using the facet values at the time of
+    compilation.  Each pattern facet is checked with the single expression
+    from L{CF_pattern.compiledExpression}.  Other facets are checked with
+    L{ConstrainingFacet.validateConstraint}.  Facets that do not constrain
+    values, such as whiteSpace and facets without a value, are omitted.
+
+    The checker must be recompiled if the facets change; see
+    L{basis.simpleTypeDefinition._ResetConstraintCheckers}.  The
+    enumeration and pattern facets do this for the classes that
+    L{registered<_CollectionFacet_mixin._addDependentClass>} with them.
+
+    @param facets: the L{ConstrainingFacet} instances to check, in the order
+    in which they should be checked
+    @return: a function that takes a value and returns C{None} if the value
+    satisfies all the facets, or the first facet that it violates
+    """
+    namespace = { }
+    body = []
+    have_length = False
+    for facet in facets:
+        fid = 'f%d' % (len(namespace),)
+        namespace[fid] = facet
+        facet_type = type(facet)
+        if facet_type is CF_whiteSpace:
+            continue
+        if (facet_type in (CF_totalDigits, CF_fractionDigits)) and (facet.value() is None):
+            continue
+        if facet_type is CF_pattern:
+            if 0 == len(facet.patternElements()):
+                continue
+            pid = 'p%d' % (len(namespace),)
+            namespace[pid] = facet.compiledExpression().match
+            namespace['string_types'] = six.string_types
+            # Pattern constraints apply only to values held as strings
+            body.append('    if isinstance(value, string_types) and (%s(value) is None): return %s' % (pid, fid))
+        elif facet_type in _CompiledComparisons:
+            if facet.value() is None:
+                continue
+            bid = 'b%d' % (len(namespace),)
+            namespace[bid] = facet.value()
+            if facet_type in (CF_length, CF_minLength, CF_maxLength):
+                if not have_length:
+                    body.append('    n = value.xsdValueLength()')
+                    have_length = True
+                body.append('    if (n is not None) and not (n %s %s): return %s' % (_CompiledComparisons[facet_type], bid, fid))
+            else:
+                body.append('    if not (%s %s value): return %s' % (bid, _CompiledComparisons[facet_type], fid))
+        elif facet_type is CF_enumeration:
+            values = facet.values()
+            if 0 == len(values):
+                continue
+            eid = 'e%d' % (len(namespace),)
+            namespace[eid] = tuple(values)
+            try:
+                namespace[eid + 's'] = frozenset(values)
+            except TypeError:
+                # Unhashable values, such as lists
+                body.append('    if not (value in %s): return %s' % (eid, fid))
+                continue
+            body.append('    try:')
+            body.append('        ok = value in %ss' % (eid,))
+            body.append('    except TypeError:')
+            body.append('        ok = value in %s' % (eid,))
+            body.append('    if not ok: return %s' % (fid,))
+        else:
+            body.append('    if not %s.validateConstraint(value): return %s' % (fid, fid))
+    body.insert(0, 'def check (value):')
+    body.append('    return None')
+    six.exec_('\n'.join(body), namespace)
+    return namespace['check']
+
+# The comparison operators for facets checked inline.  For bounds, the facet
+# value is the left operand; for lengths, the value length is.
+_CompiledComparisons = { CF_length : '==',
+                         CF_minLength : '>=',
+                         CF_maxLength : '<=',
+                         CF_minInclusive : '<=',
+                         CF_maxInclusive : '>=',
+                         CF_minExclusive : '<',
+                         CF_maxExclusive : '>' }
+
 class FundamentalFacet (Facet):
     """A fundamental facet provides information on the value space of the associated type."""
 
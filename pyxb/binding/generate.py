@@ -266,9 +266,6 @@ def _GenerateAutomaton (automaton, template_map, containing_state, lines, **kw):
     au_src = []
     au_src.append(templates.replaceInText('''
 def %{name} ():
-    # Remove this helper function from the namespace after it is invoked
-    global %{name}
-    del %{name}
     import pyxb.utils.fac as fac
 ''', name=name))
 
@@ -317,7 +314,7 @@ def %{name} ():
         if st.subAutomata is not None:
             au_src.append('    sub_automata = []')
             for sa in st.subAutomata:
-                au_src.append('    sub_automata.append(%s)' % (_GenerateAutomaton(sa, template_map, st_id, lines, **kw),))
+                au_src.append('    sub_automata.append(%s())' % (_GenerateAutomaton(sa, template_map, st_id, lines, **kw),))
         if st.finalUpdate is None:
             au_src.append('    final_update = None')
         else:
@@ -346,7 +343,7 @@ def %{name} ():
         au_src.append('    %s._set_transitionSet(transitions)' % (state_map[st],))
     au_src.append('    return fac.Automaton(states, counters, %r, containing_state=%s)' % (automaton.nullable, containing_state))
     lines.extend(au_src)
-    return '%s()' % (name,)
+    return name
 
 def GenerateAutomaton (ctd, **kw):
     aux = _CTDAuxData.Get(ctd)
@@ -357,7 +354,159 @@ def GenerateAutomaton (ctd, **kw):
         return None
     lines = []
     name = _GenerateAutomaton(automaton, template_map, 'None', lines, **kw)
-    return (name, lines)
+    if binding_module.generator().automatonReportDirectory() is not None:
+        report = AutomatonReport(automaton)
+        report['binding'] = template_map['ctd']
+        report['name'] = None
+        if ctd.expandedName() is not None:
+            report['name'] = six.text_type(ctd.expandedName())
+        report['location'] = six.text_type(ctd._location())
+        binding_module._addAutomatonReport(report)
+    # The automaton is built when the type is first used
+    return ('pyxb.binding.content.LazyAutomaton(%s)' % (name,), lines)
+
+def _SubstitutionHeads (ed):
+    # The declarations that an element declaration may substitute for,
+    # including itself.
+    heads = set()
+    while (ed is not None) and not (ed in heads):
+        heads.add(ed)
+        ed = ed.substitutionGroupAffiliation()
+    return heads
+
+def _SymbolsOverlap (sym1, sym2):
+    # True if some element could be matched by both state symbols.  Symbols
+    # of states with sub-automata are model groups, which are only compared
+    # by identity.
+    if (sym1 is None) or (sym2 is None):
+        return False
+    if isinstance(sym1, xs.structures.ModelGroup) or isinstance(sym2, xs.structures.ModelGroup):
+        return sym1 is sym2
+    (t1, t2) = (sym1[1], sym2[1])
+    if isinstance(t2, xs.structures.Wildcard):
+        (t1, t2) = (t2, t1)
+    if isinstance(t1, xs.structures.Wildcard):
+        if isinstance(t2, xs.structures.Wildcard):
+            return True
+        nc = t1.namespaceConstraint()
+        ns = t2.expandedName().namespace()
+        if (ns is not None) and ns.isAbsentNamespace():
+            ns = None
+        if xs.structures.Wildcard.NC_any == nc:
+            return True
+        if isinstance(nc, tuple):
+            return (ns is not None) and (ns != nc[1])
+        return ns in nc
+    h1 = _SubstitutionHeads(t1)
+    h2 = _SubstitutionHeads(t2)
+    return (t1 in h2) or (t2 in h1)
+
+def _ConsumingSymbol (transition):
+    st = transition.consumingState()
+    if st is None:
+        return None
+    return st.symbol
+
+def _UpdatesExclusive (xit1, xit2):
+    # True if the counter guards of the transitions cannot both be satisfied:
+    # one increments and the other resets a counter with a fixed count.
+    for ui1 in xit1.updateInstructions:
+        for ui2 in xit2.updateInstructions:
+            cc = ui1.counterCondition
+            if (cc == ui2.counterCondition) and (ui1.doIncrement != ui2.doIncrement) and (cc.min == cc.max):
+                return True
+    return False
+
+def _IsDeterministic (transitions):
+    # A transition set is deterministic if no element can be consumed by two
+    # of its transitions.
+    transitions = list(transitions)
+    for i in range(len(transitions)):
+        for j in range(i):
+            (xit1, xit2) = (transitions[i], transitions[j])
+            if _SymbolsOverlap(_ConsumingSymbol(xit1), _ConsumingSymbol(xit2)) and not _UpdatesExclusive(xit1, xit2):
+                return False
+    return True
+
+def _MaxMultiplicity (automaton, limit):
+    # Explore the sets of states that may be simultaneously occupied after
+    # consuming a sequence of elements, ignoring counter constraints.  The
+    # largest such set bounds the number of configurations a non-deterministic
+    # step may produce, up to differences in counter values.  Exploration
+    # stops after limit sets have been visited.
+    start = ( None, tuple(automaton.initialTransitions) )
+    pending = [ start ]
+    visited = set()
+    max_size = 1
+    while pending and (len(visited) < limit):
+        (key, transitions) = pending.pop()
+        if key in visited:
+            continue
+        visited.add(key)
+        remaining = [ _xit for _xit in transitions if _xit.consumingState() is not None ]
+        while remaining:
+            symbol = _ConsumingSymbol(remaining[0])
+            matched = [ _xit for _xit in remaining if _SymbolsOverlap(symbol, _ConsumingSymbol(_xit)) ]
+            remaining = [ _xit for _xit in remaining if not (_xit in matched) ]
+            states = frozenset([ _xit.consumingState() for _xit in matched ])
+            max_size = max(max_size, len(states))
+            if not (states in visited):
+                next_transitions = []
+                for st in states:
+                    next_transitions.extend(st.transitionSet)
+                pending.append((states, tuple(next_transitions)))
+    return max_size
+
+def AutomatonReport (automaton, multiplicity_limit=1000):
+    """Summarize the complexity of an automaton describing a content model.
+
+    The automaton and any sub-automata (used for C{all} model groups) are
+    examined.  The returned dictionary holds:
+
+     - C{automata}: the number of automata examined
+     - C{states}: the total number of states
+     - C{max_transitions}: the largest number of transitions leaving a state
+     - C{counters}: for each counter condition, a dictionary holding its
+       C{min}, its C{max} (C{None} if unbounded), and the C{location} of the
+       particle it constrains
+     - C{deterministic}: C{False} if some element might be consumed by
+       more than one transition from a state
+     - C{max_multiplicity}: the largest number of states that may be
+       occupied simultaneously while matching, which is C{1} for a
+       deterministic automaton
+
+    @param automaton: an automaton produced from a term tree by
+    L{pyxb.utils.fac.Node.buildAutomaton}
+    @keyword multiplicity_limit: the maximum number of sets of states to
+    explore when calculating C{max_multiplicity}
+    @rtype: C{dict}
+    """
+    automata = [ automaton ]
+    counters = []
+    num_automata = 0
+    num_states = 0
+    max_transitions = len(automaton.initialTransitions)
+    deterministic = True
+    max_multiplicity = 1
+    while automata:
+        au = automata.pop(0)
+        num_automata += 1
+        num_states += len(au.states)
+        for cc in sorted(au.counterConditions, key=lambda _cc: _cc.metadata.facStateSortKey()):
+            counters.append({ 'min' : cc.min, 'max' : cc.max, 'location' : six.text_type(cc.metadata._location()) })
+        deterministic = deterministic and _IsDeterministic(au.initialTransitions)
+        for st in au.states:
+            max_transitions = max(max_transitions, len(st.transitionSet))
+            deterministic = deterministic and _IsDeterministic(st.transitionSet)
+            if st.subAutomata is not None:
+                automata.extend(st.subAutomata)
+        max_multiplicity = max(max_multiplicity, _MaxMultiplicity(au, multiplicity_limit))
+    return { 'automata' : num_automata,
+             'states' : num_states,
+             'max_transitions' : max_transitions,
+             'counters' : counters,
+             'deterministic' : deterministic,
+             'max_multiplicity' : max_multiplicity }
 
 def _useEnumerationTags (td):
     if td is None:
@@ -1276,6 +1425,7 @@ class _ModuleNaming_mixin (object):
         self.__namespaceDeclarations = []
         self.__referencedNamespaces = {}
         self.__uniqueInClass = {}
+        self.__automatonReports = []
 
     def _importModule (self, module):
         assert not isinstance(module, pyxb.namespace.Namespace)
@@ -1575,11 +1725,43 @@ class _ModuleNaming_mixin (object):
                 aux = ' as %s' % (local_name,)
             self.__bindingIO.write("from %s import %s%s # %s\n" % (module.modulePath(), rem_name, aux, c.expandedName()))
 
+    def _addAutomatonReport (self, report):
+        self.__automatonReports.append(report)
+    __automatonReports = None
+
+    def automatonReport (self):
+        """Describe the content model automata of the complex types in the module.
+
+        Reports are collected only when L{Generator.automatonReportDirectory}
+        is set.
+
+        @return: a dictionary holding the C{module} path and a list of
+        C{complexTypes}, each of which is the result of L{AutomatonReport}
+        augmented with the C{binding} class name, the type C{name} (C{None}
+        if anonymous), and its schema C{location}."""
+        return { 'module' : self.modulePath(),
+                 'complexTypes' : self.__automatonReports[:] }
+
+    def writeAutomatonReport (self, directory):
+        """Write L{automatonReport} as JSON to a file named for the module path
+        in the given directory.
+
+        @return: the path to the file"""
+        import json
+        report_path = os.path.join(directory, '%s.json' % (self.modulePath(),))
+        with pyxb.utils.utility.OpenOrCreate(report_path) as report_file:
+            report_file.write(json.dumps(self.automatonReport(), indent=2, sort_keys=True).encode('utf-8'))
+        _log.info('Saved automaton report to %s', report_path)
+        return report_path
+
     def writeToModuleFile (self):
         if self.bindingFile():
             self.bindingFile().write(self.moduleContents().encode(pyxb._OutputEncoding))
             self.bindingFile().close()
             _log.info('Saved binding source to %s', self.__bindingFilePath)
+            report_directory = self.generator().automatonReportDirectory()
+            if report_directory is not None:
+                self.writeAutomatonReport(report_directory)
         else:
             _log.info('No binding file for %s', self)
 
@@ -1602,7 +1784,7 @@ class NamespaceModule (_ModuleNaming_mixin):
     __namespaceGroupModule = None
 
     _UniqueInModule = _ModuleNaming_mixin._UniqueInModule.copy()
-    _UniqueInModule.update([ 'CreateFromDOM', 'CreateFromDocument' ])
+    _UniqueInModule.update([ 'CreateFromDOM', 'CreateFromDocument', 'CreateFromDocumentPooled', 'CreateFromStream', 'CreateFromFile' ])
 
     def namespaceGroupHead (self):
         return self.__namespaceGroupHead
@@ -1675,7 +1857,7 @@ import pyxb.utils.six as _six
 ''')
         self.bindingIO().appendPrologBoilerplate(template_map)
         self.bindingIO().prolog().append(self.bindingIO().expand('''
-def CreateFromDocument (xml_text, fallback_namespace=None, location_base=None, default_namespace=None):
+def CreateFromDocument (xml_text, fallback_namespace=None, location_base=None, default_namespace=None, track_locations=None, keep_elements=None):
     """Parse the given XML and use the document element to create a
     Python instance.
 
@@ -1697,16 +1879,25 @@ def CreateFromDocument (xml_text, fallback_namespace=None, location_base=None, d
     @keyword default_namespace An alias for @c fallback_namespace used
     in PyXB 1.1.4 through 1.2.6.  It behaved like a default namespace
     only for absent namespaces.
+
+    @keyword track_locations: If C{False}, locations are not recorded in
+    the created bindings.  The default C{None} uses the value of
+    L{pyxb.TrackParseLocations}.
+
+    @keyword keep_elements: Optional iterable of expanded names and paths
+    identifying the elements to be converted; other elements are skipped.
+    See L{pyxb.binding.saxer.PyXBSAXHandler}.  This is ignored if the XML
+    style does not use a SAX parser.
     """
 
-    if pyxb.XMLStyle_saxer != pyxb._XMLStyle:
+    if not (pyxb._XMLStyle in (pyxb.XMLStyle_saxer, pyxb.XMLStyle_expat)):
         dom = pyxb.utils.domutils.StringToDOM(xml_text)
         return CreateFromDOM(dom.documentElement)
     if fallback_namespace is None:
         fallback_namespace = default_namespace
     if fallback_namespace is None:
         fallback_namespace = Namespace.fallbackNamespace()
-    saxer = pyxb.binding.saxer.make_parser(fallback_namespace=fallback_namespace, location_base=location_base)
+    saxer = pyxb.binding.saxer.make_parser(fallback_namespace=fallback_namespace, location_base=location_base, track_locations=track_locations, keep_elements=keep_elements)
     handler = saxer.getContentHandler()
     xmld = xml_text
     if isinstance(xmld, %{_TextType}):
@@ -1715,6 +1906,68 @@ def CreateFromDocument (xml_text, fallback_namespace=None, location_base=None, d
     instance = handler.rootObject()
     return instance
 
+def CreateFromDocumentPooled (xml_text, fallback_namespace=None, location_base=None, default_namespace=None, track_locations=None):
+    """As with L{CreateFromDocument}, but reuse parsers from a per-thread pool.
+
+    This reduces the per-document overhead when many small documents are
+    converted.  See L{pyxb.binding.saxer.parse_pooled}."""
+
+    if not (pyxb._XMLStyle in (pyxb.XMLStyle_saxer, pyxb.XMLStyle_expat)):
+        return CreateFromDocument(xml_text, fallback_namespace, location_base, default_namespace, track_locations)
+    if fallback_namespace is None:
+        fallback_namespace = default_namespace
+    if fallback_namespace is None:
+        fallback_namespace = Namespace.fallbackNamespace()
+    xmld = xml_text
+    if isinstance(xmld, %{_TextType}):
+        xmld = xmld.encode(pyxb._InputEncoding)
+    return pyxb.binding.saxer.parse_pooled(io.BytesIO(xmld), fallback_namespace=fallback_namespace, location_base=location_base, track_locations=track_locations)
+
+def CreateFromStream (stream, fallback_namespace=None, location_base=None, default_namespace=None, track_locations=None, keep_elements=None):
+    """As with L{CreateFromDocument}, but read the document from a stream.
+
+    The stream is passed directly to the parser, which reads it in
+    blocks, so the document is never held in memory in its entirety.
+
+    @param stream A file-like object opened in binary mode, or a
+    C{mmap.mmap} instance.  Reading starts at the current position."""
+
+    if fallback_namespace is None:
+        fallback_namespace = default_namespace
+    if not (pyxb._XMLStyle in (pyxb.XMLStyle_saxer, pyxb.XMLStyle_expat)):
+        return CreateFromDocument(stream.read(-1), fallback_namespace, location_base, track_locations=track_locations)
+    if fallback_namespace is None:
+        fallback_namespace = Namespace.fallbackNamespace()
+    saxer = pyxb.binding.saxer.make_parser(fallback_namespace=fallback_namespace, location_base=location_base, track_locations=track_locations, keep_elements=keep_elements)
+    handler = saxer.getContentHandler()
+    saxer.parse(stream)
+    return handler.rootObject()
+
+def CreateFromFile (path, fallback_namespace=None, location_base=None, default_namespace=None, track_locations=None, keep_elements=None):
+    """As with L{CreateFromDocument}, but read the document from the
+    file at the given path.
+
+    The file is memory-mapped where possible and parsed in place using
+    L{CreateFromStream}.
+
+    @keyword location_base: As with L{CreateFromDocument}.  Defaults to
+    C{path}."""
+
+    import mmap
+    if location_base is None:
+        location_base = path
+    with open(path, 'rb') as f:
+        try:
+            stream = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, EnvironmentError):
+            # Empty files and some special files cannot be mapped
+            stream = f
+        try:
+            return CreateFromStream(stream, fallback_namespace, location_base, default_namespace, track_locations, keep_elements)
+        finally:
+            if stream is not f:
+                stream.close()
+
 def CreateFromDOM (node, fallback_namespace=None, default_namespace=None):
     """Create a Python instance from the given DOM node.
     The node tag must correspond to an element declaration in this module.
@@ -2302,6 +2555,22 @@ from %s import *
         self.__uriContentArchiveDirectory = ucad
     __uriContentArchiveDirectory = None
 
+    def automatonReportDirectory (self):
+        """The directory path into which a JSON description of the content
+        model automata of each generated module will be written.
+
+        The report records, for each complex type, the number of states, the
+        largest number of transitions leaving a state, the counter ranges,
+        whether the content model is deterministic, and the worst-case
+        number of simultaneous configurations.  No report is produced if
+        this is not set.
+        @rtype: C{str}"""
+        return self.__automatonReportDirectory
+    def setAutomatonReportDirectory (self, automaton_report_directory):
+        self.__automatonReportDirectory = automaton_report_directory
+        return self
+    __automatonReportDirectory = None
+
     def loggingConfigFile (self):
         """A file provided to L{logging.config.fileConfig} to control log messages.
 
@@ -2344,6 +2613,7 @@ from %s import *
         @keyword generate_to_files: Sets L{generateToFiles}
         @keyword uri_content_archive_directory: Invokes L{setUriContentArchiveDirectory}
         @keyword logging_config_file: Invokes L{setLoggingConfigFile}
+        @keyword automaton_report_directory: Invokes L{setAutomatonReportDirectory}
         """
         argv = kw.get('argv')
         if argv is not None:
@@ -2373,6 +2643,7 @@ from %s import *
         self.__generateToFiles = kw.get('generate_to_files', True)
         self.__uriContentArchiveDirectory = kw.get('uri_content_archive_directory')
         self.__loggingConfigFile = kw.get('logging_config_file')
+        self.__automatonReportDirectory = kw.get('automaton_report_directory')
         self.__unnamedModulePaths = set()
 
         if argv is not None:
@@ -2405,7 +2676,8 @@ from %s import *
         ('allow_builtin_generation', setAllowBuiltinGeneration),
         ('allow_absent_module', setAllowAbsentModule),
         ('uri_content_archive_directory', setUriContentArchiveDirectory),
-        ('logging_config_file', setLoggingConfigFile)
+        ('logging_config_file', setLoggingConfigFile),
+        ('automaton_report_directory', setAutomatonReportDirectory)
         )
     def applyOptionValues (self, options, args=None):
         for (tag, method) in self.__OptionSetters:
@@ -2522,6 +2794,8 @@ from %s import *
             group = optparse.OptionGroup(parser, 'Miscellaneous Options', "Anything else.")
             group.add_option('--logging-config-file', metavar="FILE",
                              help=self.__stripSpaces(self.loggingConfigFile.__doc__))
+            group.add_option('--automaton-report-directory', metavar="DIRECTORY",
+                             help=self.__stripSpaces(self.automatonReportDirectory.__doc__))
             parser.add_option_group(group)
 
             group = optparse.OptionGroup(parser, 'Maintainer Options', "Don't use these.  They don't exist.  If they did, they'd do different things at different times, and if you used them you'd probably be sorry.")
@@ -2598,6 +2872,8 @@ from %s import *
                 opts.append('--no-' + opt)
         if self.uriContentArchiveDirectory() is not None:
             opts.append('--uri-content-archive-directory=%s' + self.uriContentArchiveDirectory())
+        if self.automatonReportDirectory() is not None:
+            opts.append('--automaton-report-directory=' + self.automatonReportDirectory())
         return opts
 
     def normalizeSchemaLocation (self, sl):
@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+# Copyright 2009-2013, Peter A. Bigot
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain a
+# copy of the License at:
+#
+#            http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""This module supports converting large documents to bindings using
+multiple processes.
+
+The document must consist largely of a sequence of elements with the same
+name, such as records in a data feed.  The document is split at the
+boundaries of those elements by a scan of the raw bytes.  Each batch of
+elements is wrapped in the text that precedes the first and follows the last
+of them, which in particular includes the start tag of the document element
+with its namespace declarations.  The resulting documents are converted in
+worker processes, and the results are returned in document order.
+
+The scan does not parse the document, so the local name of the repeated
+element must not be used for other elements, and must not appear in tags
+within comments, CDATA sections, or attribute values.  Content preceding and
+following the repeated elements is converted once for each batch; line
+numbers in locations and diagnostics are relative to the batch.
+
+An example::
+
+  import pyxb.binding.parallel
+  import po
+
+  totals = pyxb.binding.parallel.ParseParallel(po, xmld, 'item', reducer=ItemTotal)
+
+This requires C{concurrent.futures}, which must be installed separately in
+Python 2.
+
+The module may also be run as a script; use C{--help} for details.
+"""
+
+from __future__ import print_function
+import logging
+import re
+import importlib
+import pyxb
+import pyxb.namespace
+import pyxb.binding.basis
+import pyxb.binding.saxer
+from pyxb.utils import six
+
+_log = logging.getLogger(__name__)
+
+def _TagPattern (local_name):
+    # Match the start or end tag of an element with the given local name and
+    # any prefix.
+    if isinstance(local_name, six.text_type):
+        local_name = local_name.encode('utf-8')
+    return re.compile(b'<(/?)(?:[A-Za-z_][-.\\w]*:)?' + re.escape(local_name) + b'(?=[\\s/>])')
+
+def SplitDocument (xmld, local_name):
+    """Locate the elements with the given local name in a document.
+
+    @param xmld: The document, as a byte string.
+    @param local_name: The local name of the repeated element.
+    @return: C{(header, elements, trailer)} where C{elements} is a list of
+    C{(start, end)} offsets of the elements within C{xmld}, C{header} is the
+    text preceding the first of them, and C{trailer} is the text following
+    the last of them.
+    @raise pyxb.UsageError: the document is not well formed in a way that
+    prevents the split.
+    """
+    elements = []
+    depth = 0
+    start = None
+    for m in _TagPattern(local_name).finditer(xmld):
+        gt = xmld.find(b'>', m.end())
+        if 0 > gt:
+            raise pyxb.UsageError('Unterminated tag at offset %d' % (m.start(),))
+        if m.group(1):
+            depth -= 1
+            if 0 > depth:
+                raise pyxb.UsageError('Unmatched end tag at offset %d' % (m.start(),))
+            if 0 == depth:
+                elements.append((start, gt + 1))
+        elif b'/' == xmld[gt-1:gt]:
+            if 0 == depth:
+                elements.append((m.start(), gt + 1))
+        else:
+            if 0 == depth:
+                start = m.start()
+            depth += 1
+    if 0 != depth:
+        raise pyxb.UsageError('Unterminated element at offset %d' % (start,))
+    if 0 == len(elements):
+        return (xmld, elements, b'')
+    return (xmld[:elements[0][0]], elements, xmld[elements[-1][1]:])
+
+def _Batches (xmld, elements, batch_size):
+    # Group consecutive elements into spans of roughly batch_size bytes.  A
+    # span may end only where the elements are separated by whitespace, so
+    # no content between elements is lost.
+    batches = []
+    first = elements[0][0]
+    for (i, (start, end)) in enumerate(elements):
+        if (end - first) < batch_size:
+            continue
+        next_start = len(xmld)
+        if (i + 1) < len(elements):
+            next_start = elements[i+1][0]
+        if xmld[end:next_start].strip():
+            continue
+        batches.append((first, end))
+        first = next_start
+    if first < elements[-1][1]:
+        batches.append((first, elements[-1][1]))
+    return batches
+
+# Namespace specifications passed to worker processes, which cannot receive
+# the namespace instances themselves.  Other specifications are namespace
+# URIs.
+_NoNamespace = 0
+_AbsentNamespace = 1
+
+def _NamespaceSpec (namespace):
+    # Describe a namespace in a form that can be pickled
+    if namespace is None:
+        return _NoNamespace
+    if namespace.isAbsentNamespace():
+        return _AbsentNamespace
+    return namespace.uri()
+
+def _ElementNamespaces (module, local_name):
+    # Return the namespace specifications of the elements declared in the
+    # module with the given local name.  Local elements are found through
+    # the element maps of the complex types, which reflect their form.
+    specs = []
+    for v in six.itervalues(module.__dict__):
+        names = ()
+        if isinstance(v, pyxb.binding.basis.element):
+            names = ( v.name(), )
+        elif isinstance(v, type) and issubclass(v, pyxb.binding.basis.complexTypeDefinition):
+            names = six.iterkeys(v._ElementMap)
+        for en in names:
+            if en.localName() != local_name:
+                continue
+            spec = _NamespaceSpec(en.namespace())
+            if not (spec in specs):
+                specs.append(spec)
+    return specs
+
+def _ParseBatch (module_name, document, namespace_specs, local_name, reducer, location_base):
+    # Convert one batch document in a worker process, returning the (reduced)
+    # repeated elements it contains.
+    module = importlib.import_module(module_name)
+    element_names = []
+    for spec in namespace_specs:
+        if _NoNamespace == spec:
+            namespace = None
+        elif _AbsentNamespace == spec:
+            namespace = module.Namespace
+        else:
+            namespace = pyxb.namespace.NamespaceForURI(spec, create_if_missing=True)
+        element_names.append(pyxb.namespace.ExpandedName(namespace, local_name))
+    results = []
+    for instance in pyxb.binding.saxer.iterparse(document, element_names,
+                                                 fallback_namespace=module.Namespace.fallbackNamespace(),
+                                                 location_base=location_base):
+        if reducer is not None:
+            instance = reducer(instance)
+        results.append(instance)
+    return results
+
+def ParseParallel (module, xmld, element_name, reducer=None, max_workers=None, batch_size=2**20, location_base=None, executor=None):
+    """Convert the repeated elements of a document using multiple processes.
+
+    @param module: The binding module holding the document element, or its
+    name.  Worker processes import the module by name, so it must be
+    importable in them.
+
+    @param xmld: The document, as a byte string or as a text string in
+    L{pyxb._InputEncoding}.
+
+    @param element_name: The repeated element, as a
+    L{pyxb.namespace.ExpandedName} or as a local name.  A local name selects
+    the elements of that name declared in C{module}, in the namespace
+    required by their form; if there are none, it is taken to be in the
+    namespace of C{module}.
+
+    @keyword reducer: Optional callable applied in the worker process to the
+    binding instance of each repeated element.  It must be picklable, e.g. a
+    function defined at module scope.  If not provided, the binding instances
+    themselves are pickled and returned.
+
+    @keyword max_workers: The number of worker processes, as for
+    C{concurrent.futures.ProcessPoolExecutor}.
+
+    @keyword batch_size: The approximate number of bytes of repeated elements
+    converted in each worker invocation.  Default is 1MiB.
+
+    @keyword location_base: As with L{pyxb.binding.saxer.make_parser}.
+
+    @keyword executor: Optional C{concurrent.futures.Executor} to use
+    instead of a new C{ProcessPoolExecutor}.  It is not shut down on
+    completion.
+
+    @return: A list holding, for each repeated element in document order,
+    its binding instance or the value returned by C{reducer}.
+
+    @raise pyxb.UsageError: the document holds elements with the local name
+    of C{element_name}, but none of them has its expanded name.
+    """
+    if isinstance(module, six.string_types):
+        module = importlib.import_module(module)
+    if isinstance(xmld, six.text_type):
+        xmld = xmld.encode(pyxb._InputEncoding)
+    if isinstance(element_name, pyxb.namespace.ExpandedName):
+        namespace_specs = [ _NamespaceSpec(element_name.namespace()) ]
+        local_name = element_name.localName()
+    else:
+        local_name = element_name
+        namespace_specs = _ElementNamespaces(module, local_name)
+        if 0 == len(namespace_specs):
+            namespace_specs = [ _NamespaceSpec(module.Namespace) ]
+    (header, elements, trailer) = SplitDocument(xmld, local_name)
+    if 0 == len(elements):
+        return []
+    documents = [ header + xmld[_s:_e] + trailer for (_s, _e) in _Batches(xmld, elements, batch_size) ]
+    shutdown = False
+    if executor is None:
+        import concurrent.futures
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers)
+        shutdown = True
+    try:
+        futures = [ executor.submit(_ParseBatch, module.__name__, _d, namespace_specs, local_name, reducer, location_base) for _d in documents ]
+        results = []
+        for future in futures:
+            results.extend(future.result())
+    finally:
+        if shutdown:
+            executor.shutdown()
+    if 0 == len(results):
+        raise pyxb.UsageError('No binding for any of the %d elements with local name %s' % (len(elements), local_name))
+    return results
+
+def _LoadCallable (spec):
+    # Resolve a "module:attribute" specification
+    (module_name, attr) = spec.split(':', 1)
+    return getattr(importlib.import_module(module_name), attr)
+
+if '__main__' == __name__:
+    import optparse
+    import sys
+    import time
+    logging.basicConfig()
+    parser = optparse.OptionParser(usage='%prog [options] file ...',
+                                   description='Convert the repeated elements of XML documents to bindings using multiple processes.')
+    parser.add_option('-m', '--module', help='Name of the binding module for the documents')
+    parser.add_option('-e', '--element', help='Local name of the repeated element')
+    parser.add_option('-r', '--reducer', help='Callable applied to each element, as module:name; its results are printed')
+    parser.add_option('-w', '--workers', type='int', help='Number of worker processes')
+    parser.add_option('-b', '--batch-size', type='int', default=2**20, help='Approximate bytes per batch')
+    (options, args) = parser.parse_args()
+    if (options.module is None) or (options.element is None) or (0 == len(args)):
+        parser.error('--module, --element, and at least one file are required')
+    reducer = None
+    if options.reducer is not None:
+        reducer = _LoadCallable(options.reducer)
+    for path in args:
+        with open(path, 'rb') as f:
+            xmld = f.read()
+        t0 = time.time()
+        results = ParseParallel(options.module, xmld, options.element, reducer=reducer, max_workers=options.workers, batch_size=options.batch_size, location_base=path)
+        dt = time.time() - t0
+        if reducer is not None:
+            for r in results:
+                print(r)
+        print('%s: %d elements in %.3f sec' % (path, len(results), dt), file=sys.stderr)
@@ -17,13 +17,18 @@
 using a SAX parser."""
 
 import logging
+import collections
+import io
+import threading
 import xml.dom
+import xml.sax.expatreader
 import pyxb.namespace
 import pyxb.utils.saxutils
 import pyxb.utils.saxdom
 import pyxb.utils.utility
 from pyxb.binding import basis
 from pyxb.namespace.builtin import XMLSchema_instance as XSI
+from pyxb.utils import six
 
 _log = logging.getLogger(__name__)
 
@@ -69,6 +74,18 @@ class _SAXElementState (pyxb.utils.saxutils.SAXElementState):
         return self.__enclosingCTD
     __enclosingCTD = None
 
+    def projectionPath (self):
+        """The path from the document element to this element if only
+        selected children of this element are to be converted to bindings.
+
+        @return: A tuple of L{pyxb.namespace.ExpandedName} instances, or
+        C{None} if all children of the element are converted.  See
+        L{_ElementProjection}."""
+        return self.__projectionPath
+    def setProjectionPath (self, projection_path):
+        self.__projectionPath = projection_path
+    __projectionPath = None
+
     # The factory that is called to create a binding instance for this
     # element; None if the binding instance was created at the start
     # of the element.
@@ -102,6 +119,26 @@ class _SAXElementState (pyxb.utils.saxutils.SAXElementState):
         """
         self.__enclosingCTD = enclosing_ctd
 
+    @classmethod
+    def __lexicalFactory (cls, new_object_factory):
+        """Return a function that creates the instance for an element with
+        simple type content directly from its text.
+
+        @return: a callable taking the text and a C{location} keyword, or
+        C{None} if the instance must be created by C{new_object_factory}"""
+        if isinstance(new_object_factory, basis.element):
+            type_class = new_object_factory.typeDefinition()
+            # Abstract and fixed elements need the checks performed when
+            # the element is called
+            if (not issubclass(type_class, basis.simpleTypeDefinition)
+                or new_object_factory.abstract()
+                or new_object_factory.fixed()):
+                return None
+            return lambda _t, **_kw: type_class._FromLexical(_t, element=new_object_factory, **_kw)
+        if isinstance(new_object_factory, type) and issubclass(new_object_factory, basis.simpleTypeDefinition):
+            return new_object_factory._FromLexical
+        return None
+
     # Create the binding instance for this element.
     def __constructElement (self, new_object_factory, attrs, content=None):
         kw = { '_from_xml' : True,
@@ -113,7 +150,13 @@ class _SAXElementState (pyxb.utils.saxutils.SAXElementState):
 
         if content is None:
             content = []
-        self.__bindingInstance = new_object_factory(*content, **kw)
+        lexical_factory = None
+        if (1 == len(content)) and isinstance(content[0], six.string_types) and not ('_nil' in kw):
+            lexical_factory = self.__lexicalFactory(new_object_factory)
+        if lexical_factory is not None:
+            self.__bindingInstance = lexical_factory(content[0], location=kw['_location'])
+        else:
+            self.__bindingInstance = new_object_factory(*content, **kw)
         if isinstance(self.__bindingInstance, pyxb.utils.utility.Locatable_mixin):
             self.__bindingInstance._setLocation(self.location())
 
@@ -209,10 +252,49 @@ class _SAXElementState (pyxb.utils.saxutils.SAXElementState):
                 pyxb.namespace.NamespaceContext.PopContext()
         return self.__bindingInstance
 
-    def endBindingElement (self):
+    def __appendContent (self):
+        # Transfer the accumulated content into the binding instance.
+        content = self.content()
+        for info in content:
+            self.__bindingInstance.append(info.item,
+                                          _element_decl=info.element_decl,
+                                          _maybe_element=info.maybe_element,
+                                          _from_xml=True,
+                                          _location=info.location)
+        del content[:]
+
+    def detachElementContent (self, location, element, element_decl=None):
+        """Validate the given binding instance as element content without
+        retaining it.
+
+        Content accumulated so far is transferred to the binding instance, so
+        the content model sees the children in document order, then the
+        element is supplied to the content model in a mode where it is
+        validated but not stored.
+
+        @return: C{True} if the element was detached; C{False} if this element
+        does not hold a complex type binding instance, in which case the
+        caller should add the element as normal content.
+        """
+        if (self.__bindingInstance is None) or (self.__delayedConstructor is not None) or self.inDOMMode():
+            return False
+        self.__appendContent()
+        self.__bindingInstance.append(element,
+                                      _element_decl=element_decl,
+                                      _from_xml=True,
+                                      _location=location,
+                                      _detach=True)
+        return True
+
+    def endBindingElement (self, detach=False):
         """Perform any end-of-element processing.
 
         For simple type instances, this creates the binding instance.
+
+        @keyword detach: If C{True}, the completed binding instance is
+        validated against the content model of its parent but is not stored
+        there.
+
         @return: The generated binding instance
         """
         if self.__delayedConstructor is not None:
@@ -231,12 +313,17 @@ class _SAXElementState (pyxb.utils.saxutils.SAXElementState):
             finally:
                 pyxb.namespace.NamespaceContext.PopContext()
         else:
-            for info in self.content():
-                self.__bindingInstance.append(info.item,
-                                              _element_decl=info.element_decl,
-                                              _maybe_element=info.maybe_element,
-                                              _location=info.location)
+            self.__appendContent()
         parent_state = self.parentState()
+        if detach:
+            # Validate before handing the instance to the parent, which will
+            # not see it again.
+            if self.__bindingInstance._element() is None:
+                self.__bindingInstance._setElement(self.__elementBinding)
+            self.__bindingInstance._postDOMValidate()
+            if (parent_state is not None) and not parent_state.detachElementContent(self.location(), self.__bindingInstance, self.__elementDecl):
+                parent_state.addElementContent(self.location(), self.__bindingInstance, self.__elementDecl)
+            return self.__bindingInstance
         if parent_state is not None:
             parent_state.addElementContent(self.location(), self.__bindingInstance, self.__elementDecl)
         # As CreateFromDOM does, validate the resulting element
@@ -244,6 +331,106 @@ class _SAXElementState (pyxb.utils.saxutils.SAXElementState):
             self.__bindingInstance._setElement(self.__elementBinding)
         return self.__bindingInstance._postDOMValidate()
 
+class _ElementSelector (object):
+    """Identify elements by expanded name or by path.
+
+    Each selector is either something that can be converted to a
+    L{pyxb.namespace.ExpandedName}, which matches an element with that name
+    at any depth, or a tuple or list of L{pyxb.namespace.ExpandedName}
+    instances, which matches an element reached by that sequence of names
+    from the document element."""
+
+    # Map from the expanded name of the selected element to a list of paths
+    # that end with that name.  A path of None matches at any depth.
+    __selectors = None
+
+    def __init__ (self, selectors):
+        self.__selectors = {}
+        for sel in selectors:
+            path = None
+            if isinstance(sel, (tuple, list)) and (0 < len(sel)) and all(isinstance(_n, pyxb.namespace.ExpandedName) for _n in sel):
+                path = tuple(sel)
+                sel = path[-1]
+            else:
+                sel = pyxb.namespace.ExpandedName(sel)
+            self.__selectors.setdefault(sel, []).append(path)
+
+    def __nonzero__ (self):
+        return 0 < len(self.__selectors)
+    __bool__ = __nonzero__
+
+    def matches (self, state):
+        """Return C{True} iff the element for the given state is selected.
+
+        @param state: a L{pyxb.utils.saxutils.SAXElementState} instance"""
+        paths = self.__selectors.get(state.expandedName())
+        if paths is None:
+            return False
+        for path in paths:
+            if path is None:
+                return True
+            ps = state
+            pi = len(path)
+            while (0 < pi) and (ps is not None) and (ps.expandedName() == path[pi-1]):
+                ps = ps.parentState()
+                pi -= 1
+            # The path must account for every element up to the document
+            # element, whose parent state has no name.
+            if (0 == pi) and (ps is not None) and (ps.expandedName() is None):
+                return True
+        return False
+
+class _ElementProjection (object):
+    """Identify the elements that are converted to bindings when a document
+    is parsed with projection.
+
+    Selectors are expressed as for L{_ElementSelector}.  The document element
+    is always converted.  An element that matches a selector is converted
+    along with its entire content.  An element that is the ancestor of an
+    element selected by path is converted, but only those of its children
+    that are themselves retained are converted.  A selector that is an
+    expanded name matches any element with that name whose parent is
+    converted in this way.  All other elements are skipped."""
+
+    # Expanded names of elements retained wherever their parent is filtered
+    __names = None
+
+    # Paths from the document element to retained elements
+    __paths = None
+
+    # Proper prefixes of members of __paths
+    __ancestors = None
+
+    def __init__ (self, selectors):
+        self.__names = set()
+        self.__paths = set()
+        self.__ancestors = set()
+        for sel in selectors:
+            if isinstance(sel, (tuple, list)) and (0 < len(sel)) and all(isinstance(_n, pyxb.namespace.ExpandedName) for _n in sel):
+                path = tuple(sel)
+                self.__paths.add(path)
+                self.__ancestors.update(path[:_i] for _i in six.moves.xrange(1, len(path)))
+            else:
+                self.__names.add(pyxb.namespace.ExpandedName(sel))
+
+    def projectChild (self, parent_path, name):
+        """Determine how a child of a filtered element is processed.
+
+        @param parent_path: The L{projection path<_SAXElementState.projectionPath>}
+        of the parent element.
+        @param name: The expanded name of the child element.
+        @return: C{(retain, projection_path)} where C{retain} is C{False} if
+        the element is to be skipped, and C{projection_path} is the value to
+        be recorded for the child."""
+        if name in self.__names:
+            return (True, None)
+        path = parent_path + (name,)
+        if path in self.__paths:
+            return (True, None)
+        if (path in self.__ancestors) or (0 == len(parent_path)):
+            return (True, path)
+        return (False, None)
+
 class PyXBSAXHandler (pyxb.utils.saxutils.BaseSAXHandler):
     """A SAX handler class which generates a binding instance for a document
     through a streaming parser.
@@ -270,6 +457,23 @@ class PyXBSAXHandler (pyxb.utils.saxutils.BaseSAXHandler):
     __domHandler = None
     __domDepth = None
 
+    # An _ElementSelector identifying elements of interest, or None
+    __elementSelector = None
+
+    # Callable invoked with each completed element of interest
+    __elementCallback = None
+
+    # Whether elements of interest are removed from their parents
+    __detachElements = False
+
+    # An _ElementProjection identifying the elements that are converted, or
+    # None to convert all elements
+    __projection = None
+
+    # The number of open elements within a skipped subtree, including the
+    # top of the subtree.  Zero when content is being converted.
+    __skipDepth = 0
+
     def rootObject (self):
         """Return the binding object corresponding to the top-most
         element in the document
@@ -294,6 +498,9 @@ class PyXBSAXHandler (pyxb.utils.saxutils.BaseSAXHandler):
         """
         super(PyXBSAXHandler, self).reset()
         self.__rootObject = None
+        self.__skipDepth = 0
+        if self.__projection is not None:
+            self.elementState().setProjectionPath(())
         return self
 
     def __init__ (self, **kw):
@@ -302,104 +509,187 @@ class PyXBSAXHandler (pyxb.utils.saxutils.BaseSAXHandler):
         @keyword element_state_constructor: Overridden with the value
         L{_SAXElementState} before invoking the L{superclass
         constructor<pyxb.utils.saxutils.BaseSAXHandler.__init__>}.
+
+        @keyword element_names: Optional iterable identifying elements of
+        interest, either by expanded name or by a tuple of expanded names
+        giving the path from the document element.
+
+        @keyword element_callback: A callable that is invoked with the
+        validated binding instance of each element of interest as soon as
+        the end of the element is reached.
+
+        @keyword detach_elements: If C{True}, elements of interest are
+        validated against the content model of their parent but are not
+        stored in it, so memory use does not grow with the number of such
+        elements in the document.  The parent instance will not be complete,
+        and generally cannot be converted back to a valid document.  Default
+        is C{False}.
+
+        @keyword keep_elements: Optional iterable identifying the elements to
+        be converted to bindings, expressed as for C{element_names}.  Other
+        elements, and all their content, are skipped without creating
+        bindings.  A skipped element must still be permitted by the content
+        model of its parent, but its absence from the parent instance is not
+        an error.  See L{_ElementProjection} for details.  The resulting
+        instances generally cannot be converted back to a valid document.
         """
 
         kw.setdefault('element_state_constructor', _SAXElementState)
+        element_names = kw.pop('element_names', None)
+        self.__elementCallback = kw.pop('element_callback', None)
+        self.__detachElements = kw.pop('detach_elements', False)
+        keep_elements = kw.pop('keep_elements', None)
+        if keep_elements is not None:
+            self.__projection = _ElementProjection(keep_elements)
+        if element_names is not None:
+            self.__elementSelector = _ElementSelector(element_names)
+            if not self.__elementSelector:
+                self.__elementSelector = None
         super(PyXBSAXHandler, self).__init__(**kw)
         self.reset()
 
-    def startElementNS (self, name, qname, attrs):
-        (this_state, parent_state, ns_ctx, name_en) = super(PyXBSAXHandler, self).startElementNS(name, qname, attrs)
+    def __setErrorLocation (self, e):
+        # Errors detected in objects that have no location, as when
+        # location tracking is disabled, are assigned the current location.
+        if e.location is None:
+            e.location = self.errorLocation()
+
+    def startPrefixMapping (self, prefix, uri):
+        if 0 < self.__skipDepth:
+            return
+        super(PyXBSAXHandler, self).startPrefixMapping(prefix, uri)
+
+    def characters (self, content):
+        if 0 < self.__skipDepth:
+            return
+        super(PyXBSAXHandler, self).characters(content)
+
+    def ignorableWhitespace (self, whitespace):
+        if 0 < self.__skipDepth:
+            return
+        super(PyXBSAXHandler, self).ignorableWhitespace(whitespace)
+
+    def __skipElement (self, this_state, parent_state, name_en):
+        # Begin skipping the subtree rooted at the element.  The element is
+        # presented to the content model of the parent, but is not stored.
+        self.__skipDepth = 1
+        enclosing_ctd = parent_state.enclosingCTD()
+        if enclosing_ctd is None:
+            return
+        element_decl = enclosing_ctd._ElementDispatchForName(name_en)[1]
+        if element_decl is not None:
+            parent_state.detachElementContent(this_state.location(), None, element_decl)
 
-        # Delegate processing if in DOM mode
-        if this_state.inDOMMode():
-            return this_state.startDOMElement(attrs)
-
-        # Resolve the element within the appropriate context.  Note
-        # that global elements have no use, only the binding.
-        if parent_state.enclosingCTD() is not None:
-            (element_binding, element_decl) = parent_state.enclosingCTD()._ElementBindingDeclForName(name_en)
-        else:
-            element_decl = None
-            element_binding = name_en.elementBinding()
-        this_state.setElementBinding(element_binding)
-
-        # Non-root elements should have an element use, from which we can
-        # extract the binding if we couldn't find one elsewhere.  (Keep any
-        # current binding, since it may be a member of a substitution group.)
-        if (element_decl is not None) and (element_binding is None):
-            assert self.__rootObject is not None
-            element_binding = element_decl.elementBinding()
-            assert element_binding is not None
-
-        # Start knowing nothing
-        type_class = None
-        if element_binding is not None:
-            element_binding = element_binding.elementForName(name)
-            type_class = element_binding.typeDefinition()
-
-        # Process an xsi:type attribute, if present
-        if self.__XSITypeTuple in attrs:
-            (did_replace, type_class) = XSI._InterpretTypeAttribute(attrs.getValue(self.__XSITypeTuple), ns_ctx, self.fallbackNamespace(), type_class)
-            if did_replace:
-                element_binding = None
-
-        if type_class is None:
-            # Bother.  We don't know what this thing is.  But that's not an
-            # error, if the schema accepts wildcards.  For consistency with
-            # the DOM-based interface, we need to build a DOM node.
-            return this_state.enterDOMMode(attrs)
-
-        if element_binding is not None:
-            # Invoke binding __call__ method not Factory, so can check for
-            # abstract elements.
-            new_object_factory = element_binding
-        else:
-            new_object_factory = type_class.Factory
+    def startElementNS (self, name, qname, attrs):
+        if 0 < self.__skipDepth:
+            self.__skipDepth += 1
+            return
+        try:
+            (this_state, parent_state, ns_ctx, name_en) = super(PyXBSAXHandler, self).startElementNS(name, qname, attrs)
+
+            # Delegate processing if in DOM mode
+            if this_state.inDOMMode():
+                return this_state.startDOMElement(attrs)
+
+            # Skip the element if it is not selected by the projection
+            parent_path = parent_state.projectionPath()
+            if parent_path is not None:
+                (retain, projection_path) = self.__projection.projectChild(parent_path, name_en)
+                if not retain:
+                    return self.__skipElement(this_state, parent_state, name_en)
+                this_state.setProjectionPath(projection_path)
+
+            # Resolve the element within the appropriate context.  Note
+            # that global elements have no use, only the binding.  The
+            # resolution accounts for substitution groups, and is cached by the
+            # enclosing class.
+            enclosing_ctd = parent_state.enclosingCTD()
+            if enclosing_ctd is not None:
+                (element_binding, element_decl, type_class, is_ctd) = enclosing_ctd._ElementDispatchForName(name_en)
+            else:
+                (element_binding, element_decl, type_class, is_ctd) = basis.element._GlobalDispatchForName(name_en)
+            this_state.setElementBinding(element_binding)
+
+            # Process an xsi:type attribute, if present
+            if self.__XSITypeTuple in attrs:
+                (did_replace, type_class) = XSI._InterpretTypeAttribute(attrs.getValue(self.__XSITypeTuple), ns_ctx, self.fallbackNamespace(), type_class)
+                if did_replace:
+                    element_binding = None
+                    is_ctd = issubclass(type_class, pyxb.binding.basis.complexTypeDefinition)
+
+            if type_class is None:
+                # Bother.  We don't know what this thing is.  But that's not an
+                # error, if the schema accepts wildcards.  For consistency with
+                # the DOM-based interface, we need to build a DOM node.
+                return this_state.enterDOMMode(attrs)
+
+            if element_binding is not None:
+                # Invoke binding __call__ method not Factory, so can check for
+                # abstract elements.
+                new_object_factory = element_binding
+            else:
+                new_object_factory = type_class.Factory
 
-        # Update the enclosing complex type definition for this
-        # element state.
-        assert type_class is not None
-        if issubclass(type_class, pyxb.binding.basis.complexTypeDefinition):
-            this_state.setEnclosingCTD(type_class)
-        else:
-            this_state.setEnclosingCTD(parent_state.enclosingCTD())
+            # Update the enclosing complex type definition for this
+            # element state.
+            assert type_class is not None
+            if is_ctd:
+                this_state.setEnclosingCTD(type_class)
+            else:
+                this_state.setEnclosingCTD(enclosing_ctd)
 
-        # Process the element start.  This may or may not return a
-        # binding object.
-        binding_object = this_state.startBindingElement(type_class, new_object_factory, element_decl, attrs)
+            # Process the element start.  This may or may not return a
+            # binding object.
+            binding_object = this_state.startBindingElement(type_class, new_object_factory, element_decl, attrs)
 
-        # If the top-level element has complex content, this sets the
-        # root object.  If it has simple content, see endElementNS.
-        if self.__rootObject is None:
-            self.__rootObject = binding_object
+            # If the top-level element has complex content, this sets the
+            # root object.  If it has simple content, see endElementNS.
+            if self.__rootObject is None:
+                self.__rootObject = binding_object
+        except pyxb.ValidationError as e:
+            self.__setErrorLocation(e)
+            raise
 
     def endElementNS (self, name, qname):
-        this_state = super(PyXBSAXHandler, self).endElementNS(name, qname)
-        if this_state.inDOMMode():
-            # Delegate processing if in DOM mode.  Note that completing this
-            # element may take us out of DOM mode.  In any case, the returned
-            # binding object is a DOM element instance.
-            binding_object = this_state.endDOMElement()
-        else:
-            # Process the element end.  This will return a binding object,
-            # either the one created at the start or the one created at
-            # the end.
-            binding_object = this_state.endBindingElement()
-        assert binding_object is not None
-
-        # If we don't have a root object, save it.  No, there is not a
-        # problem doing this on the close of the element.  If the
-        # top-level element has complex content, the object was
-        # created on start, and the root object has been assigned.  If
-        # it has simple content, then there are no internal elements
-        # that could slip in and set this before we get to it here.
-        #
-        # Unless we're still in DOM mode, in which case this isn't really the
-        # root object.  Then the real root object will be the one that caused
-        # us to enter DOM mode.
-        if (self.__rootObject is None) and not this_state.inDOMMode():
-            self.__rootObject = binding_object
+        if 0 < self.__skipDepth:
+            self.__skipDepth -= 1
+            if 0 == self.__skipDepth:
+                super(PyXBSAXHandler, self).endElementNS(name, qname)
+            return
+        try:
+            this_state = super(PyXBSAXHandler, self).endElementNS(name, qname)
+            if this_state.inDOMMode():
+                # Delegate processing if in DOM mode.  Note that completing this
+                # element may take us out of DOM mode.  In any case, the returned
+                # binding object is a DOM element instance.
+                binding_object = this_state.endDOMElement()
+            elif (self.__elementSelector is not None) and self.__elementSelector.matches(this_state):
+                # An element of interest.  Complete it, then notify the caller.
+                binding_object = this_state.endBindingElement(detach=self.__detachElements)
+                if self.__elementCallback is not None:
+                    self.__elementCallback(binding_object)
+            else:
+                # Process the element end.  This will return a binding object,
+                # either the one created at the start or the one created at
+                # the end.
+                binding_object = this_state.endBindingElement()
+            assert binding_object is not None
+
+            # If we don't have a root object, save it.  No, there is not a
+            # problem doing this on the close of the element.  If the
+            # top-level element has complex content, the object was
+            # created on start, and the root object has been assigned.  If
+            # it has simple content, then there are no internal elements
+            # that could slip in and set this before we get to it here.
+            #
+            # Unless we're still in DOM mode, in which case this isn't really the
+            # root object.  Then the real root object will be the one that caused
+            # us to enter DOM mode.
+            if (self.__rootObject is None) and not this_state.inDOMMode():
+                self.__rootObject = binding_object
+        except pyxb.ValidationError as e:
+            self.__setErrorLocation(e)
+            raise
 
 def make_parser (*args, **kw):
     """Extend L{pyxb.utils.saxutils.make_parser} to change the default
@@ -408,6 +698,207 @@ def make_parser (*args, **kw):
     kw.setdefault('content_handler_constructor', PyXBSAXHandler)
     return pyxb.utils.saxutils.make_parser(*args, **kw)
 
+class _ParserPool (threading.local):
+    """A per-thread cache of parsers created by L{make_parser}.
+
+    Parsers are keyed by the fallback namespace, location base, and location
+    tracking option provided to the handler, as well as the XML style and parser modules in effect
+    when they were created.  A parser is removed from the pool while it is in
+    use, so nested parses obtain distinct parsers."""
+
+    KeyLimit = 16
+    """The maximum number of distinct keys for which parsers are retained.
+    When the limit is exceeded the pool is emptied."""
+
+    ParserLimit = 4
+    """The maximum number of idle parsers retained for each key."""
+
+    def __init__ (self):
+        self.__parsers = {}
+
+    def __key (self, fallback_namespace, location_base, track_locations):
+        return (fallback_namespace, location_base, track_locations, pyxb._XMLStyle, tuple(pyxb.utils.saxutils._CreateParserModules))
+
+    def acquire (self, fallback_namespace=None, location_base=None, track_locations=None):
+        """Return C{(key, parser)} where the parser is ready to parse a new
+        document."""
+        key = self.__key(fallback_namespace, location_base, track_locations)
+        idle = self.__parsers.get(key)
+        if idle:
+            return (key, idle.pop())
+        return (key, make_parser(fallback_namespace=fallback_namespace, location_base=location_base, track_locations=track_locations))
+
+    def release (self, key, parser):
+        """Return a parser obtained from L{acquire} to the pool."""
+        # Drop references to the document that was just processed.
+        parser.getContentHandler().reset()
+        idle = self.__parsers.get(key)
+        if idle is None:
+            if len(self.__parsers) >= self.KeyLimit:
+                self.__parsers.clear()
+            idle = self.__parsers[key] = []
+        if len(idle) < self.ParserLimit:
+            idle.append(parser)
+
+_ParserPoolInstance = _ParserPool()
+
+def parse_pooled (source, fallback_namespace=None, location_base=None, track_locations=None):
+    """Parse a document using a parser taken from a per-thread pool.
+
+    Creating a parser and its L{PyXBSAXHandler} is a substantial part of the
+    cost of converting a small document.  This function reuses parsers,
+    relying on L{PyXBSAXHandler.reset} to prepare them for a new document.
+
+    @param source: A file-like object, a byte string holding the document, or
+    anything else acceptable to C{xml.sax.xmlreader.XMLReader.parse}.
+
+    @keyword fallback_namespace: As with L{make_parser}.
+
+    @keyword location_base: As with L{make_parser}.  Parsers are pooled
+    separately for each distinct value.
+
+    @keyword track_locations: As with L{make_parser}.  Parsers are pooled
+    separately for each distinct value.
+
+    @return: The L{root object<PyXBSAXHandler.rootObject>} of the document.
+    """
+    if isinstance(source, six.binary_type):
+        source = io.BytesIO(source)
+    (key, saxer) = _ParserPoolInstance.acquire(fallback_namespace, location_base, track_locations)
+    try:
+        saxer.parse(source)
+        return saxer.getContentHandler().rootObject()
+    finally:
+        _ParserPoolInstance.release(key, saxer)
+
+class FeedParser (object):
+    """Parse a document that is supplied incrementally.
+
+    This allows parsing to overlap with receipt of the document, e.g. from a
+    network connection, without buffering the entire document first.  An
+    example::
+
+      parser = pyxb.binding.saxer.FeedParser(element_names=[ po.Namespace.createExpandedName('item') ],
+                                             element_callback=process_item)
+      for chunk in chunks:
+          parser.feed(chunk)
+      instance = parser.close()
+
+    Keywords are passed to L{make_parser}; in particular, the
+    C{element_names}, C{element_callback}, and C{detach_elements} keywords of
+    L{PyXBSAXHandler} may be used to be notified of completed subtrees as
+    they become available.
+    """
+
+    # The xml.sax.xmlreader.IncrementalParser instance
+    __saxer = None
+
+    # The PyXBSAXHandler instance
+    __handler = None
+
+    def __init__ (self, **kw):
+        self.__saxer = make_parser(**kw)
+        self.__handler = self.__saxer.getContentHandler()
+        self.__setDocumentLocator()
+
+    def __setDocumentLocator (self):
+        # xml.sax.expatreader provides the handler with a locator only when
+        # parse() is used.  ExpatParser provides its own on reset.
+        if isinstance(self.__saxer, xml.sax.expatreader.ExpatParser):
+            self.__handler.setDocumentLocator(xml.sax.expatreader.ExpatLocator(self.__saxer))
+
+    def contentHandler (self):
+        """The L{PyXBSAXHandler} instance used to build the bindings."""
+        return self.__handler
+
+    def feed (self, data):
+        """Process the next chunk of the document.
+
+        @param data: A byte string, or a text string which is encoded using
+        L{pyxb._InputEncoding} as done by the generated C{CreateFromDocument}.
+        @return: C{self}
+        """
+        if isinstance(data, six.text_type):
+            data = data.encode(pyxb._InputEncoding)
+        self.__saxer.feed(data)
+        return self
+
+    def close (self):
+        """Indicate that the document is complete.
+
+        @return: the result of L{rootObject}
+        """
+        self.__saxer.close()
+        return self.rootObject()
+
+    def rootObject (self):
+        """Return the binding object for the document element.
+
+        See L{PyXBSAXHandler.rootObject}."""
+        return self.__handler.rootObject()
+
+    def reset (self):
+        """Prepare to parse a new document.
+
+        @return: C{self}
+        """
+        self.__saxer.reset()
+        self.__setDocumentLocator()
+        return self
+
+def iterparse (source, element_names, **kw):
+    """Generate binding instances for selected elements as the document is parsed.
+
+    The document is read incrementally.  Each element identified by
+    C{element_names} is yielded as soon as its end tag has been processed and
+    its binding instance has been validated.  These elements are detached
+    from the enclosing binding instance: the content model of the parent is
+    still checked, but the parent does not retain them.  Memory use is
+    therefore proportional to the size of one selected element, not to the
+    size of the document.  An example::
+
+      for prog in pyxb.binding.saxer.iterparse('schedule.xml', [ tvd.Namespace.createExpandedName('program') ]):
+          process(prog)
+
+    @param source: A file-like object with a C{read} method, a byte string
+    holding the document, or the path to a file holding the document.
+
+    @param element_names: The elements to be yielded, expressed as for the
+    C{element_names} keyword of L{PyXBSAXHandler}.
+
+    @keyword chunk_size: The number of bytes to read from the source at a
+    time.  Default is 64KiB.
+
+    Remaining keywords are passed to L{make_parser}.
+    """
+    chunk_size = kw.pop('chunk_size', 65536)
+    pending = collections.deque()
+    kw['element_names'] = element_names
+    kw['element_callback'] = pending.append
+    kw['detach_elements'] = True
+    parser = FeedParser(**kw)
+    close_source = False
+    if not hasattr(source, 'read'):
+        if isinstance(source, six.binary_type):
+            source = io.BytesIO(source)
+        else:
+            source = open(source, 'rb')
+            close_source = True
+    try:
+        while True:
+            data = source.read(chunk_size)
+            if not data:
+                break
+            parser.feed(data)
+            while pending:
+                yield pending.popleft()
+        parser.close()
+        while pending:
+            yield pending.popleft()
+    finally:
+        if close_source:
+            source.close()
+
 ## Local Variables:
 ## fill-column:78
 ## End:
@@ -452,28 +452,33 @@ class NamespaceContext (object):
         return self.__inScopeNamespaces
     __inScopeNamespaces = None
 
-    """Map from L{Namespace} instances to sets of prefix strings associated
-    with the namespace.  The default namespace is not represented."""
+    """Map from L{Namespace} instances to frozensets of prefix strings
+    associated with the namespace.  The default namespace is not
+    represented."""
     __inScopePrefixes = None
 
+    # The prefix maps are shared among contexts until one of them changes a
+    # binding.  A context may modify its maps in place only when
+    # __mutableInScopeNamespaces is set, indicating it holds the only
+    # reference to them; otherwise it must first obtain private copies
+    # through __clonePrefixMap.  The sets in __inScopePrefixes are frozen
+    # and replaced when changed, so a copy of the outer dict suffices.
+
     def __removePrefixMap (self, pfx):
         ns = self.__inScopeNamespaces.pop(pfx, None)
         if ns is not None:
             pfxs = self.__inScopePrefixes.get(ns)
-            if pfxs is not None:
-                pfxs.discard(pfx)
+            if (pfxs is not None) and (pfx in pfxs):
+                self.__inScopePrefixes[ns] = pfxs.difference((pfx,))
 
     def __addPrefixMap (self, pfx, ns):
         # Any previous assignment must have already been removed
         self.__inScopeNamespaces[pfx] = ns
-        self.__inScopePrefixes.setdefault(ns, set()).add(pfx)
+        self.__inScopePrefixes[ns] = self.__inScopePrefixes.get(ns, frozenset()).union((pfx,))
 
     def __clonePrefixMap (self):
         self.__inScopeNamespaces = self.__inScopeNamespaces.copy()
-        isp = {}
-        for (ns, pfxs) in six.iteritems(self.__inScopePrefixes):
-            isp[ns] = pfxs.copy()
-        self.__inScopePrefixes = isp
+        self.__inScopePrefixes = self.__inScopePrefixes.copy()
 
     # Class-scope initial map from prefix to namespace
     __InitialScopeNamespaces = None
@@ -493,7 +498,7 @@ class NamespaceContext (object):
         cls.__InitialScopeNamespaces = builtin._UndeclaredNamespaceMap
         cls.__InitialScopePrefixes = {}
         for (pfx, ns) in six.iteritems(cls.__InitialScopeNamespaces):
-            cls.__InitialScopePrefixes.setdefault(ns, set()).add(pfx)
+            cls.__InitialScopePrefixes[ns] = cls.__InitialScopePrefixes.get(ns, frozenset()).union((pfx,))
 
     def prefixForNamespace (self, namespace):
         """Return a prefix associated with the given namespace in this
@@ -570,9 +575,6 @@ class NamespaceContext (object):
 
     def processXMLNS (self, prefix, uri):
         from pyxb.namespace import builtin
-        if not self.__mutableInScopeNamespaces:
-            self.__clonePrefixMap()
-            self.__mutableInScopeNamespaces = True
         if builtin.XML.boundPrefix() == prefix:
             # Bound prefix xml is permitted if it's bound to the right URI, or
             # if the scope is being left.  In neither case is the mapping
@@ -581,13 +583,20 @@ class NamespaceContext (object):
                 return
             raise pyxb.LogicError('Cannot manipulate bound prefix xml')
         if uri:
+            ns = utility.NamespaceForURI(uri, create_if_missing=True)
+            # A declaration that repeats the binding already in scope, as is
+            # common in SOAP messages, does not require a copy of the maps.
+            if self.__inScopeNamespaces.get(prefix) is not ns:
+                if not self.__mutableInScopeNamespaces:
+                    self.__clonePrefixMap()
+                    self.__mutableInScopeNamespaces = True
+                if prefix is None:
+                    self.__inScopeNamespaces[None] = ns
+                else:
+                    self.__removePrefixMap(prefix)
+                    self.__addPrefixMap(prefix, ns)
             if prefix is None:
-                ns = self.__defaultNamespace = utility.NamespaceForURI(uri, create_if_missing=True)
-                self.__inScopeNamespaces[None] = self.__defaultNamespace
-            else:
-                ns = utility.NamespaceForURI(uri, create_if_missing=True)
-                self.__removePrefixMap(prefix)
-                self.__addPrefixMap(prefix, ns)
+                self.__defaultNamespace = ns
             if self.__targetNamespace:
                 self.__targetNamespace._referenceNamespace(ns)
             else:
@@ -600,7 +609,11 @@ class NamespaceContext (object):
             # if you try it.  I don't think it's legal.
             if prefix is not None:
                 raise pyxb.NamespaceError(self, 'Attempt to undefine non-default namespace %s' % (prefix,))
-            self.__removePrefixMap(prefix)
+            if prefix in self.__inScopeNamespaces:
+                if not self.__mutableInScopeNamespaces:
+                    self.__clonePrefixMap()
+                    self.__mutableInScopeNamespaces = True
+                self.__removePrefixMap(prefix)
             self.__defaultNamespace = None
 
     def finalizeTargetNamespace (self, tns_uri=None, including_context=None):
@@ -707,8 +720,9 @@ class NamespaceContext (object):
         if parent_context is not None:
             self.__inScopeNamespaces = parent_context.__inScopeNamespaces
             self.__inScopePrefixes = parent_context.__inScopePrefixes
-            if parent_context.__mutableInScopeNamespaces:
-                self.__clonePrefixMap()
+            # The maps are now shared, so neither context may modify them
+            # without first making its own copy.
+            parent_context.__mutableInScopeNamespaces = False
             self.__defaultNamespace = parent_context.defaultNamespace()
             self.__targetNamespace = parent_context.targetNamespace()
             self.__fallbackToTargetNamespace = parent_context.__fallbackToTargetNamespace
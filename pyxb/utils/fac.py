@@ -140,6 +140,23 @@ class SymbolMatch_mixin (object):
     def match (self, symbol):
         raise NotImplementedError('%s.match' % (type(self).__name__,))
 
+    def indexKey (self):
+        """Return a key that any symbol accepted by L{match} must produce
+        from L{SymbolIndexKey}.
+
+        Compiled automata use this to index the transitions out of a state,
+        so that L{match} is invoked only on plausible candidates.  The
+        default of C{None} indicates that this may match any symbol."""
+        return None
+
+    @classmethod
+    def SymbolIndexKey (cls, symbol):
+        """Return the key used to select transitions for C{symbol}.
+
+        This is compared with L{indexKey}.  C{None} indicates that the
+        symbol must be checked against every transition."""
+        return None
+
 class State (object):
     """A thin wrapper around an object reference.
 
@@ -379,7 +396,13 @@ class CounterCondition (object):
 
     Instances of this class serve as keys for the counters that
     represent the configuration of a FAC.  The instance also maintains
-    a pointer to application-specific L{metadata}."""
+    a pointer to application-specific L{metadata}.
+
+    When an L{Automaton} is constructed each of its counter conditions is
+    assigned an L{index}, and the counters of a L{Configuration} are held
+    in a list at those positions.  The condition implements C{__index__},
+    so it may be used directly to subscript that list as well as a map
+    keyed by condition."""
 
     __min = None
     def __get_min (self):
@@ -404,6 +427,22 @@ class CounterCondition (object):
         return self.__metadata
     metadata = property(__get_metadata)
 
+    __index = None
+    def __get_index (self):
+        """The position of the counter in the counter values of a
+        L{Configuration}.
+
+        This is C{None} until the condition is used to construct an
+        L{Automaton}."""
+        return self.__index
+    index = property(__get_index)
+
+    def _set_index (self, index):
+        self.__index = index
+
+    def __index__ (self):
+        return self.__index
+
     def __init__ (self, min, max, metadata=None):
         """Create a counter condition.
 
@@ -414,9 +453,10 @@ class CounterCondition (object):
         self.__min = min
         self.__max = max
         self.__metadata = metadata
+        self.__hash = hash(self.__min) ^ hash(self.__max) ^ hash(self.__metadata)
 
     def __hash__ (self):
-        return hash(self.__min) ^ hash(self.__max) ^ hash(self.__metadata)
+        return self.__hash
 
     def __eq__ (self, other):
         return (other is not None) \
@@ -483,7 +523,8 @@ class UpdateInstruction:
         associated counter.
 
         @param counter_values: A map from  L{CounterCondition}s to
-        non-negative integers
+        non-negative integers, or a list of counter values indexed by
+        L{CounterCondition.index}
 
         @return:  C{True} or C{False}
         """
@@ -519,7 +560,8 @@ class UpdateInstruction:
         """Apply the update instruction to the provided counter values.
 
         @param counter_values: A map from L{CounterCondition} to
-        integer counter values.  This map is updated in-place."""
+        integer counter values, or a list of counter values indexed by
+        L{CounterCondition.index}.  This is updated in-place."""
         if not self.satisfiedBy(counter_values):
             raise UpdateApplicationError(self, counter_values)
         value = counter_values[self.__counterCondition]
@@ -557,6 +599,20 @@ class UpdateInstruction:
     def __str__ (self):
         return '%s %s' % (self.__doIncrement and 'inc' or 'reset', self.__counterCondition)
 
+def _CounterOpsSatisfiedBy (counter_ops, counter_values):
+    """Return C{True} iff the counter values satisfy the operations.
+
+    This is L{UpdateInstruction.Satisfies} for instructions that have been
+    unpacked by L{Transition._counterOps}."""
+    for (_, ci, do_increment, cmin, cmax) in counter_ops:
+        value = counter_values[ci]
+        if do_increment:
+            if (cmax is not None) and (value >= cmax):
+                return False
+        elif value < cmin:
+            return False
+    return True
+
 class Transition (object):
     """Representation of a FAC state transition."""
 
@@ -615,6 +671,19 @@ class Transition (object):
         self.__updateInstructions = update_instructions
         self.__layerLink = layer_link
 
+    __counterOps = None
+    def _counterOps (self):
+        """The L{updateInstructions} unpacked for evaluation.
+
+        This is a tuple containing, for each instruction in order, the
+        tuple C{(instruction, counter_index, do_increment, min, max)}, so
+        checking and applying the instructions requires no method calls.
+        It is computed on first use, after the L{CounterCondition.index}
+        values have been assigned."""
+        if self.__counterOps is None:
+            self.__counterOps = tuple([ (_ui, _ui.counterCondition.index, _ui.doIncrement, _ui.counterCondition.min, _ui.counterCondition.max) for _ui in self.__updateInstructions ])
+        return self.__counterOps
+
     def consumingState (self):
         """Return the state in this transition chain that must match a symbol."""
 
@@ -693,7 +762,18 @@ class Transition (object):
             configuration = layer_link.leaveAutomaton(configuration)
         elif isinstance(layer_link, Automaton):
             configuration = configuration.enterAutomaton(layer_link)
-        UpdateInstruction.Apply(self.updateInstructions, configuration._get_counterValues())
+        # Equivalent to UpdateInstruction.Apply
+        counter_values = configuration._get_counterValues()
+        for (ui, ci, do_increment, cmin, cmax) in self._counterOps():
+            value = counter_values[ci]
+            if do_increment:
+                if (cmax is not None) and (value >= cmax):
+                    raise UpdateApplicationError(ui, counter_values)
+                counter_values[ci] = value + 1
+            else:
+                if value < cmin:
+                    raise UpdateApplicationError(ui, counter_values)
+                counter_values[ci] = 1
         configuration._set_state(self.destination, layer_link is None)
         if self.__nextTransition is None:
             return configuration
@@ -852,8 +932,9 @@ class Configuration (Configuration_ABC):
     __counterValues = None
     """The values of the counters.
 
-    This is a map from the CounterCondition instances of the
-    underlying automaton to integer values."""
+    This is a list of integer values indexed by the
+    L{CounterCondition.index} of the counter conditions of the
+    underlying automaton."""
     def _get_counterValues (self):
         return self.__counterValues
 
@@ -947,12 +1028,12 @@ class Configuration (Configuration_ABC):
         return self.__subConfiguration
 
     def satisfies (self, transition):
-        return UpdateInstruction.Satisfies(self.__counterValues, transition.updateInstructions)
+        return _CounterOpsSatisfiedBy(transition._counterOps(), self.__counterValues)
 
     def reset (self):
         fac = self.__automaton
         self.__state = None
-        self.__counterValues = dict(zip(fac.counterConditions, len(fac.counterConditions) * (1,)))
+        self.__counterValues = len(fac.counterConditions) * [1]
         self.__subConfiguration = None
         self.__subAutomata = None
 
@@ -978,6 +1059,32 @@ class Configuration (Configuration_ABC):
         result in a lits with multiple members. """
 
         fac = self.__automaton
+        compiled = fac._compiledTransitions(self.__state)
+        if compiled is not None:
+            # No layer changes are possible, so only the counters and the
+            # symbol need be checked.
+            (compiled, symbol_key, index) = compiled
+            counter_values = self.__counterValues
+            cache_key = None
+            if (symbol is not None) and (symbol_key is not None):
+                key = symbol_key(symbol)
+                if key is not None:
+                    (compiled, counter_caps) = index.get(key, index[None])
+                    if (counter_caps is not None) and (0 < CandidateTransitionCache.limit()):
+                        cache_key = (self.__state, fac, key, tuple([ min(counter_values[_ci], _cap) for (_ci, _cap) in counter_caps ]))
+                        transitions = CandidateTransitionCache.lookup(cache_key)
+                        if transitions is not None:
+                            return list(transitions)
+            transitions = []
+            for (xit, state, counter_ops) in compiled:
+                if counter_ops and not _CounterOpsSatisfiedBy(counter_ops, counter_values):
+                    continue
+                if (symbol is None) or state.match(symbol):
+                    transitions.append(xit)
+            if cache_key is not None:
+                CandidateTransitionCache.store(cache_key, tuple(transitions))
+            return transitions
+
         transitions = []
         if symbol is None:
             match_filter = lambda _xit: True
@@ -1057,6 +1164,37 @@ class Configuration (Configuration_ABC):
         self.__superConfiguration = super_configuration
         self.reset()
 
+    def signature (self):
+        """Return a value that identifies the behavior of the configuration.
+
+        Two configurations with equal signatures accept the same sequences of
+        symbols, reaching configurations with equal signatures, and are
+        equally accepting.  The signature covers the whole chain of
+        configurations through the layers of automata: for each, the state,
+        the unprocessed sub-automata, and the counter values.  Counter values
+        at or above the limit beyond which all values satisfy the same
+        checks are treated as equal.
+
+        This is used to discard redundant configurations when following
+        multiple paths through a non-deterministic automaton.
+
+        @return: A hashable value"""
+        root = self
+        depth = 0
+        while root.__superConfiguration is not None:
+            root = root.__superConfiguration
+            depth += 1
+        signature = [ depth ]
+        cfg = root
+        while cfg is not None:
+            caps = cfg.__automaton._counterCaps()
+            subautomata = cfg.__subAutomata
+            if subautomata is not None:
+                subautomata = tuple(subautomata)
+            signature.append((cfg.__automaton, cfg.__state, subautomata, tuple([ min(_v, _c) for (_v, _c) in zip(cfg.__counterValues, caps) ])))
+            cfg = cfg.__subConfiguration
+        return tuple(signature)
+
     def clone (self, clone_map=None):
         """Clone a configuration and its descendents.
 
@@ -1084,7 +1222,7 @@ class Configuration (Configuration_ABC):
         other = type(self)(self.__automaton)
         clone_map[self] = other
         other.__state = self.__state
-        other.__counterValues = self.__counterValues.copy()
+        other.__counterValues = self.__counterValues[:]
         other.__superConfiguration = super_configuration
         if self.__subAutomata is not None:
             other.__subAutomata = self.__subAutomata[:]
@@ -1093,7 +1231,7 @@ class Configuration (Configuration_ABC):
         return other
 
     def __str__ (self):
-        return '%s: %s' % (self.__state, ' ; '.join([ '%s=%u' % (_c,_v) for (_c,_v) in six.iteritems(self.__counterValues)]))
+        return '%s: %s' % (self.__state, ' ; '.join([ '%s=%u' % (_c,self.__counterValues[_c.index]) for _c in self.__automaton.counterConditions ]))
 
 class MultiConfiguration (Configuration_ABC):
     """Support parallel execution of state machine.
@@ -1156,6 +1294,156 @@ class MultiConfiguration (Configuration_ABC):
                 accepting.append(cfg)
         return accepting
 
+class TransitionCache (object):
+    """A bounded cache of candidate transitions.
+
+    Where the transitions out of a state of a compiled automaton are
+    indexed, and no transition may match an arbitrary symbol, the
+    candidates for a symbol depend only on the state, the symbol's
+    L{index key<SymbolMatch_mixin.SymbolIndexKey>}, and the values of
+    the counters checked by the transitions.  Documents that repeat the
+    same structure many times repeat the same selections, so
+    L{Configuration.candidateTransitions} records them in
+    L{CandidateTransitionCache}.  Counter values that satisfy the same
+    checks are merged in the key, so a repeated element does not consume
+    a new entry each time it recurs.
+
+    Entries are kept in two generations, which approximates discarding the
+    least recently used entries without per-lookup bookkeeping.  New and
+    recently used entries are placed in the current generation.  When it
+    holds half the L{limit}, it replaces the previous generation, whose
+    entries that were not used in the meantime are discarded.
+
+    The cache holds references to the automata, states, and symbol keys
+    of the entries it retains."""
+
+    __limit = None
+    __current = None
+    __previous = None
+    __hits = None
+    __misses = None
+
+    def __init__ (self, limit=1024):
+        """@param limit: the value for L{limit}"""
+        self.__limit = limit
+        self.clear()
+
+    def limit (self):
+        """The maximum number of entries retained.
+
+        A limit of zero disables the cache."""
+        return self.__limit
+
+    def setLimit (self, limit):
+        """Change the L{limit}, discarding all entries."""
+        self.__limit = limit
+        self.__current = {}
+        self.__previous = {}
+
+    def __insert (self, key, value):
+        if len(self.__current) >= max(1, self.__limit // 2):
+            self.__previous = self.__current
+            self.__current = {}
+        self.__current[key] = value
+
+    def lookup (self, key):
+        """Return the cached value for C{key}, or C{None} if there is none."""
+        value = self.__current.get(key)
+        if value is None:
+            value = self.__previous.get(key)
+            if value is None:
+                self.__misses += 1
+                return None
+            self.__insert(key, value)
+        self.__hits += 1
+        return value
+
+    def store (self, key, value):
+        """Cache C{value} for C{key}."""
+        if 0 < self.__limit:
+            self.__insert(key, value)
+
+    def size (self):
+        """The number of distinct keys in the cache."""
+        return len(self.__current) + len([ _k for _k in self.__previous if not (_k in self.__current) ])
+
+    def hits (self):
+        """The number of lookups that found an entry."""
+        return self.__hits
+
+    def misses (self):
+        """The number of lookups that did not find an entry."""
+        return self.__misses
+
+    def clear (self):
+        """Discard all entries and reset the hit and miss counts."""
+        self.__current = {}
+        self.__previous = {}
+        self.__hits = 0
+        self.__misses = 0
+
+CandidateTransitionCache = TransitionCache(0)
+"""The L{TransitionCache} used by L{Configuration.candidateTransitions}.
+
+This is disabled by default: where symbols are indexed by element
+declaration, as in binding content models, matching the few indexed
+candidates costs less than forming the cache key.  Use
+L{TransitionCache.setLimit} to enable it for automata with symbols that
+are costly to match."""
+
+def _CompileTransitions (transitions):
+    """Build the entry in L{Automaton._compiledTransitions} for a state.
+
+    @return: A tuple C{(compiled, symbol_key, index)}.  C{compiled} is the
+    list of compiled transitions.  C{symbol_key} is
+    L{SymbolMatch_mixin.SymbolIndexKey} for the symbols of the consuming
+    states, or C{None} if the transitions are not indexed.  C{index} maps a
+    value of L{SymbolMatch_mixin.indexKey} to a pair C{(candidates,
+    counter_caps)}.  C{candidates} lists the compiled transitions that might
+    match a symbol with that key; those that might match any symbol are
+    included in each list, and are stored under the key C{None}.  If no
+    transition might match any symbol, the result of matching the
+    candidates depends only on the key and on the counters, and
+    C{counter_caps} lists C{(counter_index, cap)} pairs for the counters
+    they check: values at or above the cap all satisfy the same checks.
+    Otherwise C{counter_caps} is C{None}."""
+    compiled = []
+    keys = []
+    symbol_key = None
+    for xit in transitions:
+        state = xit.destination
+        compiled.append((xit, state, xit._counterOps()))
+        key = None
+        if isinstance(state.symbol, SymbolMatch_mixin):
+            key = state.symbol.indexKey()
+        if key is not None:
+            sk = type(state.symbol).SymbolIndexKey
+            if symbol_key is None:
+                symbol_key = sk
+            elif symbol_key != sk:
+                # Keys from different symbol classes are not comparable
+                return (compiled, None, None)
+        keys.append(key)
+    if symbol_key is None:
+        return (compiled, None, None)
+    index = { None: ([ _c for (_c, _k) in zip(compiled, keys) if _k is None ], None) }
+    cacheable = 0 == len(index[None][0])
+    for key in keys:
+        if not (key in index):
+            candidates = [ _c for (_c, _k) in zip(compiled, keys) if _k in (key, None) ]
+            counter_caps = None
+            if cacheable:
+                caps = {}
+                for (_, _, counter_ops) in candidates:
+                    for (_, ci, _, cmin, cmax) in counter_ops:
+                        cap = cmin
+                        if cmax is not None:
+                            cap = cmax
+                        caps[ci] = max(cap, caps.get(ci, cap))
+                counter_caps = tuple(sorted(six.iteritems(caps)))
+            index[key] = (candidates, counter_caps)
+    return (compiled, symbol_key, index)
+
 class Automaton (object):
     """Representation of a Finite Automaton with Counters.
 
@@ -1226,6 +1514,10 @@ class Automaton (object):
         for st in self.__states:
             st._set_automaton(self)
         self.__counterConditions = frozenset(counter_conditions)
+        # Equal conditions share a counter, as they would as map keys
+        counter_index = { }
+        for cc in counter_conditions:
+            cc._set_index(counter_index.setdefault(cc, len(counter_index)))
         self.__nullable = nullable
         self.__containingState = containing_state
         xit = []
@@ -1240,6 +1532,66 @@ class Automaton (object):
         self.__initialTransitions = xit
         self.__finalStates = frozenset(fnl)
 
+    __compiledTransitions = None
+    def _compiledTransitions (self, state):
+        """Return the compiled transitions out of a state.
+
+        Where an automaton has no sub-automata and is not itself a
+        sub-automaton, every transition consumes a symbol at its
+        destination and no transition changes layers.  On first use such
+        an automaton is compiled into a table that maps each state to a
+        list of C{(transition, consuming_state, counter_ops)} tuples, where
+        C{counter_ops} is from L{Transition._counterOps}, along with an
+        index of that list by the key of the symbol the transition
+        consumes.  L{Configuration.candidateTransitions} uses the table in
+        place of the general transition calculation.
+
+        @param state: A member of L{states}, or C{None} for the initial
+        transitions.
+
+        @return: The value from L{_CompileTransitions} for the state, or
+        C{None} if the automaton cannot be compiled."""
+        table = self.__compiledTransitions
+        if table is None:
+            table = self.__compiledTransitions = self.__compileTransitions()
+        return table.get(state)
+
+    def __compileTransitions (self):
+        table = {}
+        if self.__containingState is not None:
+            return table
+        for st in self.__states:
+            if st.subAutomata is not None:
+                return table
+        table[None] = _CompileTransitions(self.__initialTransitions)
+        for st in self.__states:
+            table[st] = _CompileTransitions(st.transitionSet)
+        return table
+
+    __counterCaps = None
+    def _counterCaps (self):
+        """Return, for each counter by L{CounterCondition.index}, the value
+        at and above which all values satisfy the same update instructions.
+
+        That is the counter maximum if it is bounded, and the minimum if it
+        is not."""
+        if self.__counterCaps is None:
+            caps = len(self.__counterConditions) * [0]
+            for cc in self.__counterConditions:
+                if cc.max is None:
+                    caps[cc.index] = cc.min
+                else:
+                    caps[cc.index] = cc.max
+            self.__counterCaps = caps
+        return self.__counterCaps
+
+    def __getstate__ (self):
+        # The compiled transitions are rebuilt on demand, and hold
+        # references to methods that cannot be pickled.
+        state = self.__dict__.copy()
+        state.pop('_Automaton__compiledTransitions', None)
+        return state
+
     def newConfiguration (self):
         """Return a new L{Configuration} instance for this automaton."""
         return Configuration(self)
@@ -25,6 +25,8 @@ element in the stream.  These classes are extended for specific parsing needs
 from __future__ import print_function
 import xml.sax
 import xml.sax.handler
+import xml.sax.xmlreader
+import xml.parsers.expat
 import io
 import logging
 import pyxb.namespace
@@ -208,9 +210,40 @@ class BaseSAXHandler (xml.sax.handler.ContentHandler, object):
     __locationTemplate = None
 
     def location (self):
-        """Return the current location within the SAX-processed document."""
+        """Return the current location within the SAX-processed document.
+
+        @return: An instance of L{pyxb.utils.utility.Location}, or C{None} if
+        L{location tracking<tracksLocations>} is disabled."""
+        if not self.__trackLocations:
+            return None
         return self.__locationTemplate.newLocation(self.__locator)
 
+    def errorLocation (self):
+        """Return the current location for use in a diagnostic.
+
+        This differs from L{location} only when location tracking is
+        disabled, in which case the result records the line number but not
+        the column."""
+        if self.__trackLocations:
+            return self.location()
+        line_number = None
+        try:
+            line_number = self.__locator.getLineNumber()
+        except:
+            pass
+        return self.__locationTemplate.newLocation(line_number=line_number)
+
+    def tracksLocations (self):
+        """Return C{True} iff locations are recorded for the document
+        currently being processed.
+
+        This is the C{track_locations} keyword provided on construction, or
+        if that was C{None} the value of L{pyxb.TrackParseLocations} when the
+        handler was last L{reset}."""
+        return self.__trackLocations
+    __trackLocations = True
+    __trackLocationsOption = None
+
     # The callable that creates an instance of (a subclass of)
     # L{SAXElementState} as required to hold element-specific information as
     # parsing proceeds.
@@ -286,6 +319,9 @@ class BaseSAXHandler (xml.sax.handler.ContentHandler, object):
                                                              namespace_context=self.__namespaceContext)
         self.__elementStateStack = []
         self.__rootObject = None
+        self.__trackLocations = self.__trackLocationsOption
+        if self.__trackLocations is None:
+            self.__trackLocations = pyxb._TrackParseLocations
         # Note: setDocumentLocator is invoked before startDocument (which
         # calls this), so this method should not reset it.
         return self
@@ -309,12 +345,18 @@ class BaseSAXHandler (xml.sax.handler.ContentHandler, object):
         @keyword location_base: An object to be recorded as the base of all
         L{pyxb.utils.utility.Location} instances associated with events and
         objects handled by the parser.
+
+        @keyword track_locations: If C{False}, locations are not recorded
+        for events and the objects created from them; if C{True}, they are.
+        The default C{None} uses the value of L{pyxb.TrackParseLocations} at
+        the start of each document.
         """
         self.__includingContext = kw.pop('including_context', None)
         self.__fallbackNamespace = kw.pop('fallback_namespace', None)
         self.__elementStateConstructor = kw.pop('element_state_constructor', SAXElementState)
         self.__targetNamespace = kw.pop('target_namespace', None)
         self.__locationTemplate = pyxb.utils.utility.Location(kw.pop('location_base', None))
+        self.__trackLocationsOption = kw.pop('track_locations', None)
 
     def setDocumentLocator (self, locator):
         """Save the locator object."""
@@ -463,6 +505,174 @@ def SetCreateParserModules (create_parser_modules):
     else:
         _CreateParserModules = list(create_parser_modules)
 
+class _ExpatAttributes (dict):
+    """A minimal implementation of C{xml.sax.xmlreader.AttributesNS}.
+
+    Keys are C{(namespaceURI, localName)} pairs, as with the SAX interface.
+    Only the methods used by PyXB content handlers are provided beyond those
+    of C{dict}."""
+
+    def getValue (self, name):
+        return self[name]
+
+    def getNames (self):
+        return list(six.iterkeys(self))
+
+    def getLength (self):
+        return len(self)
+
+class ExpatParser (xml.sax.xmlreader.IncrementalParser, xml.sax.xmlreader.Locator):
+    """A SAX parser that drives a content handler directly from C{pyexpat}.
+
+    C{xml.sax.expatreader} translates each expat event through several layers,
+    constructing an C{AttributesNSImpl} instance and splitting the element and
+    attribute names for each element.  This class registers the handler
+    methods directly with the expat parser, splits names through a cache, and
+    provides attributes as a lightweight dictionary.  Namespace processing is
+    always enabled; qualified names are not provided to the content handler.
+
+    Only the subset of the C{xml.sax.xmlreader.IncrementalParser} interface
+    that is required by L{BaseSAXHandler} and its subclasses is supported.
+    External entities are not resolved.
+
+    Use L{make_parser} with the C{use_expat} keyword, or select
+    L{pyxb.XMLStyle_expat}, to create instances of this class."""
+
+    # The pyexpat parser instance
+    __parser = None
+
+    # Whether parsing is in progress
+    __parsing = False
+
+    # The xml.sax.xmlreader.InputSource being parsed, if known
+    __source = None
+
+    # Map from the expat representation of an expanded name to the SAX
+    # (namespaceURI, localName) pair.
+    __nameMap = None
+
+    def __init__ (self, bufsize=2**16):
+        xml.sax.xmlreader.IncrementalParser.__init__(self, bufsize)
+        self.__nameMap = {}
+
+    def __splitName (self, name):
+        rv = self.__nameMap.get(name)
+        if rv is None:
+            parts = name.split(' ')
+            if 1 == len(parts):
+                rv = (None, name)
+            else:
+                rv = (parts[0], parts[1])
+            self.__nameMap[name] = rv
+        return rv
+
+    def __startElement (self, name, attrs):
+        name_map = self.__nameMap
+        ns_attrs = _ExpatAttributes()
+        if attrs:
+            for (k, v) in six.iteritems(attrs):
+                sk = name_map.get(k)
+                if sk is None:
+                    sk = self.__splitName(k)
+                ns_attrs[sk] = v
+        sn = name_map.get(name)
+        if sn is None:
+            sn = self.__splitName(name)
+        self._cont_handler.startElementNS(sn, None, ns_attrs)
+
+    def __endElement (self, name):
+        sn = self.__nameMap.get(name)
+        if sn is None:
+            sn = self.__splitName(name)
+        self._cont_handler.endElementNS(sn, None)
+
+    def __externalEntityRef (self, context, base, system_id, public_id):
+        # Consistent with _EntityResolver: treat external entities as empty.
+        return 1
+
+    def setFeature (self, name, state):
+        if xml.sax.handler.feature_namespaces == name:
+            if not state:
+                raise xml.sax.SAXNotSupportedException('Namespace processing cannot be disabled')
+            return
+        if xml.sax.handler.feature_namespace_prefixes == name:
+            if state:
+                raise xml.sax.SAXNotSupportedException('Namespace prefixes are not reported')
+            return
+        raise xml.sax.SAXNotRecognizedException('Feature %s not supported' % (name,))
+
+    def getFeature (self, name):
+        if xml.sax.handler.feature_namespaces == name:
+            return True
+        if xml.sax.handler.feature_namespace_prefixes == name:
+            return False
+        raise xml.sax.SAXNotRecognizedException('Feature %s not supported' % (name,))
+
+    def prepareParser (self, source):
+        self.__source = source
+        if source.getSystemId() is not None:
+            self.__parser.SetBase(source.getSystemId())
+
+    def reset (self):
+        parser = xml.parsers.expat.ParserCreate(None, ' ', intern={})
+        parser.buffer_text = True
+        handler = self._cont_handler
+        parser.StartElementHandler = self.__startElement
+        parser.EndElementHandler = self.__endElement
+        parser.StartNamespaceDeclHandler = handler.startPrefixMapping
+        parser.CharacterDataHandler = handler.characters
+        parser.ProcessingInstructionHandler = handler.processingInstruction
+        parser.ExternalEntityRefHandler = self.__externalEntityRef
+        self.__parser = parser
+        self.__parsing = False
+        handler.setDocumentLocator(self)
+
+    def parse (self, source):
+        self.reset()
+        return xml.sax.xmlreader.IncrementalParser.parse(self, source)
+
+    def feed (self, data, isFinal=False):
+        if not self.__parsing:
+            if self.__parser is None:
+                self.reset()
+            self.__parsing = True
+            self._cont_handler.startDocument()
+        try:
+            self.__parser.Parse(data, isFinal)
+        except xml.parsers.expat.error as e:
+            raise xml.sax.SAXParseException(xml.parsers.expat.ErrorString(e.code), e, self)
+
+    def close (self):
+        if not self.__parsing:
+            return
+        self.feed(six.binary_type(), isFinal=True)
+        self._cont_handler.endDocument()
+        self.__parsing = False
+        # A finished expat parser cannot be reused; the next document fed
+        # gets a new one.
+        self.__parser = None
+
+    # Locator interface
+    def getColumnNumber (self):
+        if self.__parser is None:
+            return None
+        return self.__parser.CurrentColumnNumber
+
+    def getLineNumber (self):
+        if self.__parser is None:
+            return 1
+        return self.__parser.CurrentLineNumber
+
+    def getPublicId (self):
+        if self.__source is None:
+            return None
+        return self.__source.getPublicId()
+
+    def getSystemId (self):
+        if self.__source is None:
+            return None
+        return self.__source.getSystemId()
+
 def make_parser (**kw):
     """Extend C{xml.sax.make_parser} to configure the parser the way we
     need it:
@@ -490,11 +700,24 @@ def make_parser (**kw):
     L{pyxb.namespace.ExpandedName}.  This keyword is not used by this
     function, but is passed to the C{content_handler_constructor}.
     @type fallback_namespace: L{pyxb.namespace.Namespace}
+
+    @keyword use_expat: If C{True}, return an L{ExpatParser} which drives
+    the content handler directly from C{pyexpat}; if C{False}, use
+    C{xml.sax.make_parser}.  The default is C{True} iff the
+    L{XML style<pyxb._SetXMLStyle>} is L{pyxb.XMLStyle_expat} and no modules
+    have been provided through L{SetCreateParserModules}.
     """
     content_handler_constructor = kw.pop('content_handler_constructor', BaseSAXHandler)
     content_handler = kw.pop('content_handler', None)
+    use_expat = kw.pop('use_expat', None)
+    if use_expat is None:
+        use_expat = (pyxb.XMLStyle_expat == pyxb._XMLStyle) and not _CreateParserModules
     if content_handler is None:
         content_handler = content_handler_constructor(**kw)
+    if use_expat:
+        parser = ExpatParser()
+        parser.setContentHandler(content_handler)
+        return parser
     parser = xml.sax.make_parser(_CreateParserModules)
     parser.setFeature(xml.sax.handler.feature_namespaces, True)
     parser.setFeature(xml.sax.handler.feature_namespace_prefixes, False)
@@ -276,19 +276,34 @@ def MaybeMatchCharacterClass (text, position):
         return _MatchCharClassEsc(text, position)
     return None
 
+# Translations already performed, keyed by the XML pattern.
+_TranslationCache = { }
+
 def XMLToPython (pattern):
     """Convert the given pattern to the format required for Python
     regular expressions.
 
+    Translations are remembered, so a pattern that appears in several
+    places is translated only once per process.
+
     @param pattern: A Unicode string defining a pattern consistent
     with U{XML regular
     expressions<http://www.w3.org/TR/xmlschema-2/index.html#regexs>}.
 
     @return: A Unicode string specifying a Python regular expression
-    that matches the same language as C{pattern}."""
+    that matches the same language as C{pattern}.  XML regular expressions
+    have no back-references, so all groups in the result are
+    non-capturing."""
     assert isinstance(pattern, six.text_type)
+    rv = _TranslationCache.get(pattern)
+    if rv is None:
+        rv = _TranslateXMLToPython(pattern)
+        _TranslationCache[pattern] = rv
+    return rv
+
+def _TranslateXMLToPython (pattern):
     new_pattern_elts = []
-    new_pattern_elts.append('^(')
+    new_pattern_elts.append('^(?:')
     position = 0
     while position < len(pattern):
         cg = MaybeMatchCharacterClass(pattern, position)
@@ -299,6 +314,11 @@ def XMLToPython (pattern):
                 # match start and end of string in Python, so they have to
                 # be escaped.
                 new_pattern_elts.append(six.unichr(0x5c) + ch)
+            elif ch == six.u('('):
+                # Python limits the number of capturing groups in an
+                # expression, which the alternation of many patterns
+                # would exceed.
+                new_pattern_elts.append(six.u('(?:'))
             else:
                 new_pattern_elts.append(ch)
             position += 1
@@ -69,6 +69,27 @@ FixedPoint._CF_totalDigits =  facets.CF_totalDigits(super_facet=datatypes.decima
 FixedPoint._CF_fractionDigits =  facets.CF_fractionDigits(super_facet=datatypes.decimal._CF_maxExclusive, value=facets.CF_fractionDigits._ValueDatatype(2))
 FixedPoint._InitializeFacetMap(FixedPoint._CF_totalDigits, FixedPoint._CF_fractionDigits)
 
+class Code (datatypes.string):
+    pass
+Code._CF_pattern = facets.CF_pattern()
+Code._CF_pattern.addPattern(pattern=six.u('[A-Z]{2}'))
+Code._CF_pattern.addPattern(pattern=six.u('[0-9]{3}'))
+Code._InitializeFacetMap(Code._CF_pattern)
+
+class ShortCode (Code):
+    pass
+ShortCode._CF_pattern = facets.CF_pattern()
+ShortCode._CF_pattern.addPattern(pattern=six.u('[A-M].*'))
+ShortCode._CF_pattern.addPattern(pattern=six.u('[0-4].*'))
+ShortCode._InitializeFacetMap(ShortCode._CF_pattern)
+
+class ManyCodes (datatypes.string):
+    pass
+ManyCodes._CF_pattern = facets.CF_pattern()
+for _i in range(120):
+    ManyCodes._CF_pattern.addPattern(pattern=six.u('[A-Z]%d(abc|def)?' % (_i,)))
+ManyCodes._InitializeFacetMap(ManyCodes._CF_pattern)
+
 class ReplaceString (datatypes.string):
     pass
 ReplaceString._CF_whiteSpace = facets.CF_whiteSpace(value=facets._WhiteSpace_enum.replace, super_facet=datatypes.string._CF_whiteSpace)
@@ -204,6 +225,117 @@ class testDigits (unittest.TestCase):
         self.assertEqual('1.0', FixedPoint('+1').xsdLiteral())
         self.assertEqual('-1.0', FixedPoint('-1').xsdLiteral())
 
+class testPattern (unittest.TestCase):
+    def test (self):
+        self.assertEqual('AB', Code('AB'))
+        self.assertEqual('123', Code('123'))
+        self.assertRaises(SimpleFacetValueError, Code, 'A1')
+        self.assertRaises(SimpleFacetValueError, Code, 'ABC')
+
+    def testAncestors (self):
+        # Patterns at one level are alternatives; each level must hold
+        self.assertEqual('AB', ShortCode('AB'))
+        self.assertEqual('123', ShortCode('123'))
+        self.assertRaises(SimpleFacetValueError, ShortCode, 'XY')
+        self.assertRaises(SimpleFacetValueError, ShortCode, '567')
+        if sys.version_info[:2] >= (2, 7):
+            with self.assertRaises(SimpleFacetValueError) as cm:
+                ShortCode('A12')
+            self.assertTrue(cm.exception.facet is Code._CF_pattern)
+            with self.assertRaises(SimpleFacetValueError) as cm:
+                ShortCode('XY')
+            self.assertTrue(cm.exception.facet is ShortCode._CF_pattern)
+
+    def testShared (self):
+        self.assertTrue(Code._CF_pattern.compiledExpression() is not None)
+        other = facets.CF_pattern()
+        self.assertTrue(other.compiledExpression() is None)
+        other.addPattern(pattern=six.u('[A-Z]{2}'))
+        other.addPattern(pattern=six.u('[0-9]{3}'))
+        self.assertEqual(Code._CF_pattern.pythonExpression(), other.pythonExpression())
+        self.assertTrue(Code._CF_pattern.compiledExpression() is other.compiledExpression())
+
+    def testDeferredTranslation (self):
+        bad = six.u('\\p{Bogus}')
+        pattern = facets.CF_pattern()
+        pattern.addPattern(pattern=bad)
+        self.assertRaises(pyxb.utils.xmlre.RegularExpressionError, pattern.compiledExpression)
+        # Patterns from a schema are diagnosed immediately
+        pattern = facets.CF_pattern()
+        self.assertRaises(pyxb.utils.xmlre.RegularExpressionError, pattern.setFromKeywords, value=bad)
+
+    def testManyPatterns (self):
+        # More alternatives than Python 2 allows groups in an expression
+        self.assertEqual('A7abc', ManyCodes('A7abc'))
+        self.assertEqual('Z119', ManyCodes('Z119'))
+        self.assertRaises(SimpleFacetValueError, ManyCodes, 'zzz')
+        self.assertRaises(SimpleFacetValueError, ManyCodes, 'A120')
+
+    def testPrepare (self):
+        self.assertTrue(ShortCode.PrepareConstraints())
+        self.assertTrue(ShortCode._ConstraintChecker() is ShortCode._ConstraintChecker())
+
+    def testAddPattern (self):
+        class Word (datatypes.string):
+            pass
+        Word._CF_pattern = facets.CF_pattern()
+        Word._CF_pattern.addPattern(pattern=six.u('[A-Z]+'))
+        Word._InitializeFacetMap(Word._CF_pattern)
+        class Initial (Word):
+            pass
+        Initial._CF_pattern = facets.CF_pattern()
+        Initial._CF_pattern.addPattern(pattern=six.u('[A-C].*'))
+        Initial._InitializeFacetMap(Initial._CF_pattern)
+        self.assertRaises(SimpleFacetValueError, Initial, 'XY')
+        checkers = [ _c._ConstraintChecker() for _c in (Code, Word, Initial) ]
+        # Only classes that use a changed facet are recompiled
+        Initial._CF_pattern.addPattern(pattern=six.u('X.*'))
+        self.assertEqual('XY', Initial('XY'))
+        self.assertTrue(Code._ConstraintChecker() is checkers[0])
+        self.assertTrue(Word._ConstraintChecker() is checkers[1])
+        self.assertFalse(Initial._ConstraintChecker() is checkers[2])
+        # Constraints of an ancestor are inherited
+        self.assertRaises(SimpleFacetValueError, Initial, 'X1')
+        Word._CF_pattern.addPattern(pattern=six.u('[A-Z][0-9]+'))
+        self.assertEqual('X1', Initial('X1'))
+        self.assertEqual('X1', Word('X1'))
+        self.assertTrue(Code._ConstraintChecker() is checkers[0])
+
+class testCompiledChecker (unittest.TestCase):
+    def testFacets (self):
+        checker = facets.CompileConstraintChecker(Password._FacetMap().values())
+        self.assertTrue(checker(Password(10 * 'x')) is None)
+        self.assertTrue(checker(datatypes.string(16 * 'x')) is Password._CF_maxLength)
+        checker = facets.CompileConstraintChecker(ExclusiveFloat._FacetMap().values())
+        self.assertTrue(checker(datatypes.float(0.0)) is None)
+        self.assertTrue(checker(datatypes.float(-5.0)) is ExclusiveFloat._CF_minExclusive)
+        self.assertTrue(checker(datatypes.float(7.0)) is ExclusiveFloat._CF_maxExclusive)
+        checker = facets.CompileConstraintChecker(Cardinals._FacetMap().values())
+        self.assertTrue(checker(Cardinals.two) is None)
+        self.assertTrue(checker(six.u('four')) is Cardinals._CF_enumeration)
+
+    def testFacetReported (self):
+        for (ctor, arg, facet) in ( (datatypes.byte, 128, datatypes.byte._CF_maxInclusive),
+                                    (TLA, 'un', TLA._CF_length),
+                                    (AFew, [ datatypes.integer(1) ], AFew._CF_minLength),
+                                    (FixedPoint, '1.234', FixedPoint._CF_fractionDigits) ):
+            try:
+                ctor(arg)
+                self.fail('%s accepted %s' % (ctor, arg))
+            except SimpleFacetValueError as e:
+                self.assertTrue(e.facet is facet)
+
+    def testAddEnumeration (self):
+        class Ordinals (datatypes.string, facets._Enumeration_mixin):
+            pass
+        Ordinals._CF_enumeration = facets.CF_enumeration(value_datatype=Ordinals, super_facet=datatypes.string._CF_enumeration, enum_prefix=None)
+        Ordinals.first = Ordinals._CF_enumeration.addEnumeration(unicode_value=six.u('first'))
+        Ordinals._InitializeFacetMap(Ordinals._CF_enumeration)
+        self.assertEqual(Ordinals.first, Ordinals('first'))
+        self.assertRaises(SimpleFacetValueError, Ordinals, 'second')
+        Ordinals.second = Ordinals._CF_enumeration.addEnumeration(unicode_value=six.u('second'))
+        self.assertEqual(Ordinals.second, Ordinals('second'))
+
 class testWhitespace (unittest.TestCase):
     __Preserve = facets.CF_whiteSpace(value=facets._WhiteSpace_enum.preserve)
     def testPreserve (self):
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import pyxb.binding.generate
+import json
+import os.path
+import shutil
+import tempfile
+import unittest
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" targetNamespace="urn:report:%s" xmlns:tns="urn:report:%s" elementFormDefault="qualified">
+  <xs:complexType name="tSequence">
+    <xs:sequence>
+      <xs:element name="a" type="xs:string"/>
+      <xs:element name="b" type="xs:string" minOccurs="2" maxOccurs="5"/>
+    </xs:sequence>
+  </xs:complexType>
+  <xs:complexType name="tAmbiguous">
+    <xs:sequence>
+      <xs:element name="a" type="xs:string" minOccurs="0"/>
+      <xs:any namespace="##any" processContents="skip" maxOccurs="unbounded"/>
+    </xs:sequence>
+  </xs:complexType>
+  <xs:complexType name="tAll">
+    <xs:all>
+      <xs:element name="a" type="xs:string"/>
+      <xs:element name="b" type="xs:string" minOccurs="0"/>
+    </xs:all>
+  </xs:complexType>
+  <xs:complexType name="tFixed">
+    <xs:sequence maxOccurs="3">
+      <xs:element name="a" type="xs:string" minOccurs="2" maxOccurs="2"/>
+    </xs:sequence>
+  </xs:complexType>
+  <xs:complexType name="tEmpty"/>
+  <xs:element name="sequence" type="tns:tSequence"/>
+</xs:schema>'''
+
+class TestAutomatonReport (unittest.TestCase):
+    def reports (self, tag, **kw):
+        generator = pyxb.binding.generate.Generator(allow_absent_module=True, generate_to_files=False, **kw)
+        generator.addSchema(xsd % (tag, tag))
+        modules = generator.bindingModules()
+        self.assertEqual(1, len(modules))
+        module = modules.pop()
+        module.moduleContents()
+        return dict((_r['name'], _r) for _r in module.automatonReport()['complexTypes'])
+
+    def testDisabled (self):
+        self.assertEqual({}, self.reports('disabled'))
+
+    def testReport (self):
+        reports = self.reports('enabled', automaton_report_directory='unused')
+        self.assertEqual(set(['{urn:report:enabled}tSequence', '{urn:report:enabled}tAmbiguous', '{urn:report:enabled}tAll', '{urn:report:enabled}tFixed']), set(reports.keys()))
+
+        rep = reports['{urn:report:enabled}tSequence']
+        self.assertEqual('tSequence', rep['binding'])
+        self.assertEqual(1, rep['automata'])
+        self.assertEqual(2, rep['states'])
+        self.assertTrue(rep['deterministic'])
+        self.assertEqual(1, rep['max_multiplicity'])
+        self.assertEqual([(2, 5)], [ (_c['min'], _c['max']) for _c in rep['counters'] ])
+
+        rep = reports['{urn:report:enabled}tAmbiguous']
+        self.assertFalse(rep['deterministic'])
+        self.assertEqual(2, rep['max_multiplicity'])
+        self.assertEqual([(0, 1)], [ (_c['min'], _c['max']) for _c in rep['counters'] ])
+
+        rep = reports['{urn:report:enabled}tAll']
+        self.assertEqual(3, rep['automata'])
+        self.assertTrue(rep['deterministic'])
+
+        # Counter guards on a fixed repetition distinguish the transitions
+        rep = reports['{urn:report:enabled}tFixed']
+        self.assertTrue(rep['deterministic'])
+        self.assertEqual(1, rep['max_multiplicity'])
+
+    def testWriteFiles (self):
+        root = tempfile.mkdtemp()
+        try:
+            generator = pyxb.binding.generate.Generator(binding_root=root, automaton_report_directory=root)
+            generator.addSchema(xsd % ('files', 'files'))
+            generator.addModuleName('report')
+            self.assertTrue('--automaton-report-directory=' + root in generator.getCommandLineArgs())
+            for m in generator.bindingModules():
+                m.writeToModuleFile()
+            with open(os.path.join(root, 'report.json')) as f:
+                report = json.load(f)
+            self.assertEqual('report', report['module'])
+            self.assertEqual(4, len(report['complexTypes']))
+        finally:
+            shutil.rmtree(root)
+
+if __name__ == '__main__':
+    unittest.main()
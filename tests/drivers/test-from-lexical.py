@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import pyxb.binding.generate
+import pyxb.binding.datatypes as xs
+from pyxb.utils import six
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:simpleType name="tSmall">
+    <xs:restriction base="xs:int">
+      <xs:maxInclusive value="10"/>
+    </xs:restriction>
+  </xs:simpleType>
+  <xs:element name="small" type="tSmall"/>
+  <xs:element name="maybe" type="tSmall" nillable="true"/>
+  <xs:element name="fixed" type="xs:int" fixed="3"/>
+  <xs:element name="when" type="xs:date"/>
+  <xs:element name="record">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element ref="small" minOccurs="0"/>
+        <xs:element ref="maybe" minOccurs="0"/>
+        <xs:element ref="fixed" minOccurs="0"/>
+      </xs:sequence>
+      <xs:attribute name="size" type="tSmall"/>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+class TestFromLexical (unittest.TestCase):
+    def testBuiltins (self):
+        for (cls, text) in ( (xs.int, ' 12 '), (xs.token, ' a  b '), (xs.hexBinary, 'DEADbeef'),
+                             (xs.double, 'INF'), (xs.boolean, 'true'), (xs.date, '2013-06-01') ):
+            text = six.text_type(text)
+            value = cls._FromLexical(text)
+            self.assertTrue(type(value) is cls)
+            self.assertEqual(cls.Factory(text, _from_xml=True), value)
+        self.assertRaises(SimpleTypeValueError, xs.int._FromLexical, six.u('x'))
+        self.assertRaises(SimpleTypeValueError, xs.byte._FromLexical, six.u('300'))
+
+    def testConstraints (self):
+        self.assertEqual(4, tSmall._FromLexical(six.u('4')))
+        self.assertRaises(SimpleFacetValueError, tSmall._FromLexical, six.u('11'))
+
+    def testElement (self):
+        value = tSmall._FromLexical(six.u('4'), element=small)
+        self.assertTrue(value._element() is small)
+        self.assertRaises(NoNillableSupportError, value._setIsNil)
+        value = tSmall._FromLexical(six.u('4'), element=maybe)
+        self.assertFalse(value._isNil())
+
+    def testDocument (self):
+        instance = CreateFromDocument('<record size="5"><small>4</small><maybe>7</maybe><fixed>3</fixed></record>')
+        self.assertEqual(5, instance.size)
+        self.assertEqual(small.name(), instance.small._element().name())
+        self.assertTrue(instance.small._location() is not None)
+        self.assertEqual(7, instance.maybe)
+        self.assertEqual(3, instance.fixed)
+        self.assertRaises(SimpleFacetValueError, CreateFromDocument, '<record size="50"/>')
+        self.assertRaises(SimpleFacetValueError, CreateFromDocument, '<record><small>50</small></record>')
+        self.assertRaises(ElementChangeError, CreateFromDocument, '<record><fixed>4</fixed></record>')
+        instance = CreateFromDocument('<record xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"><maybe xsi:nil="true"/></record>')
+        self.assertTrue(instance.maybe._isNil())
+
+    def testSuperseding (self):
+        class tSmallCustom (tSmall):
+            pass
+        tSmall._SetSupersedingClass(tSmallCustom)
+        try:
+            self.assertTrue(isinstance(tSmall._FromLexical(six.u('4')), tSmallCustom))
+            instance = CreateFromDocument('<record size="5"/>')
+            self.assertTrue(isinstance(instance.size, tSmallCustom))
+        finally:
+            tSmall._SetSupersedingClass(tSmall)
+        self.assertTrue(type(tSmall._FromLexical(six.u('4'))) is tSmall)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import pyxb.binding.generate
+import pyxb.binding.saxer
+import pyxb.utils.domutils
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:simpleType name="tStatus">
+    <xs:restriction base="xs:string">
+      <xs:enumeration value="ok"/>
+      <xs:enumeration value="failed"/>
+    </xs:restriction>
+  </xs:simpleType>
+  <xs:simpleType name="tUnit">
+    <xs:restriction base="xs:token">
+      <xs:enumeration value="cm"/>
+      <xs:enumeration value="in"/>
+    </xs:restriction>
+  </xs:simpleType>
+  <xs:simpleType name="tShortStatus">
+    <xs:restriction base="tStatus">
+      <xs:maxLength value="2"/>
+    </xs:restriction>
+  </xs:simpleType>
+  <xs:simpleType name="tPair">
+    <xs:restriction>
+      <xs:simpleType>
+        <xs:list itemType="xs:int"/>
+      </xs:simpleType>
+      <xs:enumeration value="1 2"/>
+    </xs:restriction>
+  </xs:simpleType>
+  <xs:element name="result">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="code" type="tStatus" minOccurs="0"/>
+      </xs:sequence>
+      <xs:attribute name="status" type="tStatus"/>
+      <xs:attribute name="unit" type="tUnit"/>
+      <xs:attribute name="short" type="tShortStatus"/>
+      <xs:attribute name="pair" type="tPair"/>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+class TestInternedEnumeration (unittest.TestCase):
+    def testAttribute (self):
+        for create in (CreateFromDocument, lambda _x: CreateFromDOM(pyxb.utils.domutils.StringToDOM(_x))):
+            instance = create('<result status="ok" unit="cm"/>')
+            self.assertTrue(instance.status is tStatus.ok)
+            self.assertTrue(instance.unit is tUnit.cm)
+            other = create('<result status="ok"/>')
+            self.assertTrue(other.status is instance.status)
+
+    def testNormalized (self):
+        instance = CreateFromDocument('<result unit=" in "/>')
+        self.assertEqual(tUnit.in_, instance.unit)
+        self.assertTrue(instance.unit is not tUnit.in_)
+
+    def testInvalid (self):
+        self.assertRaises(SimpleFacetValueError, CreateFromDocument, '<result status="unknown"/>')
+
+    def testDerived (self):
+        # Values inherited from the base enumeration are not shared
+        self.assertTrue(tShortStatus._InternedValue('ok') is None)
+        instance = CreateFromDocument('<result short="ok"/>')
+        self.assertTrue(isinstance(instance.short, tShortStatus))
+        self.assertRaises(SimpleFacetValueError, CreateFromDocument, '<result short="failed"/>')
+
+    def testElement (self):
+        # Element values carry their own location and element
+        instance = CreateFromDocument('<result><code>ok</code></result>')
+        self.assertEqual(tStatus.ok, instance.code)
+        self.assertTrue(instance.code is not tStatus.ok)
+        self.assertTrue(tStatus.ok._element() is None)
+
+    def testAssignment (self):
+        instance = result()
+        instance.status = 'failed'
+        self.assertEqual(tStatus.failed, instance.status)
+        self.assertRaises(SimpleFacetValueError, setattr, instance, 'status', 'unknown')
+
+    def testList (self):
+        # List values are mutable, so each document gets its own
+        instance = CreateFromDocument('<result pair="1 2"/>')
+        other = CreateFromDocument('<result pair="1 2"/>')
+        self.assertEqual([1, 2], instance.pair)
+        self.assertTrue(instance.pair is not other.pair)
+        instance.pair.append(3)
+        self.assertEqual([1, 2], other.pair)
+        self.assertEqual([[1, 2]], tPair._CF_enumeration.values())
+        self.assertEqual([1, 2], CreateFromDocument('<result pair="1 2"/>').pair)
+
+    def testSuperseded (self):
+        class MyStatus (tStatus):
+            def hello (self):
+                return 'hello %s' % (self,)
+        instance = CreateFromDocument('<result status="ok"/>')
+        self.assertTrue(instance.status is tStatus.ok)
+        tStatus._SetSupersedingClass(MyStatus)
+        try:
+            instance = CreateFromDocument('<result status="ok"/>')
+            self.assertTrue(isinstance(instance.status, MyStatus))
+            self.assertEqual('hello ok', instance.status.hello())
+        finally:
+            tStatus._SetSupersedingClass(tStatus)
+        instance = CreateFromDocument('<result status="ok"/>')
+        self.assertTrue(instance.status is tStatus.ok)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import pyxb.binding.generate
+import pyxb.binding.content
+import pyxb.utils.fac
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:complexType name="tBase">
+    <xs:sequence>
+      <xs:element name="a" type="xs:string"/>
+    </xs:sequence>
+  </xs:complexType>
+  <xs:complexType name="tDerived">
+    <xs:complexContent>
+      <xs:extension base="tBase">
+        <xs:attribute name="n" type="xs:int"/>
+      </xs:extension>
+    </xs:complexContent>
+  </xs:complexType>
+  <xs:complexType name="tAll">
+    <xs:all>
+      <xs:element name="a" type="xs:string"/>
+      <xs:element name="b" type="xs:string"/>
+    </xs:all>
+  </xs:complexType>
+  <xs:complexType name="tUnused">
+    <xs:sequence>
+      <xs:element name="b" type="xs:string"/>
+    </xs:sequence>
+  </xs:complexType>
+  <xs:element name="base" type="tBase"/>
+  <xs:element name="all" type="tAll"/>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+class TestLazyAutomaton (unittest.TestCase):
+    def testNotBuiltOnImport (self):
+        lazy = tUnused.__dict__['_Automaton']
+        self.assertTrue(isinstance(lazy, pyxb.binding.content.LazyAutomaton))
+        self.assertFalse(lazy.isBuilt())
+
+    def testBuiltOnUse (self):
+        lazy = tBase.__dict__['_Automaton']
+        instance = CreateFromDocument('<base><a>x</a></base>')
+        self.assertEqual('x', instance.a)
+        self.assertTrue(lazy.isBuilt())
+        au = tBase._Automaton
+        self.assertTrue(isinstance(au, pyxb.utils.fac.Automaton))
+        self.assertTrue(au is lazy.automaton())
+        self.assertTrue(au is tBase(a='y')._Automaton)
+        # The derived type has its own automaton
+        lazy = tDerived.__dict__['_Automaton']
+        self.assertFalse(lazy.isBuilt())
+        self.assertTrue(au is not tDerived._Automaton)
+        self.assertTrue(lazy.isBuilt())
+
+    def testSubAutomata (self):
+        instance = CreateFromDocument('<all><b>2</b><a>1</a></all>')
+        self.assertEqual('1', instance.a)
+        self.assertEqual('2', instance.b)
+        self.assertRaises(IncompleteElementContentError, CreateFromDocument, '<all><b>2</b></all>')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import pyxb.binding.generate
+import pyxb.binding.parallel
+import os.path
+import shutil
+import sys
+import tempfile
+from pyxb.utils.six.moves import cPickle as pickle
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" targetNamespace="urn:parallel" xmlns:tns="urn:parallel" elementFormDefault="qualified">
+  <xs:complexType name="tItem">
+    <xs:sequence>
+      <xs:element name="name" type="xs:string"/>
+    </xs:sequence>
+    <xs:attribute name="id" type="xs:int" use="required"/>
+  </xs:complexType>
+  <xs:element name="feed">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="title" type="xs:string"/>
+        <xs:element name="item" type="tns:tItem" maxOccurs="unbounded"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>'''
+
+# Local elements of this schema are in no namespace
+unqualified_xsd = xsd.replace('urn:parallel', 'urn:parallel:unqualified').replace('"qualified"', '"unqualified"')
+
+# Worker processes import the bindings by name, so write them to a module.
+module_dir = tempfile.mkdtemp()
+with open(os.path.join(module_dir, 'parallel_bindings.py'), 'w') as f:
+    f.write(pyxb.binding.generate.GeneratePython(schema_text=xsd))
+with open(os.path.join(module_dir, 'parallel_unqualified.py'), 'w') as f:
+    f.write(pyxb.binding.generate.GeneratePython(schema_text=unqualified_xsd))
+sys.path.insert(0, module_dir)
+import parallel_bindings
+import parallel_unqualified
+sys.path.pop(0)
+shutil.rmtree(module_dir)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+def MakeDocument (count):
+    items = '\n'.join('<p:item id="%d"><p:name>n%d</p:name></p:item>' % (_i, _i) for _i in range(count))
+    return ('<?xml version="1.0"?>\n<p:feed xmlns:p="urn:parallel"><p:title>t</p:title>\n%s\n</p:feed>' % (items,)).encode('utf-8')
+
+def ItemId (item):
+    return item.id
+
+class SerialExecutor (object):
+    """Run submitted calls immediately, so the splitting and reassembly can
+    be checked where concurrent.futures is not available."""
+    class Future (object):
+        def __init__ (self, value):
+            self.__value = value
+        def result (self):
+            return self.__value
+
+    def __init__ (self):
+        self.submitted = []
+
+    def submit (self, fn, *args):
+        self.submitted.append(args)
+        # Workers receive pickled arguments and return pickled results
+        args = pickle.loads(pickle.dumps(args))
+        return self.Future(pickle.loads(pickle.dumps(fn(*args))))
+
+class TestSplit (unittest.TestCase):
+    def testSplit (self):
+        xmld = MakeDocument(3)
+        (header, elements, trailer) = pyxb.binding.parallel.SplitDocument(xmld, 'item')
+        self.assertEqual(3, len(elements))
+        self.assertTrue(header.endswith(b'<p:title>t</p:title>\n'))
+        self.assertEqual(b'\n</p:feed>', trailer)
+        self.assertEqual(b'<p:item id="1"><p:name>n1</p:name></p:item>', xmld[elements[1][0]:elements[1][1]])
+
+    def testEmptyAndNested (self):
+        xmld = b'<feed><item/><item a="x>"><item></item></item><items/></feed>'
+        (header, elements, trailer) = pyxb.binding.parallel.SplitDocument(xmld, 'item')
+        self.assertEqual([ b'<item/>', b'<item a="x>"><item></item></item>' ], [ xmld[_s:_e] for (_s, _e) in elements ])
+        self.assertEqual(b'<items/></feed>', trailer)
+        self.assertRaises(pyxb.UsageError, pyxb.binding.parallel.SplitDocument, b'<feed><item></feed>', 'item')
+        (header, elements, trailer) = pyxb.binding.parallel.SplitDocument(b'<feed/>', 'item')
+        self.assertEqual(0, len(elements))
+
+class TestParseParallel (unittest.TestCase):
+    ItemName = parallel_bindings.Namespace.createExpandedName('item')
+
+    def testBindings (self):
+        executor = SerialExecutor()
+        items = pyxb.binding.parallel.ParseParallel(parallel_bindings, MakeDocument(20), self.ItemName, batch_size=200, executor=executor)
+        self.assertTrue(1 < len(executor.submitted))
+        self.assertEqual(list(range(20)), [ _i.id for _i in items ])
+        self.assertTrue(isinstance(items[3], parallel_bindings.tItem))
+        self.assertEqual('n3', items[3].name)
+
+    def testReducer (self):
+        executor = SerialExecutor()
+        ids = pyxb.binding.parallel.ParseParallel('parallel_bindings', MakeDocument(20).decode('utf-8'), 'item', reducer=ItemId, batch_size=100, executor=executor)
+        self.assertEqual(list(range(20)), ids)
+        self.assertEqual([], pyxb.binding.parallel.ParseParallel(parallel_bindings, b'<feed xmlns="urn:parallel"/>', 'item', executor=executor))
+
+    def testInvalid (self):
+        xmld = MakeDocument(5).replace(b'<p:item id="3">', b'<p:item>')
+        self.assertRaises(MissingAttributeError, pyxb.binding.parallel.ParseParallel, parallel_bindings, xmld, 'item', batch_size=100, executor=SerialExecutor())
+
+    def testUnqualified (self):
+        xmld = MakeDocument(10).replace(b'<p:', b'<').replace(b'</p:', b'</').replace(b'<feed', b'<p:feed').replace(b'</feed', b'</p:feed').replace(b'urn:parallel', b'urn:parallel:unqualified')
+        expected = parallel_unqualified.CreateFromDocument(xmld).item
+        self.assertEqual(10, len(expected))
+        for element_name in ( pyxb.namespace.ExpandedName(None, 'item'), 'item' ):
+            items = pyxb.binding.parallel.ParseParallel(parallel_unqualified, xmld, element_name, batch_size=100, executor=SerialExecutor())
+            self.assertEqual([ _i.id for _i in expected ], [ _i.id for _i in items ])
+            self.assertTrue(isinstance(items[0], parallel_unqualified.tItem))
+        # The split finds the elements, but they are not in the module namespace
+        self.assertRaises(pyxb.UsageError, pyxb.binding.parallel.ParseParallel, parallel_unqualified, xmld, parallel_unqualified.Namespace.createExpandedName('item'), executor=SerialExecutor())
+
+    def testProcessPool (self):
+        try:
+            import concurrent.futures
+        except ImportError:
+            # Not available without a separate installation in Python 2
+            return
+        # Worker processes must be able to import the bindings; when forked
+        # they inherit them from this process.
+        import multiprocessing
+        if 'fork' != multiprocessing.get_start_method():
+            return
+        ids = pyxb.binding.parallel.ParseParallel(parallel_bindings, MakeDocument(50), 'item', reducer=ItemId, max_workers=2, batch_size=500)
+        self.assertEqual(list(range(50)), ids)
+
+if __name__ == '__main__':
+    unittest.main()
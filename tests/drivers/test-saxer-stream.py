@@ -0,0 +1,415 @@
+# -*- coding: utf-8 -*-
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import pyxb.binding.generate
+import pyxb.binding.saxer
+import pyxb.binding.basis
+import pyxb.utils.saxutils
+import io
+import os
+import tempfile
+import xml.sax
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" targetNamespace="urn:stream" xmlns:tns="urn:stream" elementFormDefault="qualified">
+  <xs:complexType name="tItem">
+    <xs:sequence>
+      <xs:element name="name" type="xs:string"/>
+    </xs:sequence>
+    <xs:attribute name="id" type="xs:int" use="required"/>
+  </xs:complexType>
+  <xs:element name="feed">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="title" type="xs:string"/>
+        <xs:element name="item" type="tns:tItem" maxOccurs="unbounded"/>
+        <xs:element name="trailer" type="xs:string"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+  <xs:element name="item" type="tns:tItem"/>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+#open('code.py', 'w').write(code)
+
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+def MakeDocument (count, trailer=True):
+    items = ''.join('<item id="%d"><name>n%d</name></item>' % (_i, _i) for _i in range(count))
+    if trailer:
+        items += '<trailer>end</trailer>'
+    return ('<feed xmlns="urn:stream"><title>t</title>%s</feed>' % (items,)).encode('utf-8')
+
+class TestIterParse (unittest.TestCase):
+    ItemName = Namespace.createExpandedName('item')
+    FeedName = Namespace.createExpandedName('feed')
+
+    def testBasic (self):
+        xmld = MakeDocument(10)
+        ids = [ _i.id for _i in pyxb.binding.saxer.iterparse(io.BytesIO(xmld), [ self.ItemName ], chunk_size=16) ]
+        self.assertEqual(list(range(10)), ids)
+
+    def testBytes (self):
+        items = list(pyxb.binding.saxer.iterparse(MakeDocument(3), [ self.ItemName ]))
+        self.assertEqual(3, len(items))
+        for (i, item) in enumerate(items):
+            self.assertTrue(isinstance(item, tItem))
+            self.assertEqual('n%d' % (i,), item.name)
+
+    def testPath (self):
+        items = list(pyxb.binding.saxer.iterparse(MakeDocument(3), [ (self.FeedName, self.ItemName) ]))
+        self.assertEqual(3, len(items))
+        items = list(pyxb.binding.saxer.iterparse(MakeDocument(3), [ (self.ItemName,) ]))
+        self.assertEqual(0, len(items))
+
+    def testDetached (self):
+        instances = []
+        saxer = pyxb.binding.saxer.make_parser(element_names=[ self.ItemName ],
+                                               element_callback=instances.append,
+                                               detach_elements=True)
+        handler = saxer.getContentHandler()
+        saxer.parse(io.BytesIO(MakeDocument(4)))
+        root = handler.rootObject()
+        self.assertEqual(4, len(instances))
+        self.assertEqual(0, len(root.item))
+        self.assertEqual('t', root.title)
+        self.assertEqual('end', root.trailer)
+
+    def testRetained (self):
+        instances = []
+        saxer = pyxb.binding.saxer.make_parser(element_names=[ self.ItemName ],
+                                               element_callback=instances.append)
+        handler = saxer.getContentHandler()
+        saxer.parse(io.BytesIO(MakeDocument(4)))
+        root = handler.rootObject()
+        self.assertEqual(4, len(instances))
+        self.assertEqual(instances, list(root.item))
+
+    def testContentModel (self):
+        # Streamed elements are still checked against the parent content model
+        with self.assertRaises(IncompleteElementContentError):
+            list(pyxb.binding.saxer.iterparse(MakeDocument(2, trailer=False), [ self.ItemName ]))
+        with self.assertRaises(UnrecognizedContentError):
+            list(pyxb.binding.saxer.iterparse(MakeDocument(0), [ self.ItemName ]))
+
+    def testInvalidItem (self):
+        xmld = '<feed xmlns="urn:stream"><title>t</title><item><name>n</name></item><trailer/></feed>'.encode('utf-8')
+        with self.assertRaises(MissingAttributeError):
+            list(pyxb.binding.saxer.iterparse(xmld, [ self.ItemName ]))
+
+class TestFeedParser (unittest.TestCase):
+    ItemName = Namespace.createExpandedName('item')
+
+    def testFeed (self):
+        xmld = MakeDocument(5)
+        parser = pyxb.binding.saxer.FeedParser()
+        for i in range(0, len(xmld), 7):
+            parser.feed(xmld[i:i+7])
+        instance = parser.close()
+        self.assertTrue(isinstance(instance, feed.typeDefinition()))
+        self.assertEqual(5, len(instance.item))
+        self.assertEqual(instance, parser.rootObject())
+
+    def testText (self):
+        parser = pyxb.binding.saxer.FeedParser()
+        parser.feed(MakeDocument(2).decode('utf-8'))
+        self.assertEqual(2, len(parser.close().item))
+
+    def testCallback (self):
+        xmld = MakeDocument(5)
+        completed = []
+        parser = pyxb.binding.saxer.FeedParser(element_names=[ self.ItemName ], element_callback=completed.append)
+        parser.feed(xmld[:xmld.find(b'<item id="2"')])
+        self.assertEqual([0, 1], [ _i.id for _i in completed ])
+        parser.feed(xmld[xmld.find(b'<item id="2"'):])
+        instance = parser.close()
+        self.assertEqual(5, len(completed))
+        self.assertEqual(completed, list(instance.item))
+
+    def testReset (self):
+        parser = pyxb.binding.saxer.FeedParser()
+        parser.feed(MakeDocument(2)[:20])
+        parser.reset()
+        parser.feed(MakeDocument(3))
+        self.assertEqual(3, len(parser.close().item))
+
+    def testReuse (self):
+        # A parser may be used for another document once one is complete
+        parser = pyxb.binding.saxer.FeedParser(use_expat=True)
+        for n in (2, 3):
+            parser.feed(MakeDocument(n))
+            self.assertEqual(n, len(parser.close().item))
+
+    def errorLocation (self, fn, xmld):
+        try:
+            fn(xmld)
+            self.fail('Succeeded with invalid document')
+        except pyxb.ValidationError as e:
+            return (type(e), e.location.lineNumber)
+
+    def testLocation (self):
+        xmld = '<feed xmlns="urn:stream">\n<title>t</title>\n<item>\n<name>n</name>\n</item>\n</feed>'.encode('utf-8')
+        expected = self.errorLocation(CreateFromDocument, xmld)
+        self.assertEqual((MissingAttributeError, 3), expected)
+        parser = pyxb.binding.saxer.FeedParser()
+        def parse (xmld):
+            parser.reset()
+            parser.feed(xmld)
+            return parser.close()
+        self.assertEqual(expected, self.errorLocation(parse, xmld))
+        # The locator survives a reset
+        self.assertEqual(expected, self.errorLocation(parse, xmld))
+        instance = parse(xmld.replace(b'<item>', b'<item id="1">').replace(b'</item>', b'</item><trailer/>'))
+        self.assertEqual(3, instance.item[0]._location().lineNumber)
+
+    def testIterParseLocation (self):
+        xmld = '<feed xmlns="urn:stream">\n<title>t</title>\n<item id="1">\n<name>n</name>\n</item>\n<item>\n<name>n</name>\n</item></feed>'.encode('utf-8')
+        expected = self.errorLocation(CreateFromDocument, xmld)
+        self.assertEqual((MissingAttributeError, 6), expected)
+        items = []
+        def parse (xmld):
+            for item in pyxb.binding.saxer.iterparse(xmld, [ self.ItemName ], chunk_size=16):
+                items.append(item)
+        self.assertEqual(expected, self.errorLocation(parse, xmld))
+        self.assertEqual(3, items[0]._location().lineNumber)
+
+class TestParserPool (unittest.TestCase):
+    def testReuse (self):
+        i1 = CreateFromDocumentPooled(MakeDocument(2))
+        (key, saxer) = pyxb.binding.saxer._ParserPoolInstance.acquire(Namespace.fallbackNamespace(), None)
+        pyxb.binding.saxer._ParserPoolInstance.release(key, saxer)
+        i2 = CreateFromDocumentPooled(MakeDocument(3).decode('utf-8'))
+        (key, saxer2) = pyxb.binding.saxer._ParserPoolInstance.acquire(Namespace.fallbackNamespace(), None)
+        pyxb.binding.saxer._ParserPoolInstance.release(key, saxer2)
+        self.assertTrue(saxer is saxer2)
+        self.assertEqual(2, len(i1.item))
+        self.assertEqual(3, len(i2.item))
+
+    def testLocationBase (self):
+        instance = CreateFromDocumentPooled(MakeDocument(1), location_base='urn:doc1')
+        self.assertEqual('urn:doc1', instance._location().locationBase)
+        instance = CreateFromDocumentPooled(MakeDocument(1), location_base='urn:doc2')
+        self.assertEqual('urn:doc2', instance._location().locationBase)
+
+    def testFailure (self):
+        self.assertRaises(IncompleteElementContentError, CreateFromDocumentPooled, MakeDocument(1, trailer=False))
+        self.assertEqual(1, len(CreateFromDocumentPooled(MakeDocument(1)).item))
+
+    def testNested (self):
+        # A parser in use is not handed out again
+        (key, saxer) = pyxb.binding.saxer._ParserPoolInstance.acquire(Namespace.fallbackNamespace(), None)
+        (key, saxer2) = pyxb.binding.saxer._ParserPoolInstance.acquire(Namespace.fallbackNamespace(), None)
+        self.assertFalse(saxer is saxer2)
+        pyxb.binding.saxer._ParserPoolInstance.release(key, saxer2)
+        pyxb.binding.saxer._ParserPoolInstance.release(key, saxer)
+
+class TestDispatch (unittest.TestCase):
+    ItemName = Namespace.createExpandedName('item')
+    FeedName = Namespace.createExpandedName('feed')
+
+    def testElement (self):
+        ctd = feed.typeDefinition()
+        (eb, ed, tc, is_ctd) = ctd._ElementDispatchForName(self.ItemName)
+        self.assertEqual(ctd._ElementMap[self.ItemName], ed)
+        self.assertEqual(ed.elementBinding(), eb)
+        self.assertEqual(tItem, tc)
+        self.assertTrue(is_ctd)
+        self.assertTrue(ctd._ElementDispatchForName(self.ItemName) is ctd._ElementDispatchForName(self.ItemName))
+        (eb, ed, tc, is_ctd) = ctd._ElementDispatchForName(Namespace.createExpandedName('title'))
+        self.assertFalse(is_ctd)
+        (eb, ed, tc, is_ctd) = ctd._ElementDispatchForName(Namespace.createExpandedName('unknown'))
+        self.assertTrue(eb is None)
+        self.assertTrue(tc is None)
+
+    def testGlobal (self):
+        (eb, ed, tc, is_ctd) = pyxb.binding.basis.element._GlobalDispatchForName(self.FeedName)
+        self.assertEqual(feed, eb)
+        self.assertTrue(ed is None)
+        self.assertEqual(feed.typeDefinition(), tc)
+        self.assertTrue(is_ctd)
+
+    def testSuperseding (self):
+        class tItemSub (tItem):
+            pass
+        ctd = feed.typeDefinition()
+        self.assertEqual(tItem, ctd._ElementDispatchForName(self.ItemName)[2])
+        tItem._SetSupersedingClass(tItemSub)
+        try:
+            self.assertEqual(tItemSub, ctd._ElementDispatchForName(self.ItemName)[2])
+            instance = CreateFromDocument(MakeDocument(2))
+            self.assertTrue(isinstance(instance.item[0], tItemSub))
+        finally:
+            tItem._SetSupersedingClass(tItem)
+        self.assertEqual(tItem, ctd._ElementDispatchForName(self.ItemName)[2])
+
+class TestTrackLocations (unittest.TestCase):
+    def tearDown (self):
+        pyxb.TrackParseLocations(True)
+
+    def testDefault (self):
+        instance = CreateFromDocument(MakeDocument(2))
+        self.assertEqual(1, instance._location().lineNumber)
+        self.assertEqual(1, instance.item[0]._location().lineNumber)
+
+    def testPerCall (self):
+        instance = CreateFromDocument(MakeDocument(2), track_locations=False)
+        self.assertEqual(2, len(instance.item))
+        self.assertTrue(instance._location() is None)
+        self.assertTrue(instance.item[0]._location() is None)
+        instance = CreateFromDocumentPooled(MakeDocument(2), track_locations=False)
+        self.assertTrue(instance.item[1]._location() is None)
+
+    def testGlobal (self):
+        self.assertTrue(pyxb.TrackParseLocations())
+        self.assertRaises(TypeError, pyxb.TrackParseLocations, 0)
+        pyxb.TrackParseLocations(False)
+        instance = CreateFromDocument(MakeDocument(2))
+        self.assertTrue(instance._location() is None)
+        instance = CreateFromDocument(MakeDocument(2), track_locations=True)
+        self.assertEqual(1, instance._location().lineNumber)
+
+    def testErrorLocation (self):
+        xmld = '<feed xmlns="urn:stream">\n<title>t</title>\n<item>\n<name>n</name>\n</item>\n</feed>'.encode('utf-8')
+        try:
+            CreateFromDocument(xmld, track_locations=False)
+            self.fail('Succeeded with missing attribute')
+        except MissingAttributeError as e:
+            # Detected when the element ends
+            self.assertEqual(5, e.location.lineNumber)
+            self.assertTrue(e.location.columnNumber is None)
+        xmld = xmld.replace(b'<item>', b'<item id="1">')
+        try:
+            CreateFromDocument(xmld, location_base='urn:doc', track_locations=False)
+            self.fail('Succeeded with missing trailer')
+        except IncompleteElementContentError as e:
+            self.assertEqual(6, e.location.lineNumber)
+            self.assertEqual('urn:doc', e.location.locationBase)
+
+class TestProjection (unittest.TestCase):
+    ItemName = Namespace.createExpandedName('item')
+    FeedName = Namespace.createExpandedName('feed')
+    TitleName = Namespace.createExpandedName('title')
+    TrailerName = Namespace.createExpandedName('trailer')
+
+    def testName (self):
+        instance = CreateFromDocument(MakeDocument(3), keep_elements=[ self.TitleName ])
+        self.assertEqual('t', instance.title)
+        self.assertEqual(0, len(instance.item))
+        self.assertTrue(instance.trailer is None)
+
+    def testPath (self):
+        instance = CreateFromDocument(MakeDocument(3), keep_elements=[ (self.FeedName, self.ItemName) ])
+        self.assertTrue(instance.title is None)
+        self.assertEqual([0, 1, 2], [ _i.id for _i in instance.item ])
+        self.assertEqual('n2', instance.item[2].name)
+
+    def testRoot (self):
+        instance = CreateFromDocument(MakeDocument(3), keep_elements=[ self.FeedName ])
+        self.assertEqual(3, len(instance.item))
+        self.assertEqual('end', instance.trailer)
+
+    def testSkippedContent (self):
+        # Content of skipped elements is not checked
+        xmld = '<feed xmlns="urn:stream"><title>t</title><item><name>n</name><extra/></item><trailer>e</trailer></feed>'.encode('utf-8')
+        instance = CreateFromDocument(xmld, keep_elements=[ self.TitleName, self.TrailerName ])
+        self.assertEqual('e', instance.trailer)
+        self.assertRaises(UnrecognizedContentError, CreateFromDocument, xmld)
+
+    def testContentModel (self):
+        # Skipped elements must still be permitted where they appear
+        xmld = '<feed xmlns="urn:stream"><item id="1"><name>n</name></item><title>t</title><trailer/></feed>'.encode('utf-8')
+        self.assertRaises(UnrecognizedContentError, CreateFromDocument, xmld, keep_elements=[ self.TitleName ])
+        self.assertRaises(IncompleteElementContentError, CreateFromDocument, MakeDocument(1, trailer=False), keep_elements=[ self.TitleName ])
+
+    def testNamespaces (self):
+        xmld = '<feed xmlns="urn:stream"><title>t</title><item xmlns:x="urn:x" id="1"><name xmlns="urn:other">n</name></item><trailer>e</trailer></feed>'.encode('utf-8')
+        instance = CreateFromDocument(xmld, keep_elements=[ self.TrailerName ])
+        self.assertEqual('e', instance.trailer)
+        self.assertTrue(instance.title is None)
+
+    def testIterParse (self):
+        ids = [ _i.id for _i in pyxb.binding.saxer.iterparse(MakeDocument(4), [ self.ItemName ], keep_elements=[ self.ItemName ]) ]
+        self.assertEqual(list(range(4)), ids)
+
+class TestCreateFromFile (unittest.TestCase):
+    def setUp (self):
+        (fd, self.path) = tempfile.mkstemp()
+        os.write(fd, MakeDocument(3))
+        os.close(fd)
+
+    def tearDown (self):
+        os.remove(self.path)
+
+    def testFile (self):
+        instance = CreateFromFile(self.path)
+        self.assertEqual(3, len(instance.item))
+        self.assertEqual(self.path, instance._location().locationBase)
+        self.assertEqual(self.path, instance.item[2]._location().locationBase)
+        instance = CreateFromFile(self.path, location_base='urn:doc')
+        self.assertEqual('urn:doc', instance._location().locationBase)
+
+    def testEmpty (self):
+        with open(self.path, 'wb') as f:
+            pass
+        self.assertRaises(xml.sax.SAXParseException, CreateFromFile, self.path)
+
+    def testStream (self):
+        stream = io.BytesIO(MakeDocument(2))
+        instance = CreateFromStream(stream, location_base='urn:stream')
+        self.assertEqual(2, len(instance.item))
+        self.assertEqual('urn:stream', instance.item[1]._location().locationBase)
+        with open(self.path, 'rb') as f:
+            instance = CreateFromStream(f, keep_elements=[ Namespace.createExpandedName('title') ])
+        self.assertEqual(0, len(instance.item))
+
+    def testDOMStyle (self):
+        xml_style = pyxb._XMLStyle
+        pyxb._SetXMLStyle(pyxb.XMLStyle_minidom)
+        try:
+            self.assertEqual(3, len(CreateFromFile(self.path).item))
+        finally:
+            pyxb._SetXMLStyle(xml_style)
+
+class TestExpatStyle (unittest.TestCase):
+    ItemName = Namespace.createExpandedName('item')
+
+    def setUp (self):
+        self.__xmlStyle = pyxb._XMLStyle
+        pyxb._SetXMLStyle(pyxb.XMLStyle_expat)
+
+    def tearDown (self):
+        pyxb._SetXMLStyle(self.__xmlStyle)
+
+    def testParserType (self):
+        self.assertTrue(isinstance(pyxb.binding.saxer.make_parser(), pyxb.utils.saxutils.ExpatParser))
+
+    def testCreateFromDocument (self):
+        instance = CreateFromDocument(MakeDocument(3))
+        self.assertEqual(3, len(instance.item))
+        self.assertEqual(1, instance.item[1].id)
+        self.assertEqual(1, instance._location().lineNumber)
+
+    def testLocation (self):
+        xmld = '<feed xmlns="urn:stream">\n<title>t</title>\n<item id="1">\n<name>n</name>\n</item>\n</feed>'.encode('utf-8')
+        try:
+            CreateFromDocument(xmld)
+            self.fail('Succeeded with missing trailer')
+        except IncompleteElementContentError as e:
+            self.assertEqual(1, e.instance._location().lineNumber)
+        instance = CreateFromDocument(xmld.replace(b'</item>', b'</item><trailer/>'))
+        self.assertEqual(3, instance.item[0]._location().lineNumber)
+
+    def testIterParse (self):
+        ids = [ _i.id for _i in pyxb.binding.saxer.iterparse(MakeDocument(4), [ self.ItemName ], chunk_size=10) ]
+        self.assertEqual(list(range(4)), ids)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import pyxb.binding.generate
+import pyxb.binding.datatypes as xs
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" targetNamespace="urn:trusted" elementFormDefault="qualified">
+  <xs:element name="doc">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="title" type="xs:string"/>
+        <xs:choice maxOccurs="unbounded">
+          <xs:element name="a" type="xs:int"/>
+          <xs:element name="b" type="xs:string"/>
+        </xs:choice>
+        <xs:any namespace="##other" processContents="lax" minOccurs="0"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+#open('code.py', 'w').write(code)
+
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+class TestTrustedContent (unittest.TestCase):
+    def setUp (self):
+        self.assertFalse(pyxb.GlobalValidationConfig.trustedContent)
+        pyxb.GlobalValidationConfig._setTrustedContent(True)
+
+    def tearDown (self):
+        pyxb.GlobalValidationConfig._setTrustedContent(False)
+
+    def testRoundTrip (self):
+        xmld = '<ns1:doc xmlns:ns1="urn:trusted" xmlns:ns2="urn:other"><ns1:title>t</ns1:title><ns1:a>1</ns1:a><ns1:b>x</ns1:b><ns1:a>2</ns1:a><ns2:w>w</ns2:w></ns1:doc>'
+        instance = CreateFromDocument(xmld)
+        self.assertEqual([1, 2], instance.a)
+        self.assertTrue(isinstance(instance.a[0], xs.int))
+        self.assertEqual(['title', 'a', 'b', 'a', None], [ (_c.elementDeclaration is not None) and _c.elementDeclaration.name().localName() or None for _c in instance.orderedContent() ])
+        self.assertEqual(1, len(instance.wildcardElements()))
+        self.assertEqual(xmld, instance.toxml('utf-8', root_only=True).decode('utf-8'))
+        self.assertTrue(instance.validateBinding())
+
+    def testInvalid (self):
+        # Order is not checked, and is preserved
+        xmld = '<ns1:doc xmlns:ns1="urn:trusted"><ns1:a>1</ns1:a><ns1:title>t</ns1:title></ns1:doc>'
+        instance = CreateFromDocument(xmld)
+        self.assertEqual([1], instance.a)
+        self.assertEqual('t', instance.title)
+        self.assertEqual(xmld, instance.toxml('utf-8', root_only=True).decode('utf-8'))
+        # Nor is completeness
+        instance = CreateFromDocument('<doc xmlns="urn:trusted"><a>1</a></doc>')
+        self.assertRaises(pyxb.ValidationError, instance.validateBinding)
+        pyxb.GlobalValidationConfig._setTrustedContent(False)
+        self.assertRaises(UnrecognizedContentError, CreateFromDocument, xmld)
+
+    def testModified (self):
+        # Values assigned after conversion are not in the ordered content,
+        # so the document is generated from the element values
+        xmld = '<ns1:doc xmlns:ns1="urn:trusted"><ns1:title>t</ns1:title><ns1:a>1</ns1:a><ns1:b>x</ns1:b></ns1:doc>'
+        instance = CreateFromDocument(xmld)
+        instance.a = [ 2 ]
+        self.assertEqual('<ns1:doc xmlns:ns1="urn:trusted"><ns1:title>t</ns1:title><ns1:a>2</ns1:a><ns1:b>x</ns1:b></ns1:doc>', instance.toxml('utf-8', root_only=True).decode('utf-8'))
+        instance = CreateFromDocument(xmld)
+        instance.b.append('y')
+        self.assertEqual('<ns1:doc xmlns:ns1="urn:trusted"><ns1:title>t</ns1:title><ns1:a>1</ns1:a><ns1:b>x</ns1:b><ns1:b>y</ns1:b></ns1:doc>', instance.toxml('utf-8', root_only=True).decode('utf-8'))
+        instance = CreateFromDocument(xmld)
+        instance.title = 'u'
+        self.assertEqual('<ns1:doc xmlns:ns1="urn:trusted"><ns1:title>u</ns1:title><ns1:a>1</ns1:a><ns1:b>x</ns1:b></ns1:doc>', instance.toxml('utf-8', root_only=True).decode('utf-8'))
+
+    def testAppend (self):
+        # Values appended in Python are placed by the content model
+        instance = CreateFromDocument('<ns1:doc xmlns:ns1="urn:trusted"><ns1:title>t</ns1:title><ns1:a>1</ns1:a></ns1:doc>')
+        instance.append(xs.int(5))
+        instance.append(7)
+        instance.append('y')
+        self.assertEqual([1, 5, 7], instance.a)
+        self.assertEqual(['y'], instance.b)
+        self.assertEqual(0, len(instance.wildcardElements()))
+        self.assertEqual('<ns1:doc xmlns:ns1="urn:trusted"><ns1:title>t</ns1:title><ns1:a>1</ns1:a><ns1:a>5</ns1:a><ns1:a>7</ns1:a><ns1:b>y</ns1:b></ns1:doc>', instance.toxml('utf-8', root_only=True).decode('utf-8'))
+        # Trusted content that violates the content model is diagnosed
+        instance = CreateFromDocument('<ns1:doc xmlns:ns1="urn:trusted"><ns1:a>1</ns1:a><ns1:title>t</ns1:title></ns1:doc>')
+        self.assertRaises(UnrecognizedContentError, instance.append, 7)
+
+    def testInvalidType (self):
+        # Values are still converted to their element types
+        self.assertRaises(pyxb.SimpleTypeValueError, CreateFromDocument, '<doc xmlns="urn:trusted"><title>t</title><a>one</a></doc>')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import pyxb.binding.generate
+import pyxb.utils.domutils
+from xml.dom import Node
+
+import os.path
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:element name="root">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="first" type="xs:string"/>
+        <xs:choice maxOccurs="unbounded">
+          <xs:element name="a" type="xs:int"/>
+          <xs:element name="b" type="xs:int"/>
+        </xs:choice>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+class TestValidatedChildren (unittest.TestCase):
+    def setUp (self):
+        self.instance = CreateFromDocument('<root><first>f</first><a>1</a><b>2</b><a>3</a></root>')
+
+    def values (self):
+        return [ _c.value for _c in self.instance._validatedChildren() ]
+
+    def testReuse (self):
+        order = self.instance._validatedChildren()
+        # Without guidance from the content, a elements precede b elements
+        self.assertEqual(['f', 1, 3, 2], [ _c.value for _c in order ])
+        self.assertTrue(order is self.instance._validatedChildren())
+        self.assertEqual(self.instance.toxml('utf-8', root_only=True), self.instance.toxml('utf-8', root_only=True))
+
+    def testPluralMutation (self):
+        order = self.instance._validatedChildren()
+        self.instance.a[1] = 4
+        self.assertFalse(order is self.instance._validatedChildren())
+        self.assertEqual(['f', 1, 4, 2], self.values())
+        del self.instance.a[0]
+        self.assertEqual(['f', 4, 2], self.values())
+
+    def testAssignment (self):
+        self.values()
+        self.instance.first = 'g'
+        self.assertEqual(['g', 1, 3, 2], self.values())
+        self.instance.b = [5, 6]
+        self.assertEqual(['g', 1, 3, 5, 6], self.values())
+        # A plain list has no mutation count
+        self.instance.b[0] = 7
+        self.assertEqual(['g', 1, 3, 7, 6], self.values())
+        self.instance.first = None
+        self.assertRaises(pyxb.IncompleteElementContentError, self.instance._validatedChildren)
+
+    def testOrderedContent (self):
+        vc = self.instance._validationConfig
+        self.assertEqual(vc.MIXED_ONLY, vc.contentInfluencesGeneration)
+        self.assertEqual(['f', 1, 3, 2], self.values())
+        vc = vc.copy()
+        self.instance._setValidationConfig(vc)
+        vc._setContentInfluencesGeneration(vc.ALWAYS)
+        self.assertEqual(['f', 1, 2, 3], self.values())
+        # Reordering the content in place affects the preferred order
+        content = self.instance.orderedContent()
+        (content[1], content[2]) = (content[2], content[1])
+        self.assertEqual(['f', 2, 1, 3], self.values())
+        vc._setContentInfluencesGeneration(vc.NEVER)
+        self.assertEqual(['f', 1, 3, 2], self.values())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# Compare the time to create instances of the XML Schema builtin datatypes
+# from their lexical representation using the general Factory method and
+# using _FromLexical, which is what the SAX parser and attribute handling
+# use.  Types for which _FromLexical defers to Factory show no difference.
+#
+# Usage: python bench-lexical.py [num_values [num_reps]]
+from __future__ import print_function
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import sys
+import time
+import pyxb.binding.datatypes as xs
+from pyxb.utils import six
+from pyxb.utils.six.moves import xrange
+
+# A representative lexical value for each builtin datatype
+samples = {
+    xs.anyURI : 'http://www.example.com/path',
+    xs.base64Binary : 'aGVsbG8gd29ybGQ=',
+    xs.boolean : 'true',
+    xs.byte : '-12',
+    xs.date : '2013-06-01',
+    xs.dateTime : '2013-06-01T12:34:56Z',
+    xs.decimal : '123.45',
+    xs.double : '1.5e3',
+    xs.duration : 'P1DT2H',
+    xs.ENTITY : 'entity',
+    xs.float : '2.5',
+    xs.gDay : '---15',
+    xs.gMonth : '--06',
+    xs.gMonthDay : '--06-15',
+    xs.gYear : '2013',
+    xs.gYearMonth : '2013-06',
+    xs.hexBinary : 'DEADBEEF',
+    xs.ID : 'id1',
+    xs.IDREF : 'id1',
+    xs.int : '123456',
+    xs.integer : '1234567890123',
+    xs.language : 'en-US',
+    xs.long : '-9876543210',
+    xs.Name : 'name',
+    xs.NCName : 'ncname',
+    xs.negativeInteger : '-7',
+    xs.NMTOKEN : 'token',
+    xs.nonNegativeInteger : '7',
+    xs.nonPositiveInteger : '-7',
+    xs.normalizedString : ' some text ',
+    xs.positiveInteger : '7',
+    xs.short : '-1234',
+    xs.string : 'some text',
+    xs.time : '12:34:56',
+    xs.token : '  some   text  ',
+    xs.unsignedByte : '200',
+    xs.unsignedInt : '4000000000',
+    xs.unsignedLong : '18000000000000000000',
+    xs.unsignedShort : '60000',
+}
+
+def Factory (cls, text):
+    return cls.Factory(text, _from_xml=True)
+
+def FromLexical (cls, text):
+    return cls._FromLexical(text)
+
+def Best (fn, cls, text):
+    best = None
+    for _ in xrange(num_reps):
+        t0 = time.time()
+        for _ in xrange(num_values):
+            fn(cls, text)
+        dt = time.time() - t0
+        if (best is None) or (dt < best):
+            best = dt
+    return best
+
+num_values = 10000
+num_reps = 5
+if 1 < len(sys.argv):
+    num_values = int(sys.argv[1])
+if 2 < len(sys.argv):
+    num_reps = int(sys.argv[2])
+
+print('%d values per type, best of %d; times in usec per value' % (num_values, num_reps))
+totals = [0.0, 0.0]
+for cls in sorted(samples, key=lambda _c: _c.__name__):
+    text = six.text_type(samples[cls])
+    assert Factory(cls, text) == FromLexical(cls, text)
+    f_dt = Best(Factory, cls, text)
+    l_dt = Best(FromLexical, cls, text)
+    totals[0] += f_dt
+    totals[1] += l_dt
+    print('%-20s Factory %6.2f  _FromLexical %6.2f  speedup %.2f' % (cls.__name__, 1e6 * f_dt / num_values, 1e6 * l_dt / num_values, f_dt / l_dt))
+print('%-20s Factory %6.2f  _FromLexical %6.2f  speedup %.2f' % ('total', 1e6 * totals[0] / num_values, 1e6 * totals[1] / num_values, totals[0] / totals[1]))
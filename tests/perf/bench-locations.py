@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# Measure the time and memory saved by disabling location tracking while
+# converting a document to bindings.  Memory is measured with tracemalloc,
+# which is only available in Python 3.4 and later, as the size of the
+# bindings retained after the parse completes.
+#
+# Usage: python bench-locations.py [num_records [num_reps]]
+from __future__ import print_function
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import gc
+import sys
+import time
+import pyxb.binding.generate
+from pyxb.utils.six.moves import xrange
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+xsd = '''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" targetNamespace="urn:bench" xmlns:tns="urn:bench" elementFormDefault="qualified">
+  <xs:complexType name="tRecord">
+    <xs:sequence>
+      <xs:element name="name" type="xs:string"/>
+      <xs:element name="count" type="xs:int"/>
+      <xs:element name="note" type="xs:string" minOccurs="0" maxOccurs="unbounded"/>
+    </xs:sequence>
+    <xs:attribute name="id" type="xs:ID" use="required"/>
+  </xs:complexType>
+  <xs:element name="records">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="record" type="tns:tRecord" maxOccurs="unbounded"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+# Each record contributes five elements
+def MakeDocument (num_records):
+    records = []
+    for i in xrange(num_records):
+        records.append('<record id="r%d"><name>Name %d</name><count>%d</count><note>a</note><note>b</note></record>' % (i, i, i))
+    return ('<records xmlns="urn:bench">%s</records>' % (''.join(records),)).encode('utf-8')
+
+def Retained (xmld, track_locations):
+    gc.collect()
+    tracemalloc.start()
+    instance = CreateFromDocument(xmld, track_locations=track_locations)
+    gc.collect()
+    (current, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert num_records == len(instance.record)
+    return (current, peak)
+
+def Best (xmld):
+    best = { True: None, False: None }
+    for _ in xrange(num_reps):
+        for track_locations in best:
+            t0 = time.time()
+            CreateFromDocument(xmld, track_locations=track_locations)
+            dt = time.time() - t0
+            if (best[track_locations] is None) or (dt < best[track_locations]):
+                best[track_locations] = dt
+    return (best[True], best[False])
+
+num_records = 2000
+num_reps = 5
+if 1 < len(sys.argv):
+    num_records = int(sys.argv[1])
+if 2 < len(sys.argv):
+    num_reps = int(sys.argv[2])
+
+xmld = MakeDocument(num_records)
+num_nodes = 1 + 5 * num_records
+print('%d records, %d elements, %d bytes, best of %d' % (num_records, num_nodes, len(xmld), num_reps))
+(on_dt, off_dt) = Best(xmld)
+print('time        tracked %.3f sec, untracked %.3f sec, speedup %.2f' % (on_dt, off_dt, on_dt / off_dt))
+if tracemalloc is None:
+    print('memory      tracemalloc not available')
+else:
+    (on_cur, on_peak) = Retained(xmld, True)
+    (off_cur, off_peak) = Retained(xmld, False)
+    print('retained    tracked %d bytes, untracked %d bytes, %.1f bytes per element' % (on_cur, off_cur, float(on_cur - off_cur) / num_nodes))
+    print('peak        tracked %d bytes, untracked %d bytes, %.1f bytes per element' % (on_peak, off_peak, float(on_peak - off_peak) / num_nodes))
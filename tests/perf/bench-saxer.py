@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+# Compare the time to convert a document to bindings using the xml.sax
+# expatreader adapter and using pyxb.utils.saxutils.ExpatParser.  The
+# cost of the adapter layer alone is measured with a handler that does
+# nothing.
+#
+# Usage: python bench-saxer.py [num_records [num_reps]]
+from __future__ import print_function
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import io
+import sys
+import time
+import pyxb.binding.generate
+import pyxb.binding.saxer
+import pyxb.utils.saxutils
+from pyxb.utils.six.moves import xrange
+
+xsd = '''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" targetNamespace="urn:bench" xmlns:tns="urn:bench" elementFormDefault="qualified">
+  <xs:complexType name="tRecord">
+    <xs:sequence>
+      <xs:element name="name" type="xs:string"/>
+      <xs:element name="count" type="xs:int"/>
+      <xs:element name="when" type="xs:dateTime" minOccurs="0"/>
+      <xs:element name="note" type="xs:string" minOccurs="0" maxOccurs="unbounded"/>
+    </xs:sequence>
+    <xs:attribute name="id" type="xs:ID" use="required"/>
+    <xs:attribute name="kind" type="xs:token"/>
+    <xs:attribute name="score" type="xs:decimal"/>
+  </xs:complexType>
+  <xs:element name="records">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="record" type="tns:tRecord" maxOccurs="unbounded"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+def MakeDocument (num_records):
+    records = []
+    for i in xrange(num_records):
+        records.append('<record id="r%d" kind="k%d" score="%d.5"><name>Name %d</name><count>%d</count><when>2013-06-%02dT12:00:00Z</when><note>a</note><note>b</note></record>' % (i, i % 7, i, i, i, 1 + (i % 28)))
+    return ('<records xmlns="urn:bench">%s</records>' % (''.join(records),)).encode('utf-8')
+
+def Parse (xmld, use_expat):
+    saxer = pyxb.binding.saxer.make_parser(fallback_namespace=Namespace.fallbackNamespace(), use_expat=use_expat)
+    handler = saxer.getContentHandler()
+    saxer.parse(io.BytesIO(xmld))
+    instance = handler.rootObject()
+    assert num_records == len(instance.record)
+
+def Scan (xmld, use_expat):
+    saxer = pyxb.utils.saxutils.make_parser(content_handler=pyxb.utils.saxutils._NoopSAXHandler(), use_expat=use_expat)
+    saxer.parse(io.BytesIO(xmld))
+
+def Best (fn, xmld):
+    # Alternate the backends so both see the same system conditions
+    best = { False: None, True: None }
+    for _ in xrange(num_reps):
+        for use_expat in best:
+            t0 = time.time()
+            fn(xmld, use_expat)
+            dt = time.time() - t0
+            if (best[use_expat] is None) or (dt < best[use_expat]):
+                best[use_expat] = dt
+    return (best[False], best[True])
+
+num_records = 2000
+num_reps = 5
+if 1 < len(sys.argv):
+    num_records = int(sys.argv[1])
+if 2 < len(sys.argv):
+    num_reps = int(sys.argv[2])
+
+xmld = MakeDocument(num_records)
+print('%d records, %d bytes, best of %d' % (num_records, len(xmld), num_reps))
+for (what, fn) in ( ('adapter only', Scan), ('bindings', Parse) ):
+    (sax_dt, expat_dt) = Best(fn, xmld)
+    print('%-12s xml.sax %.3f sec, pyexpat %.3f sec, speedup %.2f' % (what, sax_dt, expat_dt, sax_dt / expat_dt))
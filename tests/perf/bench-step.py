@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# Measure the cost of content model transitions for a sequence-heavy
+# schema, in which every step is deterministic.  Transitions are measured
+# alone by driving the automaton directly, and as part of converting a
+# document and of appending values to bindings in Python.
+#
+# Usage: python bench-step.py [num_records [num_reps]]
+from __future__ import print_function
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import sys
+import time
+import pyxb.binding.generate
+import pyxb.binding.content
+from pyxb.utils.six.moves import xrange
+
+num_fields = 12
+
+fields = '\n'.join([ '        <xs:element name="f%d" type="xs:int"/>' % (_i,) for _i in xrange(num_fields) ])
+xsd = '''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" targetNamespace="urn:bench" xmlns:tns="urn:bench" elementFormDefault="qualified">
+  <xs:complexType name="tRecord">
+    <xs:sequence>
+%s
+      <xs:element name="note" type="xs:string" minOccurs="0" maxOccurs="3"/>
+    </xs:sequence>
+  </xs:complexType>
+  <xs:element name="records">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="record" type="tns:tRecord" maxOccurs="unbounded"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>''' % (fields,)
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+def MakeDocument (num_records):
+    record = '<record>%s<note>a</note><note>b</note></record>' % (''.join([ '<f%d>%d</f%d>' % (_i, _i, _i) for _i in xrange(num_fields) ]),)
+    return ('<records xmlns="urn:bench">%s</records>' % (record * num_records,)).encode('utf-8')
+
+def Steps (num_records):
+    decls = [ tRecord._UseForTag(Namespace.createExpandedName('f%d' % (_i,))) for _i in xrange(num_fields) ]
+    instance = tRecord()
+    for _ in xrange(num_records):
+        cfg = pyxb.binding.content.AutomatonConfiguration(instance)
+        cfg.reset()
+        for ed in decls:
+            assert 1 == cfg.step(None, ed, detach=True)
+        assert cfg.isAccepting()
+
+def Parse (xmld):
+    CreateFromDocument(xmld)
+
+def Append (num_records):
+    instance = records()
+    for _ in xrange(num_records):
+        record = tRecord()
+        for i in xrange(num_fields):
+            record.append(i, _fallback_namespace=Namespace)
+        instance.append(record)
+    instance.validateBinding()
+
+def Best (fn, *args):
+    best = None
+    for _ in xrange(num_reps):
+        t0 = time.time()
+        fn(*args)
+        dt = time.time() - t0
+        if (best is None) or (dt < best):
+            best = dt
+    return best
+
+num_records = 1000
+num_reps = 5
+if 1 < len(sys.argv):
+    num_records = int(sys.argv[1])
+if 2 < len(sys.argv):
+    num_reps = int(sys.argv[2])
+
+xmld = MakeDocument(num_records)
+num_steps = num_records * num_fields
+print('%d records, best of %d' % (num_records, num_reps))
+dt = Best(Steps, num_records)
+print('automaton   %.3f sec, %.1f usec per transition' % (dt, 1e6 * dt / num_steps))
+num_steps = num_records * (1 + num_fields + 2)
+dt = Best(Parse, xmld)
+print('document    %.3f sec, %.1f usec per transition' % (dt, 1e6 * dt / num_steps))
+num_steps = num_records * (1 + num_fields)
+dt = Best(Append, num_records)
+print('append      %.3f sec, %.1f usec per transition' % (dt, 1e6 * dt / num_steps))
@@ -46,16 +46,18 @@ class TestTrac_0172 (unittest.TestCase):
         self.assertEqual(1, cfg.nondeterminismCount())
         # There are two ways to re-enter a: loop within a, or exit the
         # choice and re-enter.  Same destination, same element
-        # declaration, two update instruction sets.
+        # declaration, two update instruction sets.  The counter values
+        # differ only beyond the point where they affect acceptance, so
+        # the paths are equivalent and only the preferred one is kept.
         cfg.step('a', a_ed)
-        self.assertEqual(2, cfg.nondeterminismCount())
-        # But there's a problem here, which is now trac/173
-        cfg.step('a', a_ed)
-        self.assertEqual(4, cfg.nondeterminismCount())
-        self.assertTrue(4 < cfg.PermittedNondeterminism)
+        self.assertEqual(1, cfg.nondeterminismCount())
+        # Before equivalent paths were merged this doubled with each
+        # step (trac/173)
         cfg.PermittedNondeterminism = 4
-        with self.assertRaises(pyxb.ContentNondeterminismExceededError) as cm:
+        for _ in range(50):
             cfg.step('a', a_ed)
+        self.assertEqual(1, cfg.nondeterminismCount())
+        self.assertTrue(cfg.isAccepting())
 
 if __name__ == '__main__':
     unittest.main()
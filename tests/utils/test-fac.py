@@ -4,6 +4,22 @@ from pyxb.utils.fac import *
 from pyxb.utils import six
 from pyxb.utils.six.moves import xrange
 
+class KeyedSymbol (SymbolMatch_mixin):
+    def __init__ (self, key, matches):
+        self.key = key
+        self.matches = matches
+
+    def match (self, symbol):
+        self.matches.append(self.key)
+        return self.key in (None, symbol)
+
+    def indexKey (self):
+        return self.key
+
+    @classmethod
+    def SymbolIndexKey (cls, symbol):
+        return symbol
+
 class TestFAC (unittest.TestCase):
     a = Symbol('a')
     b = Symbol('b')
@@ -128,6 +144,26 @@ class TestFAC (unittest.TestCase):
         else:
             self.assertRaises(UpdateApplicationError, ui.apply, values)
 
+    def testCounterIndex (self):
+        cc = CounterCondition(0, 1)
+        self.assertTrue(cc.index is None)
+        cc2 = CounterCondition(2, 5)
+        Automaton([], [cc, cc2], True)
+        self.assertEqual([0, 1], sorted([cc.index, cc2.index]))
+        ui = UpdateInstruction(cc2, False)
+        values = [ 1, 1 ]
+        self.assertFalse(ui.satisfiedBy(values))
+        values[cc2.index] = 3
+        self.assertTrue(ui.satisfiedBy(values))
+        ui.apply(values)
+        self.assertEqual(1, values[cc2])
+        cfg = Configuration(self.ex.buildAutomaton())
+        for c in 'aabc':
+            cfg.step(c)
+        clone = cfg.clone()
+        clone.step('a')
+        self.assertNotEqual(cfg._get_counterValues(), clone._get_counterValues())
+
     def testInternals (self):
         #print self.ex.facToString()
         au = self.ex.buildAutomaton()
@@ -427,5 +463,112 @@ class TestFAC (unittest.TestCase):
         cfg = cfg.step('s')
         self.assertEqual(1, len(cfg.candidateTransitions('s')))
 
+    def testCompiledTransitions (self):
+        au = self.ex.buildAutomaton()
+        self.assertEqual(au.initialTransitions, [ _c[0] for _c in au._compiledTransitions(None)[0] ])
+        for st in au.states:
+            self.assertEqual(st.transitionSet, [ _c[0] for _c in au._compiledTransitions(st)[0] ])
+        # (a{2}|bc){3,5} checked through the compiled tables
+        cfg = Configuration(au)
+        for (word, accepting) in (('aabcaa', True), ('bcbcbcbcbc', True), ('aabc', False)):
+            cfg.reset()
+            for c in word:
+                cfg.step(c)
+            self.assertEqual(accepting, cfg.isAccepting())
+        cfg.reset()
+        for c in 'bcbcbcbcbc':
+            cfg.step(c)
+        # A sixth repetition exceeds the counter limit
+        self.assertEqual([], cfg.candidateTransitions('b'))
+        self.assertRaises(UnrecognizedSymbolError, cfg.step, 'a')
+
+    def testIndexedTransitions (self):
+        matches = []
+        # (a|b|c|d|*)+ where * matches anything
+        ex = NumericalConstraint(Choice(*[ Symbol(KeyedSymbol(_k, matches)) for _k in ('a', 'b', 'c', 'd', None) ]), 1, None)
+        au = ex.buildAutomaton()
+        cfg = Configuration(au)
+        xits = cfg.candidateTransitions('c')
+        self.assertEqual(2, len(xits))
+        self.assertEqual(['c', None], matches)
+        cfg = xits[0].apply(cfg)
+        del matches[:]
+        self.assertEqual(2, len(cfg.candidateTransitions('b')))
+        self.assertEqual(['b', None], matches)
+        del matches[:]
+        self.assertEqual(1, len(cfg.candidateTransitions('x')))
+        self.assertEqual([None], matches)
+        self.assertEqual(5, len(cfg.candidateTransitions()))
+
+    def testTransitionCache (self):
+        matches = []
+        # (a{0,2}b)+
+        ex = NumericalConstraint(Sequence(NumericalConstraint(Symbol(KeyedSymbol('a', matches)), 0, 2), Symbol(KeyedSymbol('b', matches))), 1, None)
+        au = ex.buildAutomaton()
+        cache = CandidateTransitionCache
+        cache.clear()
+        cache.setLimit(16)
+        try:
+            cfg = Configuration(au)
+            for c in 'ab' * 20:
+                cfg.step(c)
+            self.assertTrue(cfg.isAccepting())
+            self.assertEqual(40, cache.hits() + cache.misses())
+            # Initial a, b after a, and a after b; counter values merge
+            self.assertEqual(3, cache.misses())
+            self.assertEqual(3, len(matches))
+            # Repeating a after a depends on its counter
+            cfg.step('a')
+            cfg.step('a')
+            self.assertEqual([], cfg.candidateTransitions('a'))
+            self.assertEqual(5, cache.size())
+            cache.setLimit(4)
+            self.assertEqual(0, cache.size())
+            for c in 'ba' * 4:
+                cfg.step(c)
+                self.assertTrue(cache.size() <= 4)
+        finally:
+            cache.setLimit(0)
+            cache.clear()
+
+    def testSignature (self):
+        # a{2,3}
+        cfg = Configuration(NumericalConstraint(Symbol('a'), 2, 3).buildAutomaton())
+        cfg.step('a')
+        cfg2 = cfg.clone()
+        self.assertEqual(cfg.signature(), cfg2.signature())
+        cfg.step('a')
+        self.assertNotEqual(cfg.signature(), cfg2.signature())
+        # (a*)*: after aa, either repeat the inner term or restart it.  The
+        # counters differ but have no upper bound or minimum.
+        cfg = Configuration(NumericalConstraint(NumericalConstraint(Symbol('a'), 0, None, metadata='inner'), 0, None, metadata='outer').buildAutomaton())
+        cfg.step('a')
+        xits = cfg.candidateTransitions('a')
+        self.assertEqual(2, len(xits))
+        (cfg1, cfg2) = [ _x.apply(cfg.clone()) for _x in xits ]
+        self.assertNotEqual(cfg1._get_counterValues(), cfg2._get_counterValues())
+        self.assertEqual(cfg1.signature(), cfg2.signature())
+        # Configurations in sub-automata include their layer
+        ex = Sequence(Symbol('s'), All(Symbol('a'), Symbol('b')))
+        cfg = Configuration(ex.buildAutomaton())
+        cfg.step('s')
+        sub = cfg.step('a')
+        self.assertNotEqual(cfg.signature(), sub.signature())
+        self.assertEqual(sub.signature(), sub.clone().signature())
+
+    def testUncompiledTransitions (self):
+        # Automata that require layer changes use the general engine
+        ex = Sequence(Symbol('s'), All(Symbol('a'), Symbol('b')))
+        au = ex.buildAutomaton()
+        self.assertTrue(au._compiledTransitions(None) is None)
+        for st in au.states:
+            if st.subAutomata is not None:
+                for sa in st.subAutomata:
+                    self.assertTrue(sa._compiledTransitions(None) is None)
+        cfg = Configuration(au)
+        for c in 'sba':
+            cfg = cfg.step(c)
+        self.assertTrue(cfg.isAccepting())
+
 if __name__ == '__main__':
     unittest.main()
@@ -7,6 +7,9 @@ import unittest
 from pyxb.utils.saxutils import *
 from xml.dom import Node
 import xml.dom
+import xml.sax
+import xml.sax.handler
+import io
 import pyxb.namespace
 
 class TestState (SAXElementState):
@@ -119,5 +122,118 @@ class TestInScopeNames (unittest.TestCase):
         self.assertEqual('brandName', brandName.expandedName().localName())
         self.assertEqual(0, len(xmlns_map))
 
+    def testSharedPrefixMaps (self):
+        xmld = '''<env xmlns="urn:env" xmlns:b="urn:ISBN:0-395-36341-6">
+  <hdr xmlns="urn:env" xmlns:b="urn:ISBN:0-395-36341-6"><b:n/></hdr>
+  <body xmlns:b="urn:loc.gov:books"><b:n/></body>
+  <tail/>
+</env>'''.encode('utf-8')
+        saxer = make_parser(element_state_constructor=TestState, location_base='testSharedPrefixMaps', fallback_namespace=BogusNamespace)
+        saxer.parse(io.BytesIO(xmld))
+        (env, hdr, hdr_n, body, body_n, tail) = [ _s.namespaceContext() for _s in TestState.StateSequence[1:] ]
+        # Redeclaring the bindings in scope does not copy the maps
+        self.assertTrue(env.inScopeNamespaces() is hdr.inScopeNamespaces())
+        self.assertTrue(hdr.inScopeNamespaces() is hdr_n.inScopeNamespaces())
+        self.assertEqual(isbn_ns, hdr_n.inScopeNamespaces().get('b'))
+        # Changing a binding does, without affecting the enclosing scope
+        self.assertFalse(env.inScopeNamespaces() is body.inScopeNamespaces())
+        self.assertEqual(books_ns, body_n.inScopeNamespaces().get('b'))
+        self.assertEqual('b', body.prefixForNamespace(books_ns))
+        self.assertTrue(body.prefixForNamespace(isbn_ns) is None)
+        self.assertEqual(isbn_ns, tail.inScopeNamespaces().get('b'))
+        self.assertEqual('b', tail.prefixForNamespace(isbn_ns))
+        self.assertTrue(tail.prefixForNamespace(books_ns) is None)
+
+    def testParentModifiedLater (self):
+        parent = pyxb.namespace.NamespaceContext()
+        parent.processXMLNS('b', isbn_ns.uri())
+        child = pyxb.namespace.NamespaceContext(parent_context=parent)
+        self.assertTrue(parent.inScopeNamespaces() is child.inScopeNamespaces())
+        parent.processXMLNS('b', books_ns.uri())
+        self.assertEqual(books_ns, parent.inScopeNamespaces().get('b'))
+        self.assertEqual(isbn_ns, child.inScopeNamespaces().get('b'))
+        self.assertEqual('b', child.prefixForNamespace(isbn_ns))
+
+class RecordingHandler (xml.sax.handler.ContentHandler):
+    def __init__ (self):
+        xml.sax.handler.ContentHandler.__init__(self)
+        self.events = []
+
+    def setDocumentLocator (self, locator):
+        self.locator = locator
+
+    def __text (self, content):
+        if self.events and ('text' == self.events[-1][0]):
+            self.events[-1] = ('text', self.events[-1][1] + content)
+        else:
+            self.events.append(('text', content))
+
+    def startDocument (self):
+        self.events.append(('startDocument',))
+
+    def endDocument (self):
+        self.events.append(('endDocument',))
+
+    def startPrefixMapping (self, prefix, uri):
+        self.events.append(('prefix', prefix, uri))
+
+    def startElementNS (self, name, qname, attrs):
+        self.events.append(('start', name, self.locator.getLineNumber(), sorted([ (_n, attrs.getValue(_n)) for _n in attrs.getNames() ], key=str)))
+
+    def endElementNS (self, name, qname):
+        self.events.append(('end', name, self.locator.getLineNumber()))
+
+    def characters (self, content):
+        self.__text(content)
+
+    def processingInstruction (self, target, data):
+        self.events.append(('pi', target, data))
+
+class TestExpatParser (unittest.TestCase):
+    xmld = '''<?xml version="1.0"?>
+<book xmlns='urn:loc.gov:books' xmlns:isbn='urn:ISBN:0-395-36341-6' isbn:id='x' lang="en">
+    <title>Cheaper &amp; by the Dozen</title>
+    <?pi data?>
+    <isbn:number><![CDATA[15684]]>91379</isbn:number>
+    <notes xmlns=''><p a="1" b='2'>text</p></notes>
+</book>'''.encode('utf-8')
+
+    def events (self, use_expat):
+        handler = RecordingHandler()
+        saxer = make_parser(content_handler=handler, use_expat=use_expat)
+        saxer.parse(io.BytesIO(self.xmld))
+        return handler.events
+
+    def testType (self):
+        self.assertTrue(isinstance(make_parser(use_expat=True), ExpatParser))
+        self.assertFalse(isinstance(make_parser(use_expat=False), ExpatParser))
+
+    def testEvents (self):
+        self.assertEqual(self.events(False), self.events(True))
+
+    def testFeed (self):
+        handler = RecordingHandler()
+        saxer = make_parser(content_handler=handler, use_expat=True)
+        for i in range(0, len(self.xmld), 5):
+            saxer.feed(self.xmld[i:i+5])
+        saxer.close()
+        self.assertEqual(self.events(False), handler.events)
+
+    def testFeedAgain (self):
+        handler = RecordingHandler()
+        saxer = make_parser(content_handler=handler, use_expat=True)
+        for n in range(2):
+            handler.events = []
+            saxer.feed(self.xmld)
+            saxer.close()
+            self.assertEqual(self.events(False), handler.events)
+        handler.events = []
+        saxer.parse(io.BytesIO(self.xmld))
+        self.assertEqual(self.events(False), handler.events)
+
+    def testError (self):
+        saxer = make_parser(use_expat=True)
+        self.assertRaises(xml.sax.SAXParseException, saxer.parse, io.BytesIO(b'<a><b></a>'))
+
 if '__main__' == __name__:
     unittest.main()
@@ -178,10 +178,13 @@ class TestXMLRE (unittest.TestCase):
         self.assertEqual(charset, expected)
 
     def testXMLToPython (self):
-        self.assertEqual(r'^(123)$', xmlre.XMLToPython('123'))
+        self.assertEqual(r'^(?:123)$', xmlre.XMLToPython('123'))
         # Note that single-char escapes in the expression are
         # converted to character classes.
-        self.assertEqual(r'^(Why[ ]not[?])$', xmlre.XMLToPython(r'Why[ ]not\?'))
+        self.assertEqual(r'^(?:Why[ ]not[?])$', xmlre.XMLToPython(r'Why[ ]not\?'))
+        # Groups do not capture
+        self.assertEqual(r'^(?:(?:ab)+[(])$', xmlre.XMLToPython(r'(ab)+\('))
+        self.assertEqual(0, re.compile(xmlre.XMLToPython(r'(a(b))|c')).groups)
 
     def testRegularExpressions (self):
         text = '[\i-[:]][\c-[:]]*'
@@ -473,5 +476,12 @@ class TestXMLRE (unittest.TestCase):
         self.assertNoMatch("[0-9]{3}|", "12");
         self.assertNoMatch("[0-9]{3}|", "1234");
 
+    def testTranslationCached(self):
+        pattern = "[\\p{L}\\p{Nd}]+cached"
+        self.assertFalse(pattern in xmlre._TranslationCache)
+        expr = xmlre.XMLToPython(pattern)
+        self.assertTrue(expr is xmlre._TranslationCache[pattern])
+        self.assertTrue(expr is xmlre.XMLToPython(pattern))
+
 if __name__ == '__main__':
     unittest.main()